@@ -0,0 +1,585 @@
+#!/usr/bin/env python3
+"""
+Diff Analyzer - Streams uncommitted changes into a compact atomic-commit plan
+
+Reads `git diff --cached` and `git diff` line by line, keeping only per-file
+counters (never the diff text), so memory stays bounded no matter how large
+the change set is. Files are then grouped into candidate atomic commits using
+the rules in references/atomic-commit-principles.md:
+
+  - source files are grouped by module; tests join the module they test
+  - docs, CI and build/dependency files get their own groups
+  - files whose every hunk only re-indents or reorders lines form one style group
+  - pure renames (no content change) form one refactor group
+  - groups are ordered: build/config -> shared code -> features -> tests -> docs -> style
+
+The plan is a starting point for Step 2, not a replacement for reading the code.
+
+Usage:
+    analyze_diff.py [--repo <dir>] [--staged | --unstaged] [--no-untracked]
+                    [--stdin] [--summary] [--max-sections <n>] [--output <file>]
+
+Options:
+    --repo <dir>         Repository to analyze (default: current directory)
+    --staged             Only staged changes (git diff --cached)
+    --unstaged           Only unstaged changes (git diff), plus untracked files
+    --no-untracked       Ignore untracked files
+    --stdin              Parse a unified diff from stdin instead of running git
+    --summary            Omit the per-file list; print groups and totals only
+    --max-sections <n>   Hunk headers kept per file (default: 3)
+    --output <file>      Write the JSON plan to a file instead of stdout
+
+Examples:
+    analyze_diff.py
+    analyze_diff.py --repo ../service --staged --summary
+    git diff main...feature | analyze_diff.py --stdin
+"""
+
+import codecs
+import json
+import re
+import subprocess
+import sys
+import tempfile
+import zlib
+from pathlib import PurePosixPath
+
+_CHUNK = 64 * 1024  # Longest slice of a single diff line held in memory
+_HUNK_RE = re.compile(rb'^@@ -\d+(?:,(\d+))? \+\d+(?:,(\d+))? @@ ?(.*)')
+_MASK = (1 << 64) - 1
+
+# Directories that hold modules rather than name one
+_CONTAINER_DIRS = {
+    'src', 'lib', 'app', 'apps', 'pkg', 'packages', 'internal', 'cmd', 'modules',
+    'services', 'plugins', 'skills', 'components', 'main', 'java', 'python',
+    'scripts', 'tests', 'test', 'spec', 'specs', '__tests__', 'testing',
+}
+_TEST_DIRS = {'tests', 'test', 'spec', 'specs', '__tests__', 'testing'}
+_TEST_NAME_RE = re.compile(r'^(?:test_(?P<a>.+)|(?P<b>.+?)(?:_test|\.test|\.spec|_spec|Test|Tests))$')
+_SHARED_DIRS = {'util', 'utils', 'common', 'shared', 'core', 'helpers', 'base'}
+
+_DOC_SUFFIXES = {'.md', '.rst', '.adoc', '.txt'}
+_DOC_DIRS = {'docs', 'doc', 'documentation', 'references'}
+_CI_PREFIXES = ('.github/workflows/', '.gitlab-ci', '.circleci/', '.buildkite/', 'azure-pipelines', 'jenkinsfile')
+_BUILD_FILES = {
+    'package.json', 'package-lock.json', 'yarn.lock', 'pnpm-lock.yaml', 'requirements.txt',
+    'pyproject.toml', 'setup.py', 'setup.cfg', 'poetry.lock', 'pipfile', 'pipfile.lock',
+    'uv.lock', 'go.mod', 'go.sum', 'cargo.toml', 'cargo.lock', 'gemfile', 'gemfile.lock',
+    'pom.xml', 'build.gradle', 'build.gradle.kts', 'makefile', 'dockerfile', 'tox.ini',
+}
+_CONFIG_SUFFIXES = {'.ini', '.cfg', '.toml', '.yaml', '.yml', '.env', '.conf'}
+
+
+class FileChange:
+    """Counters for one changed file; the diff text itself is never stored."""
+
+    __slots__ = ('path', 'old_path', 'status', 'similarity', 'binary', 'staged', 'unstaged',
+                 'additions', 'deletions', 'hunks', 'moved_hunks', 'sections')
+
+    def __init__(self, path):
+        self.path = path
+        self.old_path = None
+        self.status = 'modified'
+        self.similarity = None
+        self.binary = False
+        self.staged = False
+        self.unstaged = False
+        self.additions = 0
+        self.deletions = 0
+        self.hunks = 0
+        self.moved_hunks = 0  # Hunks whose lines only changed whitespace or order
+        self.sections = []
+
+    @property
+    def formatting_only(self):
+        return self.status == 'modified' and not self.binary and self.hunks > 0 and self.moved_hunks == self.hunks
+
+    def to_dict(self):
+        out = {'path': self.path, 'status': self.status, '+': self.additions, '-': self.deletions,
+               'hunks': self.hunks}
+        if self.old_path:
+            out['from'] = self.old_path
+            out['similarity'] = self.similarity
+        if self.binary:
+            out['binary'] = True
+        if self.formatting_only:
+            out['formatting_only'] = True
+        if self.staged and self.unstaged:
+            out['partially_staged'] = True
+        if self.sections:
+            out['sections'] = self.sections
+        return out
+
+
+def _diff_path(token, prefixed=True):
+    """Unquote a diff header path and strip its a/ or b/ prefix; None for /dev/null."""
+    token = token.strip()
+    if token.startswith('"') and token.endswith('"'):
+        token = codecs.escape_decode(token[1:-1].encode('utf-8'))[0].decode('utf-8', 'replace')
+    if token == '/dev/null':
+        return None
+    return token[2:] if prefixed and token[:2] in ('a/', 'b/') else token
+
+
+def read_lines(stream):
+    """
+    Yield (first_chunk, rest) for each line of a binary stream, where rest is
+    an iterator over the remaining slices of an over-long line. Lines are never
+    held whole, so a minified 100 MB line costs at most _CHUNK bytes.
+    """
+    while True:
+        chunk = stream.readline(_CHUNK)
+        if not chunk:
+            return
+        if chunk.endswith(b'\n'):
+            yield chunk, ()
+            continue
+
+        def rest():
+            while True:
+                more = stream.readline(_CHUNK)
+                if not more:
+                    return
+                yield more
+                if more.endswith(b'\n'):
+                    return
+
+        tail = rest()
+        yield chunk, tail
+        for _ in tail:  # Drain whatever the consumer did not read
+            pass
+
+
+def _line_hash(first, rest):
+    """Whitespace-insensitive hash of one diff line (without its +/- marker)."""
+    part = b''.join(first[1:].split())
+    crc = zlib.crc32(part)
+    length = len(part)
+    for more in rest:
+        part = b''.join(more.split())
+        crc = zlib.crc32(part, crc)
+        length += len(part)
+    return crc | (length << 32)
+
+
+def parse_diff(stream, changes, source, max_sections=3):
+    """
+    Parse a unified diff (git format) incrementally into changes.
+
+    Args:
+        stream: Binary stream of diff output
+        changes: Dict path -> FileChange, updated in place
+        source: 'staged' or 'unstaged'; recorded on every file seen
+        max_sections: Hunk headers kept per file
+    """
+    current = None
+    old_left = new_left = 0
+    add_sum = del_sum = add_n = del_n = 0
+
+    def close_hunk():
+        if current is not None and add_n and add_n == del_n and add_sum == del_sum:
+            current.moved_hunks += 1
+
+    for first, rest in read_lines(stream):
+        if old_left > 0 or new_left > 0:
+            marker = first[:1]
+            if marker == b'+':
+                new_left -= 1
+                add_n += 1
+                current.additions += 1
+                add_sum = (add_sum + _line_hash(first, rest)) & _MASK
+                continue
+            if marker == b'-':
+                old_left -= 1
+                del_n += 1
+                current.deletions += 1
+                del_sum = (del_sum + _line_hash(first, rest)) & _MASK
+                continue
+            if marker == b' ':
+                old_left -= 1
+                new_left -= 1
+                continue
+            if marker == b'\\':  # "\ No newline at end of file"
+                continue
+            old_left = new_left = 0  # Malformed counts; resynchronize on headers
+
+        if first.startswith(b'@@ ') and current is not None:
+            close_hunk()
+            m = _HUNK_RE.match(first)
+            if not m:
+                continue
+            old_left = int(m.group(1)) if m.group(1) is not None else 1
+            new_left = int(m.group(2)) if m.group(2) is not None else 1
+            add_sum = del_sum = add_n = del_n = 0
+            current.hunks += 1
+            section = m.group(3).strip().decode('utf-8', 'replace')[:80]
+            if section and len(current.sections) < max_sections and section not in current.sections:
+                current.sections.append(section)
+            continue
+
+        if first.startswith(b'diff --git '):
+            close_hunk()
+            add_sum = del_sum = add_n = del_n = 0
+            if current is not None:
+                _merge(changes, current, source, max_sections)
+            current = FileChange(_git_header_path(first.decode('utf-8', 'replace').rstrip('\n')))
+            continue
+
+        if current is None:
+            continue
+        text = first.decode('utf-8', 'replace').rstrip('\n')
+        if text.startswith('new file mode'):
+            current.status = 'added'
+        elif text.startswith('deleted file mode'):
+            current.status = 'deleted'
+        elif text.startswith('rename from '):
+            current.old_path = _diff_path(text[len('rename from '):], prefixed=False)
+            current.status = 'renamed'
+        elif text.startswith('rename to '):
+            current.path = _diff_path(text[len('rename to '):], prefixed=False)
+        elif text.startswith('similarity index '):
+            current.similarity = int(text[len('similarity index '):].rstrip('%') or 0)
+        elif text.startswith('Binary files ') or text == 'GIT binary patch':
+            current.binary = True
+        elif text.startswith('+++ ') and _diff_path(text[4:]):
+            current.path = _diff_path(text[4:])
+    close_hunk()
+    if current is not None:
+        _merge(changes, current, source, max_sections)
+
+
+def _git_header_path(line):
+    """Path from 'diff --git a/<path> b/<path>'; exact when both names match (no rename)."""
+    body = line[len('diff --git '):]
+    half = len(body) // 2
+    if body[:half] == 'a/' + body[half + 3:]:
+        return _diff_path(body[half + 1:])
+    return _diff_path(body.rsplit(' b/', 1)[-1], prefixed=False)
+
+
+def _merge(changes, change, source, max_sections=3):
+    """Add change to changes, folding a second diff of the same path into the first."""
+    setattr(change, source, True)
+    existing = changes.get(change.path)
+    if existing is None:
+        changes[change.path] = change
+        return
+    setattr(existing, source, True)
+    if existing.status == 'modified' and change.status != 'modified':
+        existing.status = change.status
+        existing.old_path, existing.similarity = change.old_path, change.similarity
+    existing.binary = existing.binary or change.binary
+    existing.additions += change.additions
+    existing.deletions += change.deletions
+    existing.hunks += change.hunks
+    existing.moved_hunks += change.moved_hunks
+    for section in change.sections:
+        if len(existing.sections) < max_sections and section not in existing.sections:
+            existing.sections.append(section)
+
+
+def _git_diff(repo, args, changes, source, max_sections):
+    cmd = ['git', '-C', repo, '-c', 'core.quotepath=off', 'diff', '--no-color', '--no-ext-diff',
+           '--no-textconv', '-M', '--src-prefix=a/', '--dst-prefix=b/', *args]
+    # stderr goes to a file: a pipe read only after stdout is drained would
+    # deadlock once git writes a pipe buffer of warnings (CRLF, rename limit)
+    with tempfile.TemporaryFile() as errors:
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=errors)
+        try:
+            parse_diff(proc.stdout, changes, source, max_sections)
+        finally:
+            proc.stdout.close()
+            if proc.wait() != 0:
+                errors.seek(0)
+                stderr = errors.read().decode('utf-8', 'replace').strip()
+                raise RuntimeError(stderr or f"git diff exited with {proc.returncode}")
+
+
+def _count_lines(path):
+    count = 0
+    try:
+        with open(path, 'rb') as f:
+            head = f.read(8192)
+            if b'\0' in head:
+                return None
+            count = head.count(b'\n')
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                count += chunk.count(b'\n')
+    except OSError:
+        return 0
+    return count
+
+
+def _untracked(repo, changes):
+    out = subprocess.run(['git', '-C', repo, '-c', 'core.quotepath=off', 'ls-files', '-z', '--others',
+                          '--exclude-standard'], capture_output=True, check=True).stdout
+    root = subprocess.run(['git', '-C', repo, 'rev-parse', '--show-toplevel'],
+                          capture_output=True, text=True, check=True).stdout.strip()
+    for raw in out.split(b'\0'):
+        if not raw:
+            continue
+        change = FileChange(raw.decode('utf-8', 'replace'))
+        change.status = 'untracked'
+        lines = _count_lines(f"{root}/{change.path}")
+        if lines is None:
+            change.binary = True
+        else:
+            change.additions = lines
+        _merge(changes, change, 'unstaged')
+
+
+def collect_changes(repo='.', staged=True, unstaged=True, untracked=True, max_sections=3):
+    """
+    Stream the repository's uncommitted changes into per-file counters.
+
+    Returns:
+        Dict path -> FileChange
+    """
+    changes = {}
+    if staged:
+        _git_diff(repo, ['--cached'], changes, 'staged', max_sections)
+    if unstaged:
+        _git_diff(repo, [], changes, 'unstaged', max_sections)
+        if untracked:
+            _untracked(repo, changes)
+    return changes
+
+
+# ---------------------------------------------------------------------------
+# Classification and grouping
+# ---------------------------------------------------------------------------
+
+def classify(path):
+    """Return one of 'ci', 'build', 'config', 'docs', 'test' or 'source' for a path."""
+    p = PurePosixPath(path)
+    lower = path.lower()
+    name = p.name.lower()
+    dirs = {d.lower() for d in p.parts[:-1]}
+    if lower.startswith(_CI_PREFIXES) or name == 'jenkinsfile':
+        return 'ci'
+    if name in _BUILD_FILES or name.startswith('requirements') and name.endswith('.txt'):
+        return 'build'
+    if dirs & _TEST_DIRS or _TEST_NAME_RE.match(p.stem) or name.startswith('conftest'):
+        return 'test'
+    if p.suffix.lower() in _DOC_SUFFIXES or dirs & _DOC_DIRS or name.startswith(('readme', 'changelog', 'license')):
+        return 'docs'
+    if p.suffix.lower() in _CONFIG_SUFFIXES or name.startswith('.') or dirs & {'config', 'configs', '.config'}:
+        return 'config'
+    return 'source'
+
+
+def module_of(path):
+    """
+    Derive a kebab-case scope from a path: the first directory that names a
+    module rather than contain modules, or the file stem for top-level files.
+    """
+    parts = PurePosixPath(path).parts
+    for part in parts[:-1]:
+        if part.startswith('.') or part.lower() in _CONTAINER_DIRS:
+            continue
+        return _kebab(part)
+    stem = PurePosixPath(path).stem
+    m = _TEST_NAME_RE.match(stem)
+    if m:
+        stem = m.group('a') or m.group('b')
+    return _kebab(stem.lstrip('.') or 'root')
+
+
+def _kebab(name):
+    name = re.sub(r'(?<=[a-z0-9])(?=[A-Z])', '-', name)
+    return re.sub(r'[^a-z0-9]+', '-', name.lower()).strip('-') or 'root'
+
+
+def _test_subject(path):
+    """The source stem a test file covers (test_parser.py -> parser)."""
+    m = _TEST_NAME_RE.match(PurePosixPath(path).stem)
+    return _kebab(m.group('a') or m.group('b')) if m else None
+
+
+def _type_hint(kind, files):
+    if kind in ('ci', 'build', 'docs', 'test', 'style'):
+        return kind
+    if kind == 'rename':
+        return 'refactor'
+    statuses = {f.status for f in files}
+    if statuses <= {'added', 'untracked'}:
+        return 'feat'
+    if statuses == {'deleted'}:
+        return 'refactor'
+    if kind == 'config':
+        return 'chore'
+    return None  # feat / fix / refactor / perf: decide from the code
+
+
+def _group(kind, scope, files, order, notes=()):
+    files = sorted(files, key=lambda f: f.path)
+    notes = list(notes)
+    split = [f.path for f in files if f.staged and f.unstaged]
+    if split:
+        notes.append(f"partially staged, review with git add -p: {', '.join(split)}")
+    return {
+        'order': order,
+        'type': _type_hint(kind, files),
+        'scope': scope,
+        'files': [f.path for f in files],
+        '+': sum(f.additions for f in files),
+        '-': sum(f.deletions for f in files),
+        'notes': notes,
+    }
+
+
+def plan_commits(changes):
+    """
+    Group changed files into candidate atomic commits.
+
+    Args:
+        changes: Dict path -> FileChange (see collect_changes())
+
+    Returns:
+        List of group dicts in suggested commit order
+    """
+    style, renames, docs, ci, build, config = [], [], {}, [], [], {}
+    sources, tests = {}, {}
+    for change in changes.values():
+        kind = classify(change.path)
+        if change.formatting_only:
+            style.append(change)
+        elif change.status == 'renamed' and change.similarity == 100 and not change.hunks:
+            renames.append(change)
+        elif kind == 'docs':
+            docs.setdefault(module_of(change.path), []).append(change)
+        elif kind == 'ci':
+            ci.append(change)
+        elif kind == 'build':
+            build.append(change)
+        elif kind == 'config':
+            config.setdefault(module_of(change.path), []).append(change)
+        elif kind == 'test':
+            tests.setdefault(module_of(change.path), []).append(change)
+        else:
+            sources.setdefault(module_of(change.path), []).append(change)
+
+    # Pair each test with the module whose file it names, else the module it lives in
+    stems = {}
+    for scope, files in sources.items():
+        for f in files:
+            stems.setdefault(_kebab(PurePosixPath(f.path).stem), scope)
+    unpaired = {}
+    for scope, files in tests.items():
+        for f in files:
+            target = stems.get(_test_subject(f.path)) or (scope if scope in sources else None)
+            if target:
+                sources[target].append(f)
+            else:
+                unpaired.setdefault(scope, []).append(f)
+
+    groups = []
+    if build:
+        groups.append(_group('build', 'deps', build, 0, [
+            "dependency changes belong with the code that needs them; merge into that group if one exists"]))
+    if ci:
+        groups.append(_group('ci', module_of(ci[0].path) if len(ci) == 1 else 'ci', ci, 0))
+    for scope, files in sorted(config.items()):
+        groups.append(_group('config', scope, files, 0))
+    if renames:
+        groups.append(_group('rename', 'structure', renames, 1,
+                             [f"moved: {f.old_path} -> {f.path}" for f in renames[:10]]))
+    for scope, files in sorted(sources.items()):
+        shared = any(set(p.lower() for p in PurePosixPath(f.path).parts[:-1]) & _SHARED_DIRS for f in files)
+        notes = []
+        edited_renames = [f for f in files if f.status == 'renamed']
+        if edited_renames:
+            notes.append("renamed with edits; consider a separate move commit first: "
+                         + ", ".join(f"{f.old_path} -> {f.path}" for f in edited_renames[:5]))
+        if not any(classify(f.path) == 'test' for f in files) and any(f.status in ('added', 'untracked') for f in files):
+            notes.append("new code without test changes")
+        groups.append(_group('source', scope, files, 1 if shared else 2, notes))
+    for scope, files in sorted(unpaired.items()):
+        groups.append(_group('test', scope, files, 3))
+    for scope, files in sorted(docs.items()):
+        groups.append(_group('docs', scope, files, 4))
+    if style:
+        groups.append(_group('style', 'codebase', style, 5,
+                             ["every hunk only changes whitespace or line order; verify before committing"]))
+
+    groups.sort(key=lambda g: g['order'])
+    for number, g in enumerate(groups, 1):
+        g['commit'] = number
+        del g['order']
+        if not g['notes']:
+            del g['notes']
+    return groups
+
+
+def build_plan(changes, summary=False):
+    """Return the JSON-ready plan for changes."""
+    files = sorted(changes.values(), key=lambda f: f.path)
+    plan = {
+        'totals': {
+            'files': len(files),
+            '+': sum(f.additions for f in files),
+            '-': sum(f.deletions for f in files),
+            'hunks': sum(f.hunks for f in files),
+        },
+        'commits': plan_commits(changes),
+    }
+    if not summary:
+        plan['files'] = [f.to_dict() for f in files]
+    return plan
+
+
+def _pop_value(args, flag, convert=str):
+    if flag not in args:
+        return None
+    idx = args.index(flag)
+    try:
+        value = convert(args[idx + 1])
+    except (IndexError, ValueError):
+        print(f"Error: {flag} requires a value")
+        sys.exit(1)
+    del args[idx:idx + 2]
+    return value
+
+
+def main():
+    args = sys.argv[1:]
+    if '--help' in args or '-h' in args:
+        print(__doc__.strip())
+        sys.exit(0)
+
+    repo = _pop_value(args, '--repo') or '.'
+    output = _pop_value(args, '--output')
+    max_sections = _pop_value(args, '--max-sections', int)
+    max_sections = 3 if max_sections is None else max_sections
+    flags = {a for a in args if a.startswith('--')}
+    unknown = flags - {'--staged', '--unstaged', '--no-untracked', '--stdin', '--summary'}
+    if unknown or len(flags) != len(args) or {'--staged', '--unstaged'} <= flags:
+        print("Usage: analyze_diff.py [--repo <dir>] [--staged | --unstaged] [--no-untracked] "
+              "[--stdin] [--summary] [--max-sections <n>] [--output <file>]")
+        sys.exit(1)
+
+    try:
+        if '--stdin' in flags:
+            changes = {}
+            parse_diff(sys.stdin.buffer, changes, 'unstaged', max_sections)
+        else:
+            changes = collect_changes(repo,
+                                      staged='--unstaged' not in flags,
+                                      unstaged='--staged' not in flags,
+                                      untracked='--no-untracked' not in flags,
+                                      max_sections=max_sections)
+    except (OSError, RuntimeError, subprocess.CalledProcessError) as e:
+        print(f"❌ Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    text = json.dumps(build_plan(changes, summary='--summary' in flags), ensure_ascii=False, separators=(',', ':'))
+    if output:
+        with open(output, 'w', encoding='utf-8') as f:
+            f.write(text + '\n')
+        print(f"✅ Plan with {len(changes)} files written to {output}", file=sys.stderr)
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,308 @@
+#!/usr/bin/env python3
+"""
+Commit Linter - Checks commit messages against references/conventional-commits.md
+
+Streams `git log` output for a revision range (or reads message files) and
+validates every message with precompiled rules: allowed type, mandatory
+kebab-case scope, subject length/mood/punctuation, and the 2-paragraph body
+with an optional footer. Messages are parsed one at a time, so memory stays
+flat and throughput is bounded by git itself (hundreds of thousands of
+commits per minute).
+
+Usage:
+    lint_commits.py [<revision-range>...] [--repo <dir>] [--include-merges]
+                    [--format text|json|sarif] [--output <file>] [--strict]
+    lint_commits.py --message <file> [<file>...]
+
+Options:
+    <revision-range>     Passed to git log (default: HEAD), e.g. origin/main..HEAD
+    --repo <dir>         Repository to read (default: current directory)
+    --include-merges     Also lint merge commits (skipped by default)
+    --message            Lint message files instead of history (e.g. .git/COMMIT_MSG_1)
+    --format <fmt>       text (default), json, or sarif (SARIF 2.1.0 for CI code scanning)
+    --output <file>      Write the report to a file instead of stdout
+    --strict             Fail on warnings too
+
+Exit status is 1 when any commit has an error (or a warning with --strict).
+
+Examples:
+    lint_commits.py origin/main..HEAD
+    lint_commits.py release/2.x --format sarif --output commits.sarif
+    lint_commits.py --message .git/COMMIT_MSG_1 .git/COMMIT_MSG_2
+"""
+
+import json
+import re
+import subprocess
+import sys
+import tempfile
+
+ALLOWED_TYPES = ('feat', 'fix', 'docs', 'style', 'refactor', 'perf', 'test', 'chore', 'ci', 'build', 'revert')
+GENERIC_SCOPES = frozenset({'code', 'misc', 'update', 'updates', 'general', 'stuff', 'various', 'all', 'changes'})
+MAX_SUBJECT = 72
+
+# id -> (level, description); ids are stable for SARIF consumers
+RULES = {
+    'header-format': ('error', "First line must be 'type(scope): subject'"),
+    'type-enum': ('error', f"Type must be one of: {', '.join(ALLOWED_TYPES)}"),
+    'scope-required': ('error', "Scope is mandatory"),
+    'scope-case': ('error', "Scope must be kebab-case"),
+    'scope-generic': ('warning', "Scope is too generic to locate the change"),
+    'subject-max-length': ('error', f"First line must be at most {MAX_SUBJECT} characters"),
+    'subject-full-stop': ('error', "Subject must not end with a period"),
+    'subject-imperative': ('error', "Subject must use the imperative mood ('add', not 'added' or 'adds')"),
+    'body-leading-blank': ('error', "A blank line must separate the subject from the body"),
+    'body-required': ('error', "Body is mandatory"),
+    'body-paragraphs': ('error', "Body must have exactly 2 paragraphs (plus an optional footer)"),
+}
+
+_HEADER_RE = re.compile(r'(?P<type>\w+)(?:\((?P<scope>[^()]*)\))?(?P<bang>!)?: (?P<subject>\S.*)\Z')
+_SCOPE_RE = re.compile(r'[a-z0-9]+(?:-[a-z0-9]+)*(?:/[a-z0-9]+(?:-[a-z0-9]+)*)*\Z')
+_FOOTER_RE = re.compile(r'(?:BREAKING[ -]CHANGE|[A-Za-z][A-Za-z-]*)(?:: | #)')
+_PARAGRAPH_SPLIT_RE = re.compile(r'\n[ \t]*\n+')
+_TYPES = frozenset(ALLOWED_TYPES)
+# Words ending in -ed/-s that are still imperative (or not verbs at all)
+_NOT_PAST = frozenset({'embed', 'feed', 'seed', 'speed', 'need', 'bleed', 'breed', 'proceed', 'exceed',
+                       'succeed', 'shed', 'shred', 'red', 'bed', 'wed'})
+# A first word ending in -s reads as third person ('adds', 'fixes') unless its
+# ending is typical of a noun or adjective: 'class', 'status', 'analysis', 'bias',
+# 'alias', 'canvas', 'metrics', 'ops', 'tokens' (so "fix(core): bias correction" passes)
+_NOT_THIRD_PERSON_ENDINGS = ('ss', 'us', 'is', 'as', 'ics', 'ps', 'ns')
+
+
+def _not_imperative(subject):
+    word = subject.split(None, 1)[0].lower().rstrip(',:') if subject.strip() else ''
+    if len(word) < 4 or not word.isalpha():
+        return False
+    if word.endswith('ed') and word not in _NOT_PAST:
+        return True
+    if word.endswith('ing') and word not in ('bring', 'string', 'ping'):
+        return True
+    return word.endswith('s') and not word.endswith(_NOT_THIRD_PERSON_ENDINGS)
+
+
+def lint_message(message):
+    """
+    Check one commit message.
+
+    Args:
+        message: Full raw message (subject, blank line, body, footer)
+
+    Returns:
+        List of (rule_id, detail) tuples; empty when the message conforms
+    """
+    problems = []
+    header, sep, rest = message.strip('\n').partition('\n')
+    header = header.rstrip()
+
+    if len(header) > MAX_SUBJECT:
+        problems.append(('subject-max-length', f"{len(header)} characters"))
+    m = _HEADER_RE.match(header)
+    if not m:
+        problems.append(('header-format', header[:MAX_SUBJECT]))
+    else:
+        if m['type'] not in _TYPES:
+            problems.append(('type-enum', m['type']))
+        scope = m['scope']
+        if not scope:
+            problems.append(('scope-required', header[:MAX_SUBJECT]))
+        elif not _SCOPE_RE.match(scope):
+            problems.append(('scope-case', scope))
+        elif scope in GENERIC_SCOPES:
+            problems.append(('scope-generic', scope))
+        subject = m['subject']
+        if subject.endswith('.'):
+            problems.append(('subject-full-stop', subject[-20:]))
+        if _not_imperative(subject):
+            problems.append(('subject-imperative', subject.split(None, 1)[0]))
+
+    if rest and rest.split('\n', 1)[0].strip():
+        problems.append(('body-leading-blank', rest.split('\n', 1)[0][:MAX_SUBJECT]))
+    paragraphs = [p for p in _PARAGRAPH_SPLIT_RE.split(rest.strip()) if p.strip()] if rest.strip() else []
+    if paragraphs and all(_FOOTER_RE.match(line) for line in paragraphs[-1].splitlines() if line.strip()):
+        paragraphs.pop()
+    if not paragraphs:
+        problems.append(('body-required', ''))
+    elif len(paragraphs) != 2:
+        problems.append(('body-paragraphs', f"found {len(paragraphs)}"))
+    return problems
+
+
+def iter_git_messages(repo='.', revisions=('HEAD',), include_merges=False):
+    """
+    Stream (sha, message) pairs from git log, newest first.
+
+    Args:
+        repo: Repository directory
+        revisions: Revision arguments for git log
+        include_merges: Also yield merge commits
+    """
+    cmd = ['git', '-C', repo, 'log', '-z', '--format=%H%n%B', *([] if include_merges else ['--no-merges']),
+           *revisions, '--']
+    # stderr goes to a file: a pipe read only after stdout is drained would
+    # deadlock once git writes a pipe buffer of warnings
+    with tempfile.TemporaryFile() as errors:
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=errors)
+        pending = b''
+        try:
+            for chunk in iter(lambda: proc.stdout.read(1024 * 1024), b''):
+                records = (pending + chunk).split(b'\0')
+                pending = records.pop()
+                for record in records:
+                    sha, _, message = record.partition(b'\n')
+                    yield sha.decode('ascii'), message.decode('utf-8', 'replace')
+            if pending.strip():
+                sha, _, message = pending.partition(b'\n')
+                yield sha.decode('ascii'), message.decode('utf-8', 'replace')
+        finally:
+            proc.stdout.close()
+            if proc.wait() != 0:
+                errors.seek(0)
+                stderr = errors.read().decode('utf-8', 'replace').strip()
+                raise RuntimeError(stderr or f"git log exited with {proc.returncode}")
+
+
+def lint_messages(messages):
+    """
+    Lint (id, message) pairs.
+
+    Returns:
+        (checked_count, results) where results lists only the failing messages as
+        {'commit', 'subject', 'problems': [{'rule', 'level', 'detail'}]}
+    """
+    checked = 0
+    results = []
+    for commit_id, message in messages:
+        checked += 1
+        problems = lint_message(message)
+        if problems:
+            results.append({
+                'commit': commit_id,
+                'subject': message.lstrip('\n').split('\n', 1)[0][:120],
+                'problems': [{'rule': rule, 'level': RULES[rule][0], 'detail': detail} for rule, detail in problems],
+            })
+    return checked, results
+
+
+def _counts(results):
+    counts = {'error': 0, 'warning': 0}
+    for r in results:
+        for p in r['problems']:
+            counts[p['level']] += 1
+    return counts
+
+
+def to_sarif(results, source):
+    """Render results as a SARIF 2.1.0 log (one result per problem, located by commit)."""
+    rule_ids = list(RULES)
+    sarif_results = []
+    for r in results:
+        for p in r['problems']:
+            sarif_results.append({
+                'ruleId': p['rule'],
+                'ruleIndex': rule_ids.index(p['rule']),
+                'level': p['level'],
+                'message': {'text': f"{RULES[p['rule']][1]}: {p['detail']}" if p['detail'] else RULES[p['rule']][1]},
+                'locations': [{'logicalLocations': [{'name': r['commit'], 'fullyQualifiedName': r['subject'],
+                                                     'kind': 'commit'}]}],
+                'partialFingerprints': {'commitRule': f"{r['commit']}:{p['rule']}"},
+            })
+    return {
+        '$schema': 'https://json.schemastore.org/sarif-2.1.0.json',
+        'version': '2.1.0',
+        'runs': [{
+            'tool': {'driver': {
+                'name': 'commit-pro lint_commits',
+                'rules': [{'id': rule_id, 'shortDescription': {'text': desc},
+                           'defaultConfiguration': {'level': level}}
+                          for rule_id, (level, desc) in RULES.items()],
+            }},
+            'properties': {'source': source},
+            'results': sarif_results,
+        }],
+    }
+
+
+def format_text(checked, results, source):
+    lines = []
+    for r in results:
+        icon = '❌' if any(p['level'] == 'error' for p in r['problems']) else '⚠️ '
+        lines.append(f"{icon} {r['commit'][:12]} {r['subject']}")
+        for p in r['problems']:
+            detail = f" ({p['detail']})" if p['detail'] else ''
+            lines.append(f"    [{p['rule']}] {RULES[p['rule']][1]}{detail}")
+    counts = _counts(results)
+    status = '✅' if not results else '❌' if counts['error'] else '⚠️ '
+    lines.append(f"{status} {checked} commit(s) checked in {source}: {len(results)} with problems "
+                 f"({counts['error']} error(s), {counts['warning']} warning(s))")
+    return '\n'.join(lines)
+
+
+def _pop_value(args, flag):
+    if flag not in args:
+        return None
+    idx = args.index(flag)
+    if idx + 1 >= len(args):
+        print(f"Error: {flag} requires a value")
+        sys.exit(1)
+    value = args[idx + 1]
+    del args[idx:idx + 2]
+    return value
+
+
+def main():
+    args = sys.argv[1:]
+    if '--help' in args or '-h' in args:
+        print(__doc__.strip())
+        sys.exit(0)
+
+    repo = _pop_value(args, '--repo') or '.'
+    output = _pop_value(args, '--output')
+    fmt = _pop_value(args, '--format') or 'text'
+    flags = {a for a in args if a in ('--include-merges', '--message', '--strict')}
+    args = [a for a in args if a not in flags]
+    if fmt not in ('text', 'json', 'sarif') or any(a.startswith('--') for a in args) \
+            or ('--message' in flags and not args):
+        print("Usage: lint_commits.py [<revision-range>...] [--repo <dir>] [--include-merges] "
+              "[--format text|json|sarif] [--output <file>] [--strict]")
+        print("       lint_commits.py --message <file> [<file>...]")
+        sys.exit(1)
+
+    try:
+        if '--message' in flags:
+            source = ', '.join(args)
+            messages = []
+            for path in args:
+                with open(path, encoding='utf-8') as f:
+                    messages.append((path, f.read()))
+        else:
+            revisions = args or ['HEAD']
+            source = ' '.join(revisions)
+            messages = iter_git_messages(repo, revisions, '--include-merges' in flags)
+        checked, results = lint_messages(messages)
+    except (OSError, RuntimeError) as e:
+        print(f"❌ Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    counts = _counts(results)
+    if fmt == 'sarif':
+        report = json.dumps(to_sarif(results, source), ensure_ascii=False, separators=(',', ':'))
+    elif fmt == 'json':
+        report = json.dumps({'source': source, 'checked': checked, 'failed': len(results), **counts,
+                             'results': results}, ensure_ascii=False, separators=(',', ':'))
+    else:
+        report = format_text(checked, results, source)
+
+    if output:
+        with open(output, 'w', encoding='utf-8') as f:
+            f.write(report + '\n')
+        print(f"📝 Report for {checked} commit(s) written to {output}", file=sys.stderr)
+    else:
+        print(report)
+
+    if counts['error'] or ('--strict' in flags and counts['warning']):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
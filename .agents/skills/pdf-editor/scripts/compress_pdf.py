@@ -13,6 +13,8 @@ Note:
     Compression applies stream compression and removes duplicate objects.
     Results vary — PDFs already optimized may see minimal size reduction.
     For aggressive image compression, consider using Ghostscript externally.
+    The output is written to a temporary file and renamed into place, so an
+    interrupted run never leaves a truncated PDF.
 
 Examples:
     compress_pdf.py large_document.pdf compressed.pdf
@@ -27,6 +29,9 @@ except ImportError:
     print("Error: pypdf not installed. Run: pip install pypdf")
     sys.exit(1)
 
+sys.path.insert(0, str(Path(__file__).parent))
+from journal import atomic_output
+
 
 def compress_pdf(input_path, output_path):
     """
@@ -48,8 +53,9 @@ def compress_pdf(input_path, output_path):
     # Compress streams and deduplicate objects
     writer.compress_identical_objects(remove_identicals=True, remove_orphans=True)
 
-    with open(output_path, 'wb') as f:
-        writer.write(f)
+    with atomic_output(output_path) as tmp:
+        with open(tmp, 'wb') as f:
+            writer.write(f)
 
     output_size = Path(output_path).stat().st_size
     reduction = (1 - output_size / input_size) * 100
@@ -62,6 +68,9 @@ def compress_pdf(input_path, output_path):
 
 
 def main():
+    if sys.argv[1:2] in (['-h'], ['--help']):
+        print(__doc__.strip())
+        sys.exit(0)
     if len(sys.argv) != 3:
         print("Usage: compress_pdf.py <input.pdf> <output.pdf>")
         sys.exit(1)
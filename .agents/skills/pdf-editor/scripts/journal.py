@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Job Journal - Checkpoint/resume support and atomic writes for pdf-editor scripts
+
+Long runs (splitting thousands of pages, merging thousands of files) record
+each finished unit of work in a journal:
+one JSON line per unit with the SHA-256 and size of the output it produced.
+A rerun with --resume skips units whose output still matches its journal
+entry and redoes everything else, so a crash or preemption only loses the
+unit in flight.
+
+Every output goes through atomic_output(): data is written to a temporary
+file in the same directory, flushed to disk, then renamed over the target,
+so a crash never leaves a truncated PDF behind.
+
+Used by split_pdf.py, merge_pdf.py, compress_pdf.py and rotate_pdf.py; run
+directly to inspect a journal:
+
+Usage:
+    journal.py <journal-file>
+
+Examples:
+    journal.py pages/.split_pdf.journal
+"""
+
+import hashlib
+import json
+import os
+import stat
+import sys
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+
+_READ_CHUNK = 1024 * 1024
+
+
+def _output_mode(path):
+    """Mode for a new output: keep an existing file's mode, else what open() would give under the umask."""
+    try:
+        return stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
+
+def sha256_file(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(_READ_CHUNK), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+@contextmanager
+def atomic_output(path):
+    """
+    Yield a temporary path next to path; on success it is fsynced and renamed
+    over path, on error it is removed and path is left untouched. The result
+    gets the mode of the file it replaces (or the umask default for a new one),
+    not mkstemp's 0600.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(prefix=f".{path.name}.", suffix='.tmp', dir=path.parent)
+    os.close(fd)
+    try:
+        yield tmp
+        with open(tmp, 'rb+') as f:
+            os.fsync(f.fileno())
+        os.chmod(tmp, _output_mode(path))
+        os.replace(tmp, path)
+    finally:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+
+
+def atomic_write(path, data):
+    """Write bytes to path atomically (see atomic_output())."""
+    with atomic_output(path) as tmp:
+        with open(tmp, 'wb') as f:
+            f.write(data)
+
+
+def input_fingerprint(paths):
+    """Identify input files by path, size and modification time (cheap to check)."""
+    fingerprint = []
+    for p in paths:
+        st = os.stat(p)
+        fingerprint.append([str(Path(p).resolve()), st.st_size, st.st_mtime_ns])
+    return fingerprint
+
+
+class Journal:
+    """
+    Append-only record of completed units for one job.
+
+    The first line describes the job (script, inputs, options); a journal whose
+    job differs from the current one is discarded rather than trusted.
+    """
+
+    def __init__(self, path, job, resume=False):
+        """
+        Args:
+            path: Journal file
+            job: JSON-serializable description of the run; must match to resume
+            resume: Reuse completed units from an existing journal for the same job
+        """
+        self.path = Path(path)
+        self.job = job
+        self.completed = {}
+        self.stale = False  # True when an existing journal was for another job
+
+        if resume and self.path.exists():
+            self._load()
+        if not self.completed:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, 'w', encoding='utf-8') as f:
+                f.write(json.dumps({'job': job}) + '\n')
+        self._file = open(self.path, 'a', encoding='utf-8')
+
+    def _load(self):
+        with open(self.path, encoding='utf-8') as f:
+            lines = f.read().splitlines()
+        try:
+            header = json.loads(lines[0]) if lines else None
+        except ValueError:
+            header = None
+        # Round-trip the job so tuples and lists compare equal
+        if not header or header.get('job') != json.loads(json.dumps(self.job)):
+            self.stale = bool(lines)
+            return
+        for line in lines[1:]:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue  # Torn final line from a crash mid-write
+            self.completed[entry['unit']] = entry
+
+    def is_done(self, unit, output_path):
+        """True if unit was completed and output_path still holds exactly what was recorded."""
+        entry = self.completed.get(unit)
+        if entry is None:
+            return False
+        try:
+            return os.path.getsize(output_path) == entry['size'] and sha256_file(output_path) == entry['sha256']
+        except OSError:
+            return False
+
+    def record(self, unit, output_path, **extra):
+        """Mark unit complete with the hash of its (already renamed) output."""
+        entry = {'unit': unit, 'sha256': sha256_file(output_path), 'size': os.path.getsize(output_path), **extra}
+        self.completed[unit] = entry
+        self._file.write(json.dumps(entry) + '\n')
+        self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+    def finish(self):
+        """Job done: the journal is no longer needed."""
+        self.close()
+        self.path.unlink(missing_ok=True)
+
+
+def main():
+    args = sys.argv[1:]
+    if args and args[0] in ('-h', '--help'):
+        print(__doc__.strip())
+        sys.exit(0)
+    if len(args) != 1 or args[0].startswith('-'):
+        print("Usage: journal.py <journal-file>")
+        sys.exit(1)
+    try:
+        with open(args[0], encoding='utf-8') as f:
+            lines = f.read().splitlines()
+        job = json.loads(lines[0])['job']
+    except (OSError, ValueError, KeyError, IndexError) as e:
+        print(f"Error: cannot read journal {args[0]}: {e}")
+        sys.exit(1)
+    units = sum(1 for line in lines[1:] if line.strip())
+    print(f"📒 {args[0]}: {job.get('script', '?')} job, {units} completed unit(s)")
+    print(json.dumps(job, indent=2))
+
+
+if __name__ == "__main__":
+    main()
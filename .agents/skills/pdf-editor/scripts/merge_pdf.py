@@ -3,51 +3,214 @@
 Merge multiple PDF files into one
 
 Usage:
-    merge_pdf.py <output.pdf> <input1.pdf> <input2.pdf> [<input3.pdf> ...]
+    merge_pdf.py <output.pdf> <input1.pdf>[:pages][@angle] <input2.pdf>[:pages][@angle] [...]
+                 [--resume [--journal <file>]]
 
 Arguments:
     output.pdf     Path for the merged output PDF
-    input*.pdf     Two or more PDF files to merge (in order)
+    input*.pdf     Two or more PDF files to merge (in order), or one with a page selector
+
+Page selectors (optional, per input):
+    :1-3           Pages 1 to 3            :2,5,7     Pages 2, 5 and 7 (in that order)
+    :-1            Last page               :-3--1     Last three pages
+    :4-            Page 4 to the end       :5-1       Pages 5 down to 1 (reversed)
+    @90            Rotate the selected pages by 90, 180 or 270 degrees (clockwise)
+
+Options:
+    --resume       For very long input lists: merge in checkpointed segments of
+                   50 inputs (kept in <output>.parts/, journaled in <output>.journal);
+                   rerunning the same command after a crash reuses finished segments
+    --journal      Journal file to use with --resume
+
+Each input is read once and its selected pages are copied straight into the
+output; without --resume no intermediate files are written. The output is
+written to a temporary file and renamed into place.
 
 Examples:
     merge_pdf.py merged.pdf doc1.pdf doc2.pdf
     merge_pdf.py report.pdf cover.pdf chapter1.pdf chapter2.pdf appendix.pdf
+    merge_pdf.py packet.pdf a.pdf:1-3 b.pdf c.pdf:-1
+    merge_pdf.py packet.pdf scan.pdf:2@90 form.pdf:1,3@180
+    merge_pdf.py archive.pdf scans/*.pdf --resume
 """
 
+import re
+import shutil
 import sys
 from pathlib import Path
 
 try:
-    from pypdf import PdfWriter
+    from pypdf import PdfReader, PdfWriter
 except ImportError:
     print("Error: pypdf not installed. Run: pip install pypdf")
     sys.exit(1)
 
+sys.path.insert(0, str(Path(__file__).parent))
+from journal import Journal, atomic_output, input_fingerprint
+
+# Inputs per checkpointed segment with --resume
+_SEGMENT_INPUTS = 50
+_SELECTOR_RE = re.compile(r'^(?:-?\d+(?:-(?:-?\d+)?)?)(?:,-?\d+(?:-(?:-?\d+)?)?)*$')
+_ITEM_RE = re.compile(r'^(-?\d+)(?:(-)(-?\d+)?)?$')
+
+
+def parse_input_spec(spec):
+    """
+    Split 'file.pdf[:pages][@angle]' into (path, pages, angle).
+
+    A suffix is only treated as a selector when the whole argument is not an
+    existing file, so paths that contain ':' or '@' keep working.
+
+    Returns:
+        (path, pages or None for all pages, angle or None)
+    """
+    path, pages, angle = spec, None, None
+    if Path(spec).exists():
+        return path, pages, angle
+    head, sep, tail = path.rpartition('@')
+    if sep and tail in ('90', '180', '270'):
+        path, angle = head, int(tail)
+    head, sep, tail = path.rpartition(':')
+    if sep and head and _SELECTOR_RE.match(tail.replace(' ', '')):
+        path, pages = head, tail.replace(' ', '')
+    return path, pages, angle
+
+
+def resolve_pages(selector, total_pages):
+    """
+    Resolve a page selector into 0-based page indices, in selector order.
+    Negative numbers count from the end (-1 is the last page).
+    """
+    def index(number):
+        value = int(number)
+        return total_pages + value if value < 0 else value - 1
+
+    indices = []
+    for item in selector.split(','):
+        m = _ITEM_RE.match(item)
+        start = index(m.group(1))
+        if not m.group(2):
+            end = start
+        else:
+            end = index(m.group(3)) if m.group(3) else total_pages - 1
+        if not (0 <= start < total_pages and 0 <= end < total_pages):
+            raise ValueError(f"page selector '{item}' is out of range (document has {total_pages} page(s))")
+        step = 1 if end >= start else -1
+        indices.extend(range(start, end + step, step))
+    return indices
+
+
+def add_input(writer, spec):
+    """
+    Append one input spec to writer.
+
+    Returns:
+        Number of pages added
+    """
+    input_path, selector, angle = parse_input_spec(spec)
+    reader = PdfReader(input_path)
+    page_count = len(reader.pages)
+    try:
+        pages = resolve_pages(selector, page_count) if selector else list(range(page_count))
+    except ValueError as e:
+        print(f"Error: {input_path}: {e}")
+        sys.exit(1)
+
+    first = len(writer.pages)
+    if selector is None:
+        writer.append(reader)
+    else:
+        # add_page keeps repeated pages; append() would collapse duplicates
+        for index in pages:
+            writer.add_page(reader.pages[index])
+    if angle:
+        for page in writer.pages[first:]:
+            page.rotate(angle)
+
+    detail = f"page(s) {selector} of {page_count}" if selector else f"{page_count} page(s)"
+    rotation = f", rotated {angle}°" if angle else ""
+    print(f"  Added: {input_path} ({detail}{rotation})")
+    return len(pages)
 
-def merge_pdfs(output_path, input_paths):
+
+def _write(writer, output_path):
+    with atomic_output(output_path) as tmp:
+        with open(tmp, 'wb') as f:
+            writer.write(f)
+
+
+def merge_segments(output_path, input_paths, journal_path=None):
+    """
+    Merge in checkpointed segments so an interrupted run can pick up where it stopped.
+
+    Every _SEGMENT_INPUTS inputs are merged into <output>.parts/seg_NNNN.pdf and
+    recorded in the journal; on a rerun, segments whose file still matches the
+    journal are reused, as long as their inputs are unchanged (path, size and
+    mtime are recorded per segment, so editing one input redoes only its
+    segment). The segments are then joined into output_path.
+
+    Returns:
+        Number of pages merged
+    """
+    parts_dir = Path(f"{output_path}.parts")
+    job = {'script': 'merge_pdf', 'output': str(Path(output_path).resolve()), 'inputs': input_paths}
+    journal = Journal(journal_path or f"{output_path}.journal", job, resume=True)
+    if journal.stale:
+        print("⚠️  Journal was for a different output or input list; starting over")
+
+    segments = []
+    total_pages = 0
+    try:
+        for start in range(0, len(input_paths), _SEGMENT_INPUTS):
+            name = f"seg_{start // _SEGMENT_INPUTS + 1:04d}.pdf"
+            segment = parts_dir / name
+            segments.append(segment)
+            specs = input_paths[start:start + _SEGMENT_INPUTS]
+            files = input_fingerprint(parse_input_spec(spec)[0] for spec in specs)
+            if journal.is_done(name, segment) and journal.completed[name].get('files') == files:
+                pages = journal.completed[name]['pages']
+                print(f"  Reused: {name} (inputs {start + 1}-{min(start + _SEGMENT_INPUTS, len(input_paths))}, {pages} page(s))")
+            else:
+                writer = PdfWriter()
+                pages = sum(add_input(writer, spec) for spec in specs)
+                _write(writer, segment)
+                journal.record(name, segment, pages=pages, files=files)
+            total_pages += pages
+    finally:
+        journal.close()
+
+    writer = PdfWriter()
+    for segment in segments:
+        writer.append(PdfReader(segment))
+    _write(writer, output_path)
+    journal.finish()
+    shutil.rmtree(parts_dir, ignore_errors=True)
+    return total_pages
+
+
+def merge_pdfs(output_path, input_paths, resume=False, journal_path=None):
     """
     Merge multiple PDF files into a single output PDF.
 
     Args:
         output_path: Path for the merged output PDF
-        input_paths: List of paths to input PDF files (merged in order)
+        input_paths: List of input specs, merged in order: a path, optionally with
+            a ':pages' selector and an '@angle' rotation (see parse_input_spec())
+        resume: Merge in journaled segments and reuse those finished by an earlier run
+        journal_path: Journal file (default: <output>.journal)
     """
-    writer = PdfWriter()
-    total_pages = 0
-
-    for input_path in input_paths:
+    for spec in input_paths:
+        input_path = parse_input_spec(spec)[0]
         if not Path(input_path).exists():
             print(f"Error: File not found: {input_path}")
             sys.exit(1)
 
-        writer.append(input_path)
-        from pypdf import PdfReader
-        page_count = len(PdfReader(input_path).pages)
-        total_pages += page_count
-        print(f"  Added: {input_path} ({page_count} page(s))")
-
-    with open(output_path, 'wb') as f:
-        writer.write(f)
+    if resume:
+        total_pages = merge_segments(output_path, input_paths, journal_path)
+    else:
+        writer = PdfWriter()
+        total_pages = sum(add_input(writer, spec) for spec in input_paths)
+        _write(writer, output_path)
 
     print(f"\n✅ Merged {len(input_paths)} file(s) → {total_pages} total page(s)")
     print(f"   Output: {output_path}")
@@ -55,16 +218,32 @@ def merge_pdfs(output_path, input_paths):
 
 def main():
     args = sys.argv[1:]
+    if args and args[0] in ('-h', '--help'):
+        print(__doc__.strip())
+        sys.exit(0)
+    journal_path = None
+    resume = '--resume' in args
+    if resume:
+        args.remove('--resume')
+
+    if '--journal' in args:
+        idx = args.index('--journal')
+        if idx + 1 >= len(args):
+            print("Error: --journal requires a file path")
+            sys.exit(1)
+        journal_path = args[idx + 1]
+        args = args[:idx] + args[idx + 2:]
 
-    if len(args) < 3:
-        print("Usage: merge_pdf.py <output.pdf> <input1.pdf> <input2.pdf> [<input3.pdf> ...]")
-        print("Error: At least 2 input files required")
+    has_selector = any(parse_input_spec(a)[1:] != (None, None) for a in args[1:])
+    if len(args) < 3 and not (len(args) == 2 and has_selector):
+        print("Usage: merge_pdf.py <output.pdf> <input1.pdf>[:pages][@angle] <input2.pdf>[:pages][@angle] [...]")
+        print("Error: At least 2 input files required (or 1 with a page selector)")
         sys.exit(1)
 
     output_path = args[0]
     input_paths = args[1:]
 
-    merge_pdfs(output_path, input_paths)
+    merge_pdfs(output_path, input_paths, resume, journal_path)
 
 
 if __name__ == "__main__":
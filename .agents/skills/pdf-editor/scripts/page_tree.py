@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+Page Tree - Lazy page access and in-place page edits for very large PDFs
+
+pypdf resolves the whole page tree the first time `len(reader.pages)` or
+`reader.pages[i]` is used, which costs seconds on documents with tens of
+thousands of pages. The helpers here walk the tree only along the path to the
+requested page, resolving the kids of each node up to the one that holds it
+and using /Count to skip whole subtrees, so pulling a few pages out of a huge
+document touches only the objects on the way to those pages. Kid totals are
+remembered per node, so later lookups on the same reader bisect instead.
+
+`write_page_updates()` saves edited pages as a PDF incremental update: the
+original bytes are copied unchanged and only the new page objects plus a small
+cross-reference section are appended.
+
+Used by split_pdf.py and rotate_pdf.py; run directly to time a lookup:
+
+Usage:
+    page_tree.py <input.pdf> [page-number ...]
+
+Examples:
+    page_tree.py archive.pdf 2 3 4
+"""
+
+import io
+import re
+import shutil
+import sys
+import time
+from bisect import bisect_right
+from pathlib import Path
+
+try:
+    from pypdf import PageObject, PdfReader
+    from pypdf.generic import ArrayObject, DictionaryObject, IndirectObject, NameObject, NumberObject, StreamObject
+except ImportError:
+    print("Error: pypdf not installed. Run: pip install pypdf")
+    sys.exit(1)
+
+INHERITABLE = ('/Resources', '/MediaBox', '/CropBox', '/Rotate')
+_MAX_DEPTH = 64
+_STARTXREF_RE = re.compile(rb'startxref\s+(\d+)\s+%%EOF', re.S)
+
+
+def page_count(reader):
+    """Number of pages from the root /Count, without resolving the page tree."""
+    try:
+        count = reader.trailer['/Root']['/Pages']['/Count']
+        if isinstance(count, int) and count >= 0:
+            return int(count)
+    except (KeyError, TypeError, AttributeError):
+        pass
+    return len(reader.pages)
+
+
+def _is_pages_node(node):
+    return node.get('/Type') == '/Pages' or ('/Type' not in node and '/Kids' in node)
+
+
+def _node_key(ref, node):
+    return (ref.idnum, ref.generation) if isinstance(ref, IndirectObject) else id(node)
+
+
+def _locate(reader, index, counts=None):
+    """
+    Walk from the root to page index; returns (node, reference, inherited attributes).
+
+    counts memoizes, per /Pages node, the running page totals of the kids resolved
+    so far, so repeated lookups on one reader resolve each kid at most once and
+    find their branch by bisection. Kids are only resolved up to the target:
+    a node's /Count says nothing about how its pages are spread over its kids
+    (an empty /Pages kid can sit next to one holding two pages).
+    """
+    if counts is None:
+        counts = {}
+    ref = reader.trailer['/Root'].raw_get('/Pages')
+    node = ref.get_object()
+    inherit = {}
+    remaining = index
+    for _ in range(_MAX_DEPTH):
+        for attr in INHERITABLE:
+            if attr in node:
+                inherit[attr] = node[attr]
+        kids = node['/Kids'].get_object()
+        if not 0 <= remaining < int(node['/Count']):
+            raise IndexError(index)
+
+        totals = counts.setdefault(_node_key(ref, node), [])
+        while (not totals or totals[-1] <= remaining) and len(totals) < len(kids):
+            kid = kids[len(totals)].get_object()
+            size = int(kid['/Count']) if _is_pages_node(kid) else 1
+            totals.append((totals[-1] if totals else 0) + size)
+        position = bisect_right(totals, remaining)
+        if position == len(kids):
+            raise ValueError("page tree /Count does not match its /Kids")
+        if position:
+            remaining -= totals[position - 1]
+        ref = kids[position]
+        kid = ref.get_object()
+        if not _is_pages_node(kid):
+            return kid, ref if isinstance(ref, IndirectObject) else None, inherit
+        node = kid
+    raise ValueError("page tree is too deep")
+
+
+def get_page(reader, index, counts=None):
+    """
+    Return page index (0-based) as a PageObject, resolving only the tree nodes on
+    its path. Falls back to reader.pages[index] when the tree is malformed.
+
+    Pass the same counts dict across calls on one reader to reuse the kid totals
+    already computed (LazyPages does).
+    """
+    try:
+        node, ref, inherit = _locate(reader, index, counts)
+    except IndexError:
+        raise IndexError(f"page index {index} out of range") from None
+    except (KeyError, TypeError, ValueError, AttributeError):
+        return reader.pages[index]
+    page = PageObject(reader, ref)
+    page.update(node)
+    for attr, value in inherit.items():
+        if attr not in page:
+            page[NameObject(attr)] = value
+    return page
+
+
+class LazyPages:
+    """Sequence view of a reader's pages that resolves each page on first use."""
+
+    def __init__(self, reader):
+        self.reader = reader
+        self._count = None
+        self._cache = {}
+        self._counts = {}  # Kid totals per /Pages node (see _locate())
+
+    def __len__(self):
+        if self._count is None:
+            self._count = page_count(self.reader)
+        return self._count
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self)
+        if index not in self._cache:
+            self._cache[index] = get_page(self.reader, index, self._counts)
+        return self._cache[index]
+
+    def __iter__(self):
+        return (self[i] for i in range(len(self)))
+
+
+def _last_startxref(path):
+    with open(path, 'rb') as f:
+        f.seek(0, 2)
+        size = f.tell()
+        f.seek(max(0, size - 2048))
+        tail = f.read()
+    matches = _STARTXREF_RE.findall(tail)
+    if not matches:
+        raise ValueError("startxref not found")
+    offset = int(matches[-1])
+    with open(path, 'rb') as f:
+        f.seek(offset)
+        uses_table = f.read(4) == b'xref'
+    return offset, uses_table
+
+
+def _serialize(obj):
+    buf = io.BytesIO()
+    obj.write_to_stream(buf)
+    return buf.getvalue()
+
+
+def write_page_updates(reader, input_path, output_path, updates):
+    """
+    Save edited page dictionaries as an incremental update of input_path.
+
+    Args:
+        reader: PdfReader over input_path (not encrypted)
+        input_path: Original PDF; copied byte for byte to output_path
+        output_path: Destination (must differ from input_path)
+        updates: Dict IndirectObject (original page reference) -> DictionaryObject
+            holding the page's new entries; references inside keep pointing at the
+            original objects, which stay in the file
+    """
+    prev, uses_table = _last_startxref(input_path)
+    trailer = reader.trailer
+    size = int(trailer['/Size'])
+
+    with open(input_path, 'rb') as src, open(output_path, 'wb') as out:
+        shutil.copyfileobj(src, out, 1024 * 1024)
+        out.write(b'\n')
+        offsets = {}
+        for ref, page in sorted(updates.items(), key=lambda item: item[0].idnum):
+            offsets[ref.idnum] = (out.tell(), ref.generation)
+            out.write(b'%d %d obj\n' % (ref.idnum, ref.generation) + _serialize(page) + b'\nendobj\n')
+
+        tail = DictionaryObject()
+        for key in ('/Root', '/Info', '/ID'):
+            if key in trailer:
+                tail[NameObject(key)] = trailer.raw_get(key)
+        tail[NameObject('/Prev')] = NumberObject(prev)
+
+        if uses_table:
+            xref_at = out.tell()
+            out.write(b'xref\n0 1\n0000000000 65535 f\r\n')
+            for idnum, (offset, gen) in sorted(offsets.items()):
+                out.write(b'%d 1\n%010d %05d n\r\n' % (idnum, offset, gen))
+            tail[NameObject('/Size')] = NumberObject(size)
+            out.write(b'trailer\n' + _serialize(tail) + b'\n')
+        else:
+            # Cross-reference stream, as readers expect for files that already use one
+            xref_at = out.tell()
+            offsets[size] = (xref_at, 0)
+            width = max(4, (max(offset for offset, _ in offsets.values()).bit_length() + 7) // 8)
+            rows, index = [], []
+            for idnum, (offset, gen) in sorted(offsets.items()):
+                index += [NumberObject(idnum), NumberObject(1)]
+                rows.append(b'\x01' + offset.to_bytes(width, 'big') + gen.to_bytes(2, 'big'))
+            stream = StreamObject()
+            stream.set_data(b''.join(rows))
+            stream.update(tail)
+            stream[NameObject('/Type')] = NameObject('/XRef')
+            stream[NameObject('/Size')] = NumberObject(size + 1)
+            stream[NameObject('/W')] = ArrayObject([NumberObject(1), NumberObject(width), NumberObject(2)])
+            stream[NameObject('/Index')] = ArrayObject(index)
+            out.write(b'%d 0 obj\n' % size + _serialize(stream) + b'\nendobj\n')
+        out.write(b'startxref\n%d\n%%%%EOF\n' % xref_at)
+
+
+def main():
+    args = sys.argv[1:]
+    if args and args[0] in ('-h', '--help'):
+        print(__doc__.strip())
+        sys.exit(0)
+    if not args or args[0].startswith('-'):
+        print("Usage: page_tree.py <input.pdf> [page-number ...]")
+        sys.exit(1)
+    if not Path(args[0]).exists():
+        print(f"Error: File not found: {args[0]}")
+        sys.exit(1)
+
+    start = time.perf_counter()
+    reader = PdfReader(args[0])
+    opened = time.perf_counter()
+    pages = LazyPages(reader)
+    print(f"📄 {args[0]}: {len(pages)} page(s), opened in {(opened - start) * 1000:.1f} ms")
+    for number in args[1:]:
+        t = time.perf_counter()
+        page = pages[int(number) - 1]
+        box = page.mediabox
+        print(f"   Page {number}: {float(box.width):g}x{float(box.height):g}, /Rotate {page.rotation}, "
+              f"found in {(time.perf_counter() - t) * 1000:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
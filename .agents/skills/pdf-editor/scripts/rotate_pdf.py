@@ -4,6 +4,7 @@ Rotate PDF pages
 
 Usage:
     rotate_pdf.py <input.pdf> <output.pdf> <angle> [--pages <page_range>]
+    rotate_pdf.py <input.pdf> <output.pdf> --auto [--pages <page_range>] [--jobs <n>]
 
 Arguments:
     input.pdf    Path to the source PDF file
@@ -12,22 +13,43 @@ Arguments:
 
 Options:
     --pages      Page range to rotate (e.g., "1-3,5" or "all"). Default: all
+    --auto       Detect each page's orientation and rotate only the pages that need it
+    --jobs       Worker processes for --auto detection (default: CPU count)
+
+Auto mode reads the direction of the text matrices on each page (no OCR):
+text running up, down or upside down is turned upright. Pages without text
+fall back to page shape: a page whose orientation differs from the rest of
+the document is turned 90° clockwise, which cannot tell 90° from 270° and is
+reported for review.
 
 Examples:
     rotate_pdf.py document.pdf rotated.pdf 90
     rotate_pdf.py document.pdf rotated.pdf 180 --pages 1-3
     rotate_pdf.py document.pdf rotated.pdf 270 --pages 1,3,5
+    rotate_pdf.py scans.pdf upright.pdf --auto
 """
 
+import math
+import os
 import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 try:
     from pypdf import PdfReader, PdfWriter
+    from pypdf.generic import DictionaryObject, NameObject, NumberObject
 except ImportError:
     print("Error: pypdf not installed. Run: pip install pypdf")
     sys.exit(1)
 
+sys.path.insert(0, str(Path(__file__).parent))
+from journal import atomic_output
+from page_tree import LazyPages, write_page_updates
+
+# Below this many pages, process start-up costs more than detection saves
+_PARALLEL_MIN_PAGES = 32
+
 
 def parse_page_range(page_range_str, total_pages):
     """Parse page range string into list of 0-based page indices."""
@@ -46,6 +68,129 @@ def parse_page_range(page_range_str, total_pages):
     return sorted(p for p in pages if 0 <= p < total_pages)
 
 
+def text_direction(page):
+    """
+    Dominant text direction on a page, from its text and transformation matrices.
+
+    Returns:
+        Counter-clockwise angle of the text baseline in page space (0, 90, 180 or 270),
+        or None if the page has no text
+    """
+    votes = Counter()
+
+    def visit(text, cm, tm, font_dict, font_size):
+        weight = len(text.strip())
+        if not weight:
+            return
+        # Baseline direction: the x axis of the text rendering matrix (tm x cm)
+        dx = tm[0] * cm[0] + tm[1] * cm[2]
+        dy = tm[0] * cm[1] + tm[1] * cm[3]
+        if dx or dy:
+            votes[round(math.degrees(math.atan2(dy, dx)) / 90) % 4 * 90] += weight
+
+    page.extract_text(visitor_text=visit)
+    return votes.most_common(1)[0][0] if votes else None
+
+
+def _detect_chunk(input_path, indices):
+    """Worker: text direction for the given pages of input_path."""
+    pages = LazyPages(PdfReader(input_path))
+    return [(i, text_direction(pages[i])) for i in indices]
+
+
+def detect_rotations(input_path, pages, indices, jobs=None):
+    """
+    Work out the clockwise rotation each page needs to read upright.
+
+    Args:
+        input_path: Path to the PDF (re-opened by worker processes)
+        pages: Pages of the same file (reader.pages or a LazyPages view)
+        indices: 0-based page indices to inspect
+        jobs: Worker processes (default: CPU count; 1 disables parallelism)
+
+    Returns:
+        Dict index -> (angle, reason) for pages that need rotating, reason being
+        'text' or 'shape'
+    """
+    jobs = jobs or os.cpu_count() or 1
+    if jobs > 1 and len(indices) >= _PARALLEL_MIN_PAGES:
+        size = math.ceil(len(indices) / (jobs * 4))
+        chunks = [indices[i:i + size] for i in range(0, len(indices), size)]
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            directions = dict(r for part in pool.map(_detect_chunk, [input_path] * len(chunks), chunks)
+                              for r in part)
+    else:
+        directions = {i: text_direction(pages[i]) for i in indices}
+
+    def landscape(index, extra=0):
+        page = pages[index]
+        wide = float(page.mediabox.width) > float(page.mediabox.height)
+        return wide != ((page.rotation + extra) % 180 == 90)
+
+    rotations = {}
+    shapes = Counter()
+    for i in indices:
+        direction = directions[i]
+        if direction is None:
+            continue
+        # /Rotate turns the page clockwise on screen; text reads upright when it cancels the baseline angle
+        needed = (direction - pages[i].rotation) % 360
+        if needed:
+            rotations[i] = (needed, 'text')
+        shapes[landscape(i, needed)] += 1
+
+    if not shapes:  # No text anywhere: the most common page shape is the norm
+        shapes.update(landscape(i) for i in indices)
+    usual = shapes.most_common(1)[0][0] if shapes else False
+    for i in indices:
+        if directions[i] is None and landscape(i) != usual:
+            rotations[i] = (90, 'shape')
+    return rotations
+
+
+def save_rotations(reader, input_path, output_path, rotations):
+    """
+    Write input_path with the given pages rotated.
+
+    When only some pages change, the result is an incremental update: the
+    original file is copied as is and only the rotated page objects are
+    appended, so the rest of the page tree is never loaded. Rotating every
+    page (or an encrypted file) rewrites the document. Either way the output is
+    written to a temporary file and renamed into place.
+
+    Args:
+        reader: PdfReader over input_path
+        input_path: Path to source PDF
+        output_path: Path for output PDF
+        rotations: Dict 0-based page index -> clockwise angle to add
+    """
+    pages = LazyPages(reader)
+    in_place = Path(input_path).resolve() == Path(output_path).resolve()
+    if len(rotations) < len(pages) and not reader.is_encrypted and not in_place:
+        updates = {}
+        for i, angle in rotations.items():
+            page = pages[i]
+            if page.indirect_reference is None:
+                break  # Inline page dictionary: cannot be replaced on its own
+            entry = DictionaryObject(reader.get_object(page.indirect_reference))
+            entry[NameObject('/Rotate')] = NumberObject((page.rotation + angle) % 360)
+            updates[page.indirect_reference] = entry
+        else:
+            with atomic_output(output_path) as tmp:
+                write_page_updates(reader, input_path, tmp, updates)
+            return
+
+    writer = PdfWriter()
+    for i, page in enumerate(reader.pages):
+        if i in rotations:
+            page.rotate(rotations[i])
+        writer.add_page(page)
+
+    with atomic_output(output_path) as tmp:
+        with open(tmp, 'wb') as f:
+            writer.write(f)
+
+
 def rotate_pdf(input_path, output_path, angle, page_range='all'):
     """
     Rotate PDF pages by the specified angle.
@@ -61,27 +206,48 @@ def rotate_pdf(input_path, output_path, angle, page_range='all'):
         sys.exit(1)
 
     reader = PdfReader(input_path)
-    writer = PdfWriter()
-    total_pages = len(reader.pages)
+    total_pages = len(LazyPages(reader))
 
     pages_to_rotate = parse_page_range(page_range, total_pages)
-
-    for i, page in enumerate(reader.pages):
-        if i in pages_to_rotate:
-            page.rotate(angle)
-        writer.add_page(page)
-
-    with open(output_path, 'wb') as f:
-        writer.write(f)
+    save_rotations(reader, input_path, output_path, {i: angle for i in pages_to_rotate})
 
     rotated_count = len(pages_to_rotate)
     print(f"✅ Rotated {rotated_count}/{total_pages} page(s) by {angle}°")
     print(f"   Output: {output_path}")
 
 
+def auto_rotate_pdf(input_path, output_path, page_range='all', jobs=None):
+    """
+    Detect page orientation and rotate only the pages that are not upright.
+
+    Args:
+        input_path: Path to source PDF
+        output_path: Path for output PDF
+        page_range: Page range string or 'all' (pages to inspect)
+        jobs: Worker processes for detection (see detect_rotations())
+    """
+    reader = PdfReader(input_path)
+    pages = LazyPages(reader)
+    total_pages = len(pages)
+    rotations = detect_rotations(input_path, pages, parse_page_range(page_range, total_pages), jobs)
+    save_rotations(reader, input_path, output_path, {i: angle for i, (angle, _) in rotations.items()})
+
+    print(f"✅ Auto-rotated {len(rotations)}/{total_pages} page(s)")
+    for i, (angle, reason) in sorted(rotations.items())[:20]:
+        note = " (by page shape, check direction)" if reason == 'shape' else ""
+        print(f"   Page {i + 1}: {angle}°{note}")
+    if len(rotations) > 20:
+        print(f"   ... and {len(rotations) - 20} more")
+    print(f"   Output: {output_path}")
+
+
 def main():
     args = sys.argv[1:]
+    if args and args[0] in ('-h', '--help'):
+        print(__doc__.strip())
+        sys.exit(0)
     page_range = 'all'
+    jobs = None
 
     # Parse --pages option
     if '--pages' in args:
@@ -89,8 +255,26 @@ def main():
         page_range = args[idx + 1]
         args = args[:idx] + args[idx + 2:]
 
+    if '--jobs' in args:
+        idx = args.index('--jobs')
+        try:
+            jobs = int(args[idx + 1])
+        except (IndexError, ValueError):
+            print("Error: --jobs requires an integer")
+            sys.exit(1)
+        args = args[:idx] + args[idx + 2:]
+
+    if '--auto' in args:
+        args.remove('--auto')
+        if len(args) != 2:
+            print("Usage: rotate_pdf.py <input.pdf> <output.pdf> --auto [--pages <page_range>] [--jobs <n>]")
+            sys.exit(1)
+        auto_rotate_pdf(args[0], args[1], page_range, jobs)
+        return
+
     if len(args) != 3:
         print("Usage: rotate_pdf.py <input.pdf> <output.pdf> <angle> [--pages <page_range>]")
+        print("       rotate_pdf.py <input.pdf> <output.pdf> --auto [--pages <page_range>] [--jobs <n>]")
         sys.exit(1)
 
     input_path, output_path, angle_str = args
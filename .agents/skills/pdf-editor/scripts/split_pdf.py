@@ -3,7 +3,8 @@
 Split PDF into individual pages or extract a page range
 
 Usage:
-    split_pdf.py <input.pdf> <output_dir> [--pages <page_range>]
+    split_pdf.py <input.pdf> <output_dir> [--pages <page_range>] [--jobs <n>] [--resume [--journal <file>]]
+    split_pdf.py <input.pdf> --archive <out.zip|out.tar|out.tar.gz|-> [--pages <page_range>] [--jobs <n>]
 
 Arguments:
     input.pdf    Path to the source PDF file
@@ -12,6 +13,18 @@ Arguments:
 Options:
     --pages      Page range to extract (e.g., "1-3", "2,4,6", or "all").
                  Default: all (splits into individual pages)
+    --archive    Write the pages straight into a zip or tar archive instead of a
+                 directory; "-" streams a tar archive to stdout (messages go to stderr)
+    --jobs       Worker processes that build pages in parallel (default: 1);
+                 pages are still written in order
+    --resume     Journal finished pages (default: <output_dir>/.split_pdf.journal) and,
+                 when rerun after a crash, skip pages whose files still match it
+    --journal    Journal file to use with --resume
+
+Every page file (and archive) is written to a temporary file and renamed into
+place, so an interrupted run never leaves a truncated PDF.
+Archive entries are stamped with $SOURCE_DATE_EPOCH, or else the input file's
+modification time, so splitting the same file twice gives identical archives.
 
 Output filenames: page_001.pdf, page_002.pdf, etc.
 If --pages is a range that results in one file, saves as extracted.pdf.
@@ -20,9 +33,21 @@ Examples:
     split_pdf.py document.pdf ./pages/
     split_pdf.py document.pdf ./output/ --pages 2-5
     split_pdf.py document.pdf ./output/ --pages 1,3,5
+    split_pdf.py document.pdf --archive pages.zip --jobs 4
+    split_pdf.py huge.pdf ./pages/ --resume
+    split_pdf.py document.pdf --archive - --pages 1-100 | ssh host 'tar -x -C /srv/pages'
 """
 
+import contextlib
+import gzip
+import io
+import os
 import sys
+import tarfile
+import time
+import zipfile
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 try:
@@ -31,6 +56,13 @@ except ImportError:
     print("Error: pypdf not installed. Run: pip install pypdf")
     sys.exit(1)
 
+sys.path.insert(0, str(Path(__file__).parent))
+from journal import Journal, atomic_output, atomic_write, input_fingerprint
+from page_tree import LazyPages
+
+_ARCHIVE_SUFFIXES = ('.zip', '.tar', '.tar.gz', '.tgz')
+_worker_pages = None  # LazyPages of the input, one per worker process
+
 
 def parse_page_range(page_range_str, total_pages):
     """Parse page range string into sorted list of 0-based page indices."""
@@ -49,44 +81,198 @@ def parse_page_range(page_range_str, total_pages):
     return sorted(p for p in pages if 0 <= p < total_pages)
 
 
-def split_pdf(input_path, output_dir, page_range='all'):
+def render_page(pages, page_num):
+    """Build a one-page PDF for page_num (0-based) and return its bytes."""
+    writer = PdfWriter()
+    writer.add_page(pages[page_num])
+    buf = io.BytesIO()
+    writer.write(buf)
+    return buf.getvalue()
+
+
+def _init_worker(input_path):
+    global _worker_pages
+    _worker_pages = LazyPages(PdfReader(input_path))
+
+
+def _render_in_worker(page_nums):
+    return [render_page(_worker_pages, n) for n in page_nums]
+
+
+def iter_parts(input_path, pages, page_nums, jobs=1):
+    """
+    Yield (filename, pdf_bytes) for each page in page_nums, in order.
+
+    With jobs > 1, worker processes build pages ahead of the consumer; results
+    are still yielded in page order, so a single writer can stream them. At most
+    jobs * 2 chunks are in flight, so a slow writer (e.g. on a network share)
+    holds back the workers instead of letting rendered pages pile up in memory.
+    """
+    if jobs <= 1 or len(page_nums) < 2:
+        for n in page_nums:
+            yield f"page_{n + 1:03d}.pdf", render_page(pages, n)
+        return
+    chunksize = max(1, min(16, len(page_nums) // (jobs * 4)))
+    chunks = (page_nums[i:i + chunksize] for i in range(0, len(page_nums), chunksize))
+    pending = deque()
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker, initargs=(str(input_path),)) as pool:
+        for chunk in chunks:
+            pending.append((chunk, pool.submit(_render_in_worker, chunk)))
+            if len(pending) >= jobs * 2:
+                done, future = pending.popleft()
+                yield from zip((f"page_{n + 1:03d}.pdf" for n in done), future.result())
+        while pending:
+            done, future = pending.popleft()
+            yield from zip((f"page_{n + 1:03d}.pdf" for n in done), future.result())
+
+
+def write_parts(parts, output_dir=None, archive=None, journal=None, mtime=0):
+    """
+    Write (filename, bytes) parts to a directory or into one archive stream.
+
+    Args:
+        parts: Iterable of (filename, bytes), consumed once in order
+        output_dir: Directory for individual files (created if missing)
+        archive: 'out.zip', 'out.tar', 'out.tar.gz'/'out.tgz', or '-' for a tar on stdout
+        journal: Optional Journal; each page file is recorded once it is in place
+        mtime: Timestamp (epoch seconds) stamped on archive entries
+
+    Returns:
+        Number of parts written
+    """
+    count = 0
+    if archive is None:
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        for name, data in parts:
+            atomic_write(output_dir / name, data)
+            if journal:
+                journal.record(name, output_dir / name)
+            count += 1
+        return count
+
+    if archive == '-':
+        return _write_archive(parts, archive, archive, mtime)
+    with atomic_output(archive) as tmp:
+        return _write_archive(parts, archive, tmp, mtime)
+
+
+def archive_mtime(input_path):
+    """Timestamp for archive entries: $SOURCE_DATE_EPOCH if set, else the input file's mtime."""
+    epoch = os.environ.get('SOURCE_DATE_EPOCH', '')
+    if epoch.isdigit():
+        return int(epoch)
+    return int(os.stat(input_path).st_mtime)
+
+
+def _write_archive(parts, archive, target, mtime):
+    # Fixed timestamps (no gzip file name either) so the same split gives the same archive
+    count = 0
+    if archive.lower().endswith('.zip'):
+        date_time = max(time.gmtime(mtime)[:6], (1980, 1, 1, 0, 0, 0))
+        with zipfile.ZipFile(target, 'w', zipfile.ZIP_DEFLATED) as zf:
+            for name, data in parts:
+                info = zipfile.ZipInfo(name, date_time)
+                info.compress_type = zipfile.ZIP_DEFLATED
+                info.external_attr = 0o644 << 16
+                zf.writestr(info, data)
+                count += 1
+        return count
+
+    with contextlib.ExitStack() as stack:
+        if archive == '-':
+            tf = tarfile.open(fileobj=sys.stdout.buffer, mode='w|')
+        elif archive.lower().endswith(('.tar.gz', '.tgz')):
+            raw = stack.enter_context(open(target, 'wb'))
+            gz = stack.enter_context(gzip.GzipFile(filename='', mode='wb', fileobj=raw, mtime=mtime))
+            tf = tarfile.open(fileobj=gz, mode='w')
+        else:
+            tf = tarfile.open(target, 'w')
+        with tf:
+            for name, data in parts:
+                info = tarfile.TarInfo(name)
+                info.size = len(data)
+                info.mtime = mtime
+                info.mode = 0o644
+                tf.addfile(info, io.BytesIO(data))
+                count += 1
+    return count
+
+
+def split_pdf(input_path, output_dir, page_range='all', archive=None, jobs=1, resume=False, journal_path=None):
     """
     Split a PDF into individual pages or extract a specific page range.
 
     Args:
         input_path: Path to source PDF
-        output_dir: Directory for output files
+        output_dir: Directory for output files (ignored when archive is set)
         page_range: Page range string or 'all'
+        archive: Optional .zip/.tar/.tar.gz path, or '-' for a tar stream on stdout
+        jobs: Worker processes building pages in parallel
+        resume: Journal finished pages and skip those already done by an earlier run
+        journal_path: Journal file (default: <output_dir>/.split_pdf.journal)
     """
-    output_dir = Path(output_dir)
-    output_dir.mkdir(parents=True, exist_ok=True)
+    # With a tar on stdout, stdout carries the archive
+    log = sys.stderr if archive == '-' else sys.stdout
+
+    if archive not in (None, '-') and not archive.lower().endswith(_ARCHIVE_SUFFIXES):
+        print(f"Error: --archive must end in .zip, .tar, .tar.gz or .tgz (or be -). Got: {archive}", file=log)
+        sys.exit(1)
+    if resume and archive is not None:
+        print("Error: --resume needs directory output; archives are written atomically but in one go", file=log)
+        sys.exit(1)
 
     reader = PdfReader(input_path)
-    total_pages = len(reader.pages)
+    # Resolve only the requested pages, not the whole page tree
+    pages = LazyPages(reader)
+    total_pages = len(pages)
     pages_to_extract = parse_page_range(page_range, total_pages)
 
     if not pages_to_extract:
-        print("Error: No valid pages found in the specified range")
+        print("Error: No valid pages found in the specified range", file=log)
         sys.exit(1)
 
-    # If extracting multiple pages, save each as a separate file
-    for page_num in pages_to_extract:
-        writer = PdfWriter()
-        writer.add_page(reader.pages[page_num])
-
-        output_filename = f"page_{page_num + 1:03d}.pdf"
-        output_path = output_dir / output_filename
+    journal = None
+    todo = pages_to_extract
+    if resume:
+        job = {'script': 'split_pdf', 'input': input_fingerprint([input_path]), 'pages': page_range}
+        journal = Journal(journal_path or Path(output_dir) / '.split_pdf.journal', job, resume=True)
+        if journal.stale:
+            print("⚠️  Journal was for a different input or page range; starting over", file=log)
+        todo = [n for n in pages_to_extract
+                if not journal.is_done(f"page_{n + 1:03d}.pdf", Path(output_dir) / f"page_{n + 1:03d}.pdf")]
 
-        with open(output_path, 'wb') as f:
-            writer.write(f)
+    # Pages are built (optionally in parallel) and written one at a time, in order
+    try:
+        write_parts(iter_parts(input_path, pages, todo, jobs), output_dir, archive, journal,
+                    archive_mtime(input_path))
+    finally:
+        if journal:
+            journal.close()
+    if journal:
+        journal.finish()
 
-    print(f"✅ Extracted {len(pages_to_extract)}/{total_pages} page(s)")
-    print(f"   Output directory: {output_dir}")
+    print(f"✅ Extracted {len(pages_to_extract)}/{total_pages} page(s)", file=log)
+    if len(todo) < len(pages_to_extract):
+        print(f"   Resumed: {len(pages_to_extract) - len(todo)} page(s) already done", file=log)
+    if archive is None:
+        print(f"   Output directory: {output_dir}", file=log)
+    elif archive != '-':
+        print(f"   Archive: {archive}", file=log)
 
 
 def main():
     args = sys.argv[1:]
+    if args and args[0] in ('-h', '--help'):
+        print(__doc__.strip())
+        sys.exit(0)
     page_range = 'all'
+    archive = None
+    jobs = 1
+    journal_path = None
+    resume = '--resume' in args
+    if resume:
+        args.remove('--resume')
 
     # Parse --pages option
     if '--pages' in args:
@@ -94,12 +280,41 @@ def main():
         page_range = args[idx + 1]
         args = args[:idx] + args[idx + 2:]
 
-    if len(args) != 2:
-        print("Usage: split_pdf.py <input.pdf> <output_dir> [--pages <page_range>]")
+    if '--archive' in args:
+        idx = args.index('--archive')
+        if idx + 1 >= len(args):
+            print("Error: --archive requires a path or -")
+            sys.exit(1)
+        archive = args[idx + 1]
+        args = args[:idx] + args[idx + 2:]
+
+    if '--jobs' in args:
+        idx = args.index('--jobs')
+        try:
+            jobs = int(args[idx + 1])
+        except (IndexError, ValueError):
+            print("Error: --jobs requires an integer")
+            sys.exit(1)
+        args = args[:idx] + args[idx + 2:]
+
+    if '--journal' in args:
+        idx = args.index('--journal')
+        if idx + 1 >= len(args):
+            print("Error: --journal requires a file path")
+            sys.exit(1)
+        journal_path = args[idx + 1]
+        args = args[:idx] + args[idx + 2:]
+
+    if len(args) != (1 if archive else 2):
+        print("Usage: split_pdf.py <input.pdf> <output_dir> [--pages <page_range>] [--jobs <n>] "
+              "[--resume [--journal <file>]]")
+        print("       split_pdf.py <input.pdf> --archive <out.zip|out.tar|out.tar.gz|-> "
+              "[--pages <page_range>] [--jobs <n>]")
         sys.exit(1)
 
-    input_path, output_dir = args
-    split_pdf(input_path, output_dir, page_range)
+    input_path = args[0]
+    output_dir = args[1] if len(args) == 2 else None
+    split_pdf(input_path, output_dir, page_range, archive, jobs, resume, journal_path)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""
+Tooling Benchmark - Measures validate/package/smoke throughput on a synthetic skill corpus
+
+Usage:
+    benchmark.py [--sizes <n,n,...>] [--profiles <p,p,...>] [--baseline <file.json>]
+                 [--save-baseline <file.json>] [--tolerance <fraction>] [--no-memory] [--keep <dir>]
+
+Options:
+    --sizes           Corpus sizes (number of skills). Default: 1,100
+    --profiles        Skill shapes to generate. Default: small,large,deep
+                        small - short SKILL.md, two small references, two scripts
+                        large - ~256 KB SKILL.md and four ~256 KB references
+                        deep  - small docs plus a scripts/ tree 6 levels deep
+    --baseline        Compare skills/sec against a stored baseline and exit 1 on regression
+    --save-baseline   Write this run's results as a baseline JSON
+    --tolerance       Allowed slowdown vs baseline before failing. Default: 0.2 (20%)
+    --no-memory       Skip tracemalloc peak-memory tracking (faster, more accurate timings)
+    --keep <dir>      Generate the corpus in <dir> and keep it (default: temp dir, removed)
+
+Examples:
+    benchmark.py
+    benchmark.py --sizes 1,100,5000 --profiles small --save-baseline bench_baseline.json
+    benchmark.py --baseline bench_baseline.json
+"""
+
+import contextlib
+import io
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+import context_budget
+import quick_validate
+from package_skill import package_skill
+from smoke_test import _count_example_prompts
+
+
+PROFILES = ('small', 'large', 'deep')
+
+_PARAGRAPH = (
+    "Run the bundled script with the input file and verify the output matches the expected invariants. "
+    "If the command fails, check the troubleshooting reference and retry with the corrected arguments.\n\n"
+)
+
+
+def _skill_md(name, profile):
+    filler = _PARAGRAPH * (2600 if profile == 'large' else 3)
+    ref_links = "\n".join(f"- [`references/ref-{i}.md`](references/ref-{i}.md) - Reference {i}" for i in range(_ref_count(profile)))
+    deep_note = "\nHelpers live in `scripts/pkg/` (nested modules).\n" if profile == 'deep' else ""
+    return f"""---
+name: {name}
+description: This skill guides a complete benchmark workflow from reading input, through running scripts, to verifying output. This skill must be loaded whenever user asks to run the {name} benchmark task.
+metadata:
+  version: 1.0.0
+  changelog: {name}/CHANGELOG.md
+---
+# {name}
+
+## Overview
+
+Synthetic skill generated for tooling benchmarks.
+
+## Workflow
+
+1. Run `scripts/run.py` with "the sample input file" as argument.
+2. Run `scripts/check.py` to verify "the generated output file".
+{deep_note}
+{filler}
+## References
+
+{ref_links}
+"""
+
+
+def _ref_count(profile):
+    return 4 if profile == 'large' else 2
+
+
+def generate_skill(root, name, profile):
+    """Write one synthetic skill named name under root using the given profile."""
+    skill = Path(root) / name
+    (skill / 'references').mkdir(parents=True)
+    (skill / 'scripts').mkdir()
+    (skill / 'SKILL.md').write_text(_skill_md(name, profile), encoding='utf-8')
+    (skill / 'CHANGELOG.md').write_text(f"# Changelog\n\n## [1.0.0] - 19 Oct 2026 00:00\n\n### Added\n\n- {name}\n", encoding='utf-8')
+
+    ref_body = _PARAGRAPH * (2600 if profile == 'large' else 5)
+    for i in range(_ref_count(profile)):
+        (skill / 'references' / f'ref-{i}.md').write_text(f"# Reference {i}\n\n{ref_body}", encoding='utf-8')
+
+    script = '#!/usr/bin/env python3\n"""Benchmark helper"""\n\n\ndef main():\n    pass\n\n\nif __name__ == "__main__":\n    main()\n'
+    (skill / 'scripts' / 'run.py').write_text(script, encoding='utf-8')
+    (skill / 'scripts' / 'check.py').write_text(script, encoding='utf-8')
+
+    if profile == 'deep':
+        level = skill / 'scripts' / 'pkg'
+        for depth in range(6):
+            level.mkdir()
+            for j in range(8):
+                (level / f'mod_{depth}_{j}.py').write_text(script, encoding='utf-8')
+            level = level / f'level{depth}'
+    return skill
+
+
+def generate_corpus(root, count, profile):
+    """Generate count skills of one profile under root; returns list of skill paths."""
+    return [generate_skill(root, f"bench-{profile}-{i:05d}", profile) for i in range(count)]
+
+
+def _measure(fn, items, track_memory):
+    """Run fn over items; returns (elapsed_seconds, peak_kb or None, failures)."""
+    if track_memory:
+        tracemalloc.start()
+    failures = 0
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        for item in items:
+            if not fn(item):
+                failures += 1
+    elapsed = time.perf_counter() - start
+    peak_kb = None
+    if track_memory:
+        peak_kb = tracemalloc.get_traced_memory()[1] // 1024
+        tracemalloc.stop()
+    return elapsed, peak_kb, failures
+
+
+def _smoke(skill):
+    valid, _ = quick_validate.validate_skill(skill, comprehensive=True)
+    _count_example_prompts((skill / 'SKILL.md').read_text(encoding='utf-8', errors='replace'))
+    context_budget.analyze_context(skill)
+    return valid
+
+
+def run_case(root, count, profile, track_memory=True):
+    """Generate one corpus and benchmark validate, smoke and package on it."""
+    case_dir = Path(root) / f"{profile}-{count}"
+    gen_start = time.perf_counter()
+    skills = generate_corpus(case_dir / 'skills', count, profile)
+    gen_time = time.perf_counter() - gen_start
+    dist = case_dir / 'dist'
+
+    result = {'skills': count, 'profile': profile, 'generate_s': round(gen_time, 4)}
+    ops = {
+        'validate': lambda s: quick_validate.validate_skill(s, comprehensive=True)[0],
+        'smoke': _smoke,
+        'package': lambda s: package_skill(s, dist) is not None,
+    }
+    for op, fn in ops.items():
+        quick_validate.reset_rule_timings()
+        elapsed, peak_kb, failures = _measure(fn, skills, track_memory)
+        result[op] = {
+            'seconds': round(elapsed, 4),
+            'skills_per_sec': round(count / elapsed, 2) if elapsed else None,
+            'peak_kb': peak_kb,
+            'failures': failures,
+            'rules_ms': {k: round(v[1] * 1000, 2) for k, v in sorted(quick_validate.RULE_TIMINGS.items())},
+        }
+    return result
+
+
+def compare_to_baseline(results, baseline, tolerance):
+    """Return a list of regression messages (skills/sec below baseline by more than tolerance)."""
+    regressions = []
+    for key, case in results.items():
+        base_case = baseline.get('cases', {}).get(key)
+        if not base_case:
+            continue
+        for op in ('validate', 'smoke', 'package'):
+            now = case.get(op, {}).get('skills_per_sec')
+            before = base_case.get(op, {}).get('skills_per_sec')
+            if now and before and now < before * (1 - tolerance):
+                regressions.append(f"{key} {op}: {now:.1f} skills/s vs baseline {before:.1f} ({(now / before - 1) * 100:+.0f}%)")
+    return regressions
+
+
+def _pop_option(args, name, default):
+    if name not in args:
+        return default
+    idx = args.index(name)
+    if idx + 1 >= len(args):
+        print(f"Error: {name} requires a value")
+        sys.exit(1)
+    value = args[idx + 1]
+    del args[idx:idx + 2]
+    return value
+
+
+def main():
+    args = sys.argv[1:]
+    if args and args[0] in ('-h', '--help'):
+        print(__doc__.strip())
+        sys.exit(0)
+    track_memory = '--no-memory' not in args
+    if not track_memory:
+        args.remove('--no-memory')
+    try:
+        sizes = [int(n) for n in _pop_option(args, '--sizes', '1,100').split(',')]
+        tolerance = float(_pop_option(args, '--tolerance', '0.2'))
+    except ValueError:
+        print("Error: --sizes takes comma-separated integers and --tolerance a number")
+        sys.exit(1)
+    profiles = _pop_option(args, '--profiles', ','.join(PROFILES)).split(',')
+    baseline_path = _pop_option(args, '--baseline', None)
+    save_path = _pop_option(args, '--save-baseline', None)
+    keep_dir = _pop_option(args, '--keep', None)
+
+    unknown = [p for p in profiles if p not in PROFILES]
+    if args or unknown:
+        print("Usage: benchmark.py [--sizes <n,n,...>] [--profiles small,large,deep] [--baseline <file>] "
+              "[--save-baseline <file>] [--tolerance <fraction>] [--no-memory] [--keep <dir>]")
+        sys.exit(1)
+
+    root = Path(keep_dir) if keep_dir else Path(tempfile.mkdtemp(prefix="skill-bench-"))
+    root.mkdir(parents=True, exist_ok=True)
+    # Keep the token cache inside the corpus so runs start cold and don't touch the user cache
+    os.environ['SKILL_MAKER_CACHE'] = str(root / '.cache')
+
+    results = {}
+    try:
+        for profile in profiles:
+            for count in sizes:
+                key = f"{profile}-{count}"
+                print(f"⏱️  {key}: generating and benchmarking...")
+                case = run_case(root, count, profile, track_memory)
+                results[key] = case
+                for op in ('validate', 'smoke', 'package'):
+                    r = case[op]
+                    mem = f"  peak {r['peak_kb']} KB" if r['peak_kb'] is not None else ""
+                    fail = f"  ({r['failures']} failed)" if r['failures'] else ""
+                    print(f"   {op:<8} {r['skills_per_sec']:>9} skills/s  {r['seconds']:.3f}s{mem}{fail}")
+                    slowest = sorted(r['rules_ms'].items(), key=lambda kv: -kv[1])[:4]
+                    print("            slowest rules: " + ", ".join(f"{k} {v}ms" for k, v in slowest))
+    finally:
+        if not keep_dir:
+            shutil.rmtree(root, ignore_errors=True)
+
+    if save_path:
+        Path(save_path).write_text(json.dumps({'python': sys.version.split()[0], 'cases': results}, indent=2) + "\n", encoding='utf-8')
+        print(f"\n💾 Baseline saved to: {save_path}")
+
+    if baseline_path:
+        baseline = json.loads(Path(baseline_path).read_text(encoding='utf-8'))
+        regressions = compare_to_baseline(results, baseline, tolerance)
+        if regressions:
+            print(f"\n❌ {len(regressions)} regression(s) vs {baseline_path} (tolerance {tolerance:.0%}):")
+            for r in regressions:
+                print(f"  - {r}")
+            sys.exit(1)
+        print(f"\n✅ No regressions vs {baseline_path} (tolerance {tolerance:.0%})")
+
+
+if __name__ == "__main__":
+    main()
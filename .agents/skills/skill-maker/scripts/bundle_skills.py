@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+Skill Bundler - Packages every skill in a directory plus a JSON manifest index
+
+Usage:
+    bundle_skills.py <skills-root> [output-directory] [--per-skill] [--name <bundle>] [--jobs <n>] [--skip-invalid]
+
+Options:
+    --per-skill      Write one <skill>.zip per skill instead of a single bundle archive
+    --name <bundle>  Bundle archive name (without .zip). Default: skills-bundle
+    --jobs <n>       Skills processed concurrently. Default: CPU count
+    --skip-invalid   Leave out skills that fail validation instead of aborting
+
+Output:
+    Single archive: <bundle>.zip containing every skill folder and manifest.json,
+    plus <bundle>.manifest.json next to it.
+    Per-skill:      <skill>.zip for each skill plus manifest.json.
+
+    The manifest lists, per skill: name, version, description, archive, and every
+    file with size and SHA-256. Read it from the sidecar file, or from the bundle
+    with zipfile.ZipFile(path).read('manifest.json') - no extraction needed.
+
+Examples:
+    bundle_skills.py .agents/skills ./dist
+    bundle_skills.py .agents/skills ./dist --per-skill --jobs 8
+"""
+
+import hashlib
+import json
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+from package_skill import collect_files
+from quick_validate import validate_basic, validate_skill
+from zip_writer import write_deterministic_zip
+
+MANIFEST_NAME = 'manifest.json'
+MANIFEST_FORMAT = 1
+
+
+def frontmatter_value(frontmatter, key):
+    """Return a scalar frontmatter value (quotes stripped), or None."""
+    match = re.search(rf'(?m)^\s*{key}:\s*(.+)$', frontmatter)
+    if not match:
+        return None
+    return match.group(1).strip().strip('"').strip("'")
+
+
+def _sha256(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def find_skills(skills_root):
+    """Return sorted skill directories (direct children containing SKILL.md)."""
+    return sorted(p for p in Path(skills_root).resolve().iterdir() if (p / 'SKILL.md').is_file())
+
+
+def scan_skill(skill_path, output_dir=None):
+    """
+    Validate one skill and collect its manifest record.
+
+    If output_dir is given, also write <skill>.zip there (per-skill mode).
+
+    Returns: dict with 'ok', 'message', 'record' (manifest entry) and 'entries'
+    ((arcname, path) pairs for bundling)
+    """
+    skill_path = Path(skill_path)
+    valid, message = validate_skill(skill_path, comprehensive=True)
+    if not valid:
+        return {'ok': False, 'name': skill_path.name, 'message': message, 'record': None, 'entries': []}
+
+    _, _, details = validate_basic(skill_path)
+    frontmatter = details.get('frontmatter', '')
+    paths = collect_files(skill_path)
+    entries = [(p.relative_to(skill_path.parent).as_posix(), p) for p in paths]
+    files = [
+        {'path': p.relative_to(skill_path).as_posix(), 'size': p.stat().st_size, 'sha256': _sha256(p)}
+        for p in paths
+    ]
+    record = {
+        'name': frontmatter_value(frontmatter, 'name') or skill_path.name,
+        'version': frontmatter_value(frontmatter, 'version'),
+        'description': frontmatter_value(frontmatter, 'description'),
+        'path': skill_path.name + '/',
+        'archive': None,
+        'total_size': sum(f['size'] for f in files),
+        'files': files,
+    }
+
+    if output_dir is not None:
+        zip_path = Path(output_dir) / f"{skill_path.name}.zip"
+        # One worker per skill already; compress this skill's files serially
+        write_deterministic_zip(zip_path, entries, jobs=1)
+        record['archive'] = zip_path.name
+
+    return {'ok': True, 'name': skill_path.name, 'message': message, 'record': record, 'entries': entries}
+
+
+def build_manifest(records):
+    """Return manifest JSON bytes (deterministic: sorted keys, no timestamps)."""
+    manifest = {
+        'format': MANIFEST_FORMAT,
+        'generator': 'skill-maker bundle_skills',
+        'skills': sorted(records, key=lambda r: r['name']),
+    }
+    return (json.dumps(manifest, indent=2, sort_keys=True, ensure_ascii=False) + "\n").encode('utf-8')
+
+
+def bundle_skills(skills_root, output_dir=None, per_skill=False, name='skills-bundle', jobs=None, skip_invalid=False):
+    """
+    Package every skill under skills_root.
+
+    Args:
+        skills_root: Directory whose children are skill folders
+        output_dir: Output directory (defaults to current directory)
+        per_skill: Write one zip per skill instead of one bundle archive
+        name: Bundle archive name without extension (single-archive mode)
+        jobs: Skills scanned/packaged concurrently (defaults to CPU count)
+        skip_invalid: Omit skills that fail validation instead of aborting
+
+    Returns:
+        Path to the manifest file, or None if error
+    """
+    if not Path(skills_root).is_dir():
+        print(f"❌ Error: Skills root is not a directory: {skills_root}")
+        return None
+
+    skills = find_skills(skills_root)
+    if not skills:
+        print(f"❌ Error: No skills (folders with SKILL.md) found in {skills_root}")
+        return None
+
+    output_path = Path(output_dir).resolve() if output_dir else Path.cwd()
+    output_path.mkdir(parents=True, exist_ok=True)
+
+    jobs = max(1, min(jobs or os.cpu_count() or 1, len(skills)))
+    print(f"🔍 Validating {len(skills)} skill(s) with {jobs} worker(s)...")
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        results = list(pool.map(scan_skill, skills, [output_path if per_skill else None] * len(skills)))
+
+    failed = [r for r in results if not r['ok']]
+    for r in failed:
+        print(f"❌ {r['name']}: {r['message'].splitlines()[0]}")
+    if failed and not skip_invalid:
+        print(f"\n❌ {len(failed)} skill(s) failed validation - fix them or pass --skip-invalid")
+        return None
+
+    ok = [r for r in results if r['ok']]
+    for r in ok:
+        print(f"  ✅ {r['record']['name']} {r['record']['version'] or ''} ({len(r['record']['files'])} file(s))")
+
+    records = [r['record'] for r in ok]
+    if per_skill:
+        manifest_path = output_path / MANIFEST_NAME
+        manifest_path.write_bytes(build_manifest(records))
+        print(f"\n✅ Packaged {len(ok)} skill(s) into {output_path}")
+    else:
+        bundle_path = output_path / f"{name}.zip"
+        for record in records:
+            record['archive'] = bundle_path.name
+        manifest = build_manifest(records)
+        entries = [e for r in ok for e in r['entries']] + [(MANIFEST_NAME, manifest)]
+        write_deterministic_zip(bundle_path, entries, jobs=jobs)
+        manifest_path = output_path / f"{name}.manifest.json"
+        manifest_path.write_bytes(manifest)
+        print(f"\n✅ Bundled {len(ok)} skill(s) into: {bundle_path}")
+
+    print(f"   Manifest: {manifest_path}")
+    return manifest_path
+
+
+def _usage():
+    print("Usage: bundle_skills.py <skills-root> [output-directory] [--per-skill] [--name <bundle>] [--jobs <n>] [--skip-invalid]")
+    print("\nExample:")
+    print("  bundle_skills.py .agents/skills ./dist")
+    print("  bundle_skills.py .agents/skills ./dist --per-skill")
+
+
+def main():
+    args = sys.argv[1:]
+    if args and args[0] in ('-h', '--help'):
+        _usage()
+        sys.exit(0)
+    flags = {}
+    for flag in ('--per-skill', '--skip-invalid'):
+        flags[flag] = flag in args
+        if flags[flag]:
+            args.remove(flag)
+    name = 'skills-bundle'
+    jobs = None
+    for opt in ('--name', '--jobs'):
+        if opt in args:
+            idx = args.index(opt)
+            if idx + 1 >= len(args):
+                print(f"Error: {opt} requires a value")
+                sys.exit(1)
+            value = args[idx + 1]
+            args = args[:idx] + args[idx + 2:]
+            if opt == '--name':
+                name = value
+            else:
+                try:
+                    jobs = int(value)
+                except ValueError:
+                    print("Error: --jobs requires an integer")
+                    sys.exit(1)
+
+    if len(args) < 1:
+        _usage()
+        sys.exit(1)
+
+    skills_root = args[0]
+    output_dir = args[1] if len(args) > 1 else None
+    result = bundle_skills(skills_root, output_dir, flags['--per-skill'], name, jobs, flags['--skip-invalid'])
+    sys.exit(0 if result else 1)
+
+
+if __name__ == "__main__":
+    main()
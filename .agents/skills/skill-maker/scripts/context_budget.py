@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""
+Context Budget Analyzer - Estimates how many tokens a skill loads into context
+
+Usage:
+    context_budget.py <skill_directory> [--budget <tokens>] [--strict]
+
+Options:
+    --budget <tokens>   Max tokens for the mandatory load (SKILL.md + references
+                        SKILL.md says to load up front). Default: 8000
+    --strict            Exit non-zero when the mandatory load exceeds the budget
+
+Notes:
+    Token counts use tiktoken (cl100k_base) when installed, otherwise a
+    ~4 characters/token estimate. Counts are cached per file content hash in
+    memory; this command (and quick_validate.py --cache-tokens) also keeps
+    them in $SKILL_MAKER_CACHE (default: ~/.cache/skill-maker). Other callers
+    only write that cache when $SKILL_MAKER_CACHE is set explicitly.
+
+Examples:
+    context_budget.py skills/public/my-skill
+    context_budget.py skills/public/my-skill --budget 4000 --strict
+"""
+
+import hashlib
+import json
+import math
+import os
+import re
+import sys
+from pathlib import Path
+
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+
+DEFAULT_BUDGET = 8000
+
+# Phrases that make a reference part of every invocation rather than an on-demand load
+_MANDATORY_RE = re.compile(
+    r'\b(immediately|before (starting|beginning|any)|up ?front|always load|'
+    r'must (be )?load(ed)?|mandatory|non[- ]negotiable|do not begin)\b',
+    re.IGNORECASE,
+)
+_HEADING_RE = re.compile(r'^#{1,6}\s')
+
+_encoder = None
+_memory_cache = {}  # Token counts for this process, persisted or not
+
+
+def _tokenizer_name():
+    return "cl100k_base" if tiktoken is not None else "chars/4"
+
+
+def estimate_tokens(text):
+    """Estimate the token count of text (tiktoken if available, else ~4 chars/token)."""
+    global _encoder
+    if tiktoken is not None:
+        if _encoder is None:
+            _encoder = tiktoken.get_encoding("cl100k_base")
+        return len(_encoder.encode(text, disallowed_special=()))
+    return max(math.ceil(len(text) / 4), len(text.split()))
+
+
+def _cache_path():
+    base = os.environ.get("SKILL_MAKER_CACHE") or Path.home() / ".cache" / "skill-maker"
+    return Path(base) / "context_tokens.json"
+
+
+def _load_cache():
+    try:
+        return json.loads(_cache_path().read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_cache(cache):
+    path = _cache_path()
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(cache, sort_keys=True), encoding="utf-8")
+        os.replace(tmp, path)
+    except OSError:
+        pass  # The cache is an optimization; never fail the analysis over it
+
+
+def _mandatory_references(skill_md_text):
+    """Return the set of references/*.md paths SKILL.md instructs to load on every invocation."""
+    mandatory = set()
+    # Split the body into heading sections; a load instruction applies to its whole section
+    sections = []
+    current = []
+    for line in skill_md_text.splitlines():
+        if _HEADING_RE.match(line) and current:
+            sections.append(current)
+            current = []
+        current.append(line)
+    sections.append(current)
+
+    for section in sections:
+        text = "\n".join(section)
+        if not _MANDATORY_RE.search(text):
+            continue
+        mandatory.update(re.findall(r'references/[\w.-]+\.md', text))
+    return mandatory
+
+
+def analyze_context(skill_path, persist=None):
+    """
+    Estimate tokens for SKILL.md and each references/*.md file.
+
+    Args:
+        skill_path: Path to skill directory
+        persist: Read and write the on-disk token cache; None (default) does so
+            only when $SKILL_MAKER_CACHE is set. Counts are always cached in memory.
+
+    Returns: dict with
+      - 'files': list of {'path', 'tokens', 'bytes', 'load'} where load is
+                 'mandatory' or 'on-demand'
+      - 'mandatory_tokens': tokens loaded on every invocation
+      - 'total_tokens': tokens if every reference is loaded
+      - 'tokenizer': name of the token estimator used
+    """
+    skill_path = Path(skill_path).resolve()
+    skill_md = skill_path / "SKILL.md"
+    paths = [skill_md] + sorted((skill_path / "references").glob("*.md"))
+    paths = [p for p in paths if p.is_file()]
+
+    tokenizer = _tokenizer_name()
+    if persist is None:
+        persist = bool(os.environ.get("SKILL_MAKER_CACHE"))
+    cache = _memory_cache
+    if persist:
+        cache.update(_load_cache())
+    dirty = False
+    files = []
+    skill_md_text = ""
+    for p in paths:
+        data = p.read_bytes()
+        text = data.decode("utf-8", errors="replace")
+        if p == skill_md:
+            skill_md_text = text
+        key = f"{tokenizer}:{hashlib.sha256(data).hexdigest()}"
+        tokens = cache.get(key)
+        if tokens is None:
+            tokens = estimate_tokens(text)
+            cache[key] = tokens
+            dirty = True
+        files.append({'path': p.relative_to(skill_path).as_posix(), 'tokens': tokens, 'bytes': len(data)})
+
+    if persist and dirty:
+        _save_cache(cache)
+
+    mandatory = _mandatory_references(skill_md_text) | {"SKILL.md"}
+    for f in files:
+        f['load'] = 'mandatory' if f['path'] in mandatory else 'on-demand'
+
+    return {
+        'files': files,
+        'mandatory_tokens': sum(f['tokens'] for f in files if f['load'] == 'mandatory'),
+        'total_tokens': sum(f['tokens'] for f in files),
+        'tokenizer': tokenizer,
+    }
+
+
+def check_context_budget(skill_path, budget=DEFAULT_BUDGET, severity='warning', report=None, persist=None):
+    """
+    Compare the mandatory context load against budget (persist: see analyze_context()).
+
+    Returns: list of (severity, message) tuples (same shape as validate_comprehensive)
+    """
+    if report is None:
+        report = analyze_context(skill_path, persist)
+    if report['mandatory_tokens'] <= budget:
+        return []
+    heavy = sorted((f for f in report['files'] if f['load'] == 'mandatory'), key=lambda f: -f['tokens'])
+    top = ", ".join(f"{f['path']} (~{f['tokens']})" for f in heavy[:3])
+    return [(severity, f"Mandatory context load ~{report['mandatory_tokens']} tokens exceeds budget of {budget} "
+                       f"- largest: {top}. Move detail into on-demand references.")]
+
+
+def format_report(report, budget=DEFAULT_BUDGET):
+    """Render an analyze_context() report as aligned text lines."""
+    width = max([len(f['path']) for f in report['files']] + [4])
+    lines = [f"  {'File'.ljust(width)}  {'Tokens':>7}  Load"]
+    for f in report['files']:
+        lines.append(f"  {f['path'].ljust(width)}  {f['tokens']:>7}  {f['load']}")
+    lines.append(f"  Mandatory: ~{report['mandatory_tokens']} / {budget} tokens budget "
+                 f"(all references: ~{report['total_tokens']}; estimator: {report['tokenizer']})")
+    return lines
+
+
+def main():
+    args = sys.argv[1:]
+    if args and args[0] in ('-h', '--help'):
+        print(__doc__.strip())
+        sys.exit(0)
+    strict = '--strict' in args
+    if strict:
+        args.remove('--strict')
+    budget = DEFAULT_BUDGET
+    if '--budget' in args:
+        idx = args.index('--budget')
+        try:
+            budget = int(args[idx + 1])
+        except (IndexError, ValueError):
+            print("Error: --budget requires an integer token count")
+            sys.exit(1)
+        args = args[:idx] + args[idx + 2:]
+
+    if len(args) != 1:
+        print("Usage: context_budget.py <skill_directory> [--budget <tokens>] [--strict]")
+        sys.exit(1)
+
+    skill_path = Path(args[0])
+    if not (skill_path / "SKILL.md").exists():
+        print(f"Error: SKILL.md not found in {skill_path}")
+        sys.exit(1)
+
+    report = analyze_context(skill_path, persist=True)
+    print(f"📏 Context budget: {skill_path}")
+    for line in format_report(report, budget):
+        print(line)
+
+    issues = check_context_budget(skill_path, budget, report=report)
+    if issues:
+        print(f"\n{'❌' if strict else '⚠️ '} {issues[0][1]}")
+        sys.exit(1 if strict else 0)
+    print("\n✅ Within budget")
+
+
+if __name__ == "__main__":
+    main()
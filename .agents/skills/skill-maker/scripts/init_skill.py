@@ -4,20 +4,35 @@ Skill Initializer - Creates a new skill from template
 
 Usage:
     init_skill.py <skill-name> --path <path> [--minimal]
+    init_skill.py --manifest <skills.json|skills.yaml> [--path <default-path>] [--minimal] [--jobs <n>]
 
 Options:
     --minimal    Create only essential files (no example placeholders)
+    --manifest   Scaffold every skill in a manifest, in parallel. The manifest is a list
+                 (or {"skills": [...]}) of names or objects with "name" and optional
+                 "description", "minimal" and "path"; --path and --minimal are defaults.
+                 YAML manifests need PyYAML.
+    --jobs <n>   Skills built concurrently with --manifest. Default: CPU count
+
+Skills are assembled in a temporary directory and renamed into place, so an
+interrupted run never leaves a half-initialized skill. Existing skills are skipped.
 
 Examples:
     init_skill.py my-new-skill --path skills/public
     init_skill.py my-api-helper --path skills/private --minimal
     init_skill.py custom-skill --path /custom/location
+    init_skill.py --manifest catalog.json --path skills/public --jobs 8
 """
 
+import json
+import os
+import re
+import shutil
 import sys
-from pathlib import Path
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-import re
+from pathlib import Path
 
 
 SKILL_TEMPLATE = """---
@@ -131,37 +146,32 @@ def title_case_skill_name(skill_name):
     return ' '.join(word.capitalize() for word in skill_name.split('-'))
 
 
-def init_skill(skill_name, path, minimal=False):
-    """
-    Initialize a new skill directory with template SKILL.md.
+def validate_skill_name(skill_name):
+    """Return an error message if skill_name is not a valid skill name, else None."""
+    if len(skill_name) > 40:
+        return f"Skill name exceeds 40 characters ({len(skill_name)} chars)"
+    if not re.match(r'^[a-z0-9-]+$', skill_name):
+        return f"Skill name '{skill_name}' should be hyphen-case (lowercase letters, digits, and hyphens only)"
+    if skill_name.startswith('-') or skill_name.endswith('-') or '--' in skill_name:
+        return f"Skill name '{skill_name}' cannot start/end with hyphen or contain consecutive hyphens"
+    return None
 
-    Args:
-        skill_name: Name of the skill
-        path: Path where the skill directory should be created
-        minimal: If True, create only essential files
 
-    Returns:
-        Path to created skill directory, or None if error
+def _quote_description(description):
     """
-    # Determine skill directory path
-    skill_dir = Path(path).resolve() / skill_name
+    Render a description as a single-line YAML double-quoted scalar.
 
-    # Check if directory already exists
-    if skill_dir.exists():
-        print(f"Error: Skill directory already exists: {skill_dir}")
-        return None
+    Line breaks (e.g. from a YAML block scalar in a --manifest) are folded into
+    spaces: frontmatter readers expect the description on one line.
+    """
+    description = re.sub(r'\s*[\r\n]\s*', ' ', description.strip())
+    return '"' + description.replace('\\', '\\\\').replace('"', '\\"') + '"'
 
-    # Create skill directory
-    try:
-        skill_dir.mkdir(parents=True, exist_ok=False)
-        print(f"Created skill directory: {skill_dir}")
-    except Exception as e:
-        print(f"Error creating directory: {e}")
-        return None
 
-    # Create SKILL.md from template
+def _write_skill_files(skill_dir, skill_name, minimal, description=None, created=None, log=print):
+    """Write SKILL.md, CHANGELOG.md and resource directories into an existing skill_dir."""
     skill_title = title_case_skill_name(skill_name)
-    
+
     if minimal:
         resources_section = "Add `scripts/`, `references/`, and/or `assets/` as needed. Delete unused directories."
         skill_content = SKILL_TEMPLATE_MINIMAL.format(
@@ -180,61 +190,104 @@ def init_skill(skill_name, path, minimal=False):
             skill_title=skill_title,
             resources_section=resources_section
         )
+    if description:
+        skill_content = re.sub(r'(?m)^description: .*$', lambda m: 'description: ' + _quote_description(description),
+                               skill_content, count=1)
 
-    skill_md_path = skill_dir / 'SKILL.md'
-    try:
-        skill_md_path.write_text(skill_content)
-        print("Created SKILL.md")
-    except Exception as e:
-        print(f"Error creating SKILL.md: {e}")
-        return None
+    (skill_dir / 'SKILL.md').write_text(skill_content)
+    log("Created SKILL.md")
 
-    # Create CHANGELOG.md from template
-    current_datetime = datetime.now().strftime("%d %b %Y %H:%M")
     changelog_content = CHANGELOG_TEMPLATE.format(
         skill_name=skill_name,
-        datetime=current_datetime
+        datetime=created or datetime.now().strftime("%d %b %Y %H:%M")
     )
+    (skill_dir / 'CHANGELOG.md').write_text(changelog_content)
+    log("Created CHANGELOG.md")
+
+    # Always create directories structure (even if minimal)
+    scripts_dir = skill_dir / 'scripts'
+    references_dir = skill_dir / 'references'
+    assets_dir = skill_dir / 'assets'
+
+    scripts_dir.mkdir(exist_ok=True)
+    references_dir.mkdir(exist_ok=True)
+    assets_dir.mkdir(exist_ok=True)
+
+    if not minimal:
+        # Create example files
+        example_script = scripts_dir / 'example.py'
+        example_script.write_text(EXAMPLE_SCRIPT.format(skill_name=skill_name))
+        example_script.chmod(0o755)
+        log("Created scripts/example.py")
+
+        example_reference = references_dir / 'reference.md'
+        example_reference.write_text(EXAMPLE_REFERENCE.format(skill_title=skill_title))
+        log("Created references/reference.md")
+
+        example_asset = assets_dir / '.gitkeep'
+        example_asset.write_text(EXAMPLE_ASSET_PLACEHOLDER)
+        log("Created assets/ directory")
+    else:
+        log("Created scripts/, references/, assets/ directories (empty)")
+
+
+def build_skill(skill_name, path, minimal=False, description=None, created=None, log=print):
+    """
+    Scaffold a skill in a temporary sibling directory, then rename it into place.
 
-    changelog_path = skill_dir / 'CHANGELOG.md'
+    A failure at any point leaves nothing at the target path.
+
+    Returns:
+        Path to the created skill directory
+
+    Raises:
+        FileExistsError: if the skill directory already exists
+        OSError: if the files cannot be written or moved into place
+    """
+    parent = Path(path).resolve()
+    skill_dir = parent / skill_name
+    if skill_dir.exists():
+        raise FileExistsError(f"Skill directory already exists: {skill_dir}")
+
+    parent.mkdir(parents=True, exist_ok=True)
+    staging = Path(tempfile.mkdtemp(prefix=f".{skill_name}-", dir=parent))
     try:
-        changelog_path.write_text(changelog_content)
-        print("Created CHANGELOG.md")
-    except Exception as e:
-        print(f"Error creating CHANGELOG.md: {e}")
-        return None
+        build_dir = staging / skill_name
+        build_dir.mkdir()
+        _write_skill_files(build_dir, skill_name, minimal, description, created, log)
+        # rename() would replace an empty directory that appeared meanwhile; recheck first
+        if skill_dir.exists():
+            raise FileExistsError(f"Skill directory already exists: {skill_dir}")
+        os.rename(build_dir, skill_dir)
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
+    return skill_dir
+
 
-    # Create resource directories
+def init_skill(skill_name, path, minimal=False):
+    """
+    Initialize a new skill directory with template SKILL.md.
+
+    The skill is assembled in a temporary directory next to the target and
+    renamed into place, so a failure never leaves a half-initialized skill.
+
+    Args:
+        skill_name: Name of the skill
+        path: Path where the skill directory should be created
+        minimal: If True, create only essential files
+
+    Returns:
+        Path to created skill directory, or None if error
+    """
     try:
-        # Always create directories structure (even if minimal)
-        scripts_dir = skill_dir / 'scripts'
-        references_dir = skill_dir / 'references'
-        assets_dir = skill_dir / 'assets'
-        
-        scripts_dir.mkdir(exist_ok=True)
-        references_dir.mkdir(exist_ok=True)
-        assets_dir.mkdir(exist_ok=True)
-        
-        if not minimal:
-            # Create example files
-            example_script = scripts_dir / 'example.py'
-            example_script.write_text(EXAMPLE_SCRIPT.format(skill_name=skill_name))
-            example_script.chmod(0o755)
-            print("Created scripts/example.py")
-
-            example_reference = references_dir / 'reference.md'
-            example_reference.write_text(EXAMPLE_REFERENCE.format(skill_title=skill_title))
-            print("Created references/reference.md")
-
-            example_asset = assets_dir / '.gitkeep'
-            example_asset.write_text(EXAMPLE_ASSET_PLACEHOLDER)
-            print("Created assets/ directory")
-        else:
-            print("Created scripts/, references/, assets/ directories (empty)")
-            
-    except Exception as e:
-        print(f"Error creating resource directories: {e}")
+        skill_dir = build_skill(skill_name, path, minimal)
+    except FileExistsError as e:
+        print(f"Error: {e}")
         return None
+    except OSError as e:
+        print(f"Error creating skill: {e}")
+        return None
+    print(f"Created skill directory: {skill_dir}")
 
     # Print next steps
     print(f"\nSkill '{skill_name}' initialized at {skill_dir}")
@@ -253,17 +306,185 @@ def init_skill(skill_name, path, minimal=False):
     return skill_dir
 
 
+def load_manifest(manifest_path):
+    """
+    Read a batch manifest (.json, or .yaml/.yml with PyYAML installed).
+
+    The manifest is a list of entries, or a mapping with a 'skills' list. Each
+    entry is a skill name or a mapping with 'name' and optional 'description',
+    'minimal' and 'path'.
+
+    Returns: list of dicts with 'name', 'description', 'minimal', 'path'
+        ('minimal' is None when the entry does not set it)
+
+    Raises:
+        ValueError: if the manifest cannot be parsed or an entry is malformed
+    """
+    manifest_path = Path(manifest_path)
+    text = manifest_path.read_text(encoding='utf-8')
+    if manifest_path.suffix.lower() in ('.yaml', '.yml'):
+        try:
+            import yaml
+        except ImportError:
+            raise ValueError("YAML manifests need PyYAML. Run: pip install pyyaml (or use JSON)")
+        try:
+            data = yaml.safe_load(text)
+        except yaml.YAMLError as e:
+            raise ValueError(f"Invalid YAML in {manifest_path}: {e}")
+    else:
+        try:
+            data = json.loads(text)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid JSON in {manifest_path}: {e}")
+
+    if isinstance(data, dict):
+        data = data.get('skills')
+    if not isinstance(data, list):
+        raise ValueError("Manifest must be a list of skills or a mapping with a 'skills' list")
+
+    entries = []
+    for i, item in enumerate(data, start=1):
+        if isinstance(item, str):
+            item = {'name': item}
+        if not isinstance(item, dict) or not isinstance(item.get('name'), str):
+            raise ValueError(f"Manifest entry {i} needs a 'name'")
+        for key in ('description', 'path'):
+            if item.get(key) is not None and not isinstance(item[key], str):
+                raise ValueError(f"Manifest entry {i} ('{item['name']}'): '{key}' must be a string")
+        if item.get('minimal') is not None and not isinstance(item['minimal'], bool):
+            raise ValueError(f"Manifest entry {i} ('{item['name']}'): 'minimal' must be true or false")
+        entries.append({
+            'name': item['name'],
+            'description': item.get('description'),
+            'minimal': item.get('minimal'),
+            'path': item.get('path'),
+        })
+    return entries
+
+
+def init_skills_from_manifest(manifest_path, default_path=None, minimal=False, jobs=None):
+    """
+    Scaffold every skill listed in a manifest, in parallel.
+
+    Each skill is built in a temporary directory and renamed into place; skills
+    that already exist are skipped, and one failure does not stop the others.
+
+    Args:
+        manifest_path: JSON or YAML manifest (see load_manifest())
+        default_path: Target directory for entries without 'path'
+        minimal: Default for entries without 'minimal'
+        jobs: Concurrent workers (defaults to CPU count)
+
+    Returns:
+        dict with 'created', 'skipped' and 'failed' lists of (name, detail), or None if
+        the manifest itself is invalid
+    """
+    try:
+        entries = load_manifest(manifest_path)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}")
+        return None
+
+    problems = []
+    targets = {}
+    for entry in entries:
+        entry['path'] = entry['path'] or default_path
+        if entry['minimal'] is None:
+            entry['minimal'] = minimal
+        error = validate_skill_name(entry['name'])
+        if error:
+            problems.append(error)
+        if not entry['path']:
+            problems.append(f"'{entry['name']}' has no path (set 'path' or pass --path)")
+            continue
+        target = Path(entry['path']).resolve() / entry['name']
+        if target in targets:
+            problems.append(f"'{entry['name']}' is listed twice for {target.parent}")
+        targets[target] = entry
+    if problems:
+        print("Error: Invalid manifest:")
+        for problem in problems:
+            print(f"  - {problem}")
+        return None
+
+    created = datetime.now().strftime("%d %b %Y %H:%M")
+
+    def build(entry):
+        try:
+            skill_dir = build_skill(entry['name'], entry['path'], entry['minimal'], entry['description'],
+                                    created, log=lambda _msg: None)
+            return 'created', entry['name'], str(skill_dir)
+        except FileExistsError as e:
+            return 'skipped', entry['name'], str(e)
+        except OSError as e:
+            return 'failed', entry['name'], str(e)
+
+    summary = {'created': [], 'skipped': [], 'failed': []}
+    workers = max(1, min(jobs or os.cpu_count() or 1, len(entries)))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for status, name, detail in pool.map(build, entries):
+            summary[status].append((name, detail))
+    return summary
+
+
+def _print_summary(summary):
+    for name, detail in summary['created']:
+        print(f"  ✅ {name}: {detail}")
+    for name, detail in summary['skipped']:
+        print(f"  ⏭️  {name}: {detail}")
+    for name, detail in summary['failed']:
+        print(f"  ❌ {name}: {detail}")
+    print(f"\nCreated {len(summary['created'])}, skipped {len(summary['skipped'])}, "
+          f"failed {len(summary['failed'])}")
+
+
+def _pop_value(args, name):
+    if name not in args:
+        return None
+    idx = args.index(name)
+    if idx + 1 >= len(args):
+        print(f"Error: {name} requires a value")
+        sys.exit(1)
+    value = args[idx + 1]
+    del args[idx:idx + 2]
+    return value
+
+
 def main():
     # Parse arguments
     args = sys.argv[1:]
+    if args and args[0] in ('-h', '--help'):
+        print(__doc__.strip())
+        sys.exit(0)
     minimal = '--minimal' in args
     if minimal:
         args.remove('--minimal')
-    
+
+    manifest = _pop_value(args, '--manifest')
+    if manifest:
+        path = _pop_value(args, '--path')
+        jobs = _pop_value(args, '--jobs')
+        try:
+            jobs = int(jobs) if jobs else None
+        except ValueError:
+            print("Error: --jobs requires an integer")
+            sys.exit(1)
+        if args:
+            print("Usage: init_skill.py --manifest <skills.json|skills.yaml> [--path <default-path>] [--minimal] [--jobs <n>]")
+            sys.exit(1)
+        print(f"Initializing skills from manifest: {manifest}")
+        summary = init_skills_from_manifest(manifest, path, minimal, jobs)
+        if summary is None:
+            sys.exit(1)
+        _print_summary(summary)
+        sys.exit(1 if summary['failed'] else 0)
+
     if len(args) < 3 or args[1] != '--path':
         print("Usage: init_skill.py <skill-name> --path <path> [--minimal]")
+        print("       init_skill.py --manifest <skills.json|skills.yaml> [--path <default-path>] [--minimal] [--jobs <n>]")
         print("\nOptions:")
         print("  --minimal    Create only essential files (no example placeholders)")
+        print("  --manifest   Scaffold every skill listed in a JSON/YAML manifest, in parallel")
         print("\nSkill name requirements:")
         print("  - Hyphen-case identifier (e.g., 'data-analyzer')")
         print("  - Lowercase letters, digits, and hyphens only")
@@ -272,23 +493,17 @@ def main():
         print("\nExamples:")
         print("  init_skill.py my-new-skill --path skills/public")
         print("  init_skill.py my-api-helper --path skills/private --minimal")
+        print("  init_skill.py --manifest catalog.json --path skills/public")
         sys.exit(1)
 
     skill_name = args[0]
     path = args[2]
 
-    # Validate skill name length
-    if len(skill_name) > 40:
-        print(f"Error: Skill name exceeds 40 characters ({len(skill_name)} chars)")
-        print("  Use a shorter name or abbreviate")
-        sys.exit(1)
-
-    # Validate skill name format (hyphen-case)
-    if not re.match(r'^[a-z0-9-]+$', skill_name):
-        print(f"Error: Skill name '{skill_name}' should be hyphen-case (lowercase letters, digits, and hyphens only)")
-        sys.exit(1)
-    if skill_name.startswith('-') or skill_name.endswith('-') or '--' in skill_name:
-        print(f"Error: Skill name '{skill_name}' cannot start/end with hyphen or contain consecutive hyphens")
+    error = validate_skill_name(skill_name)
+    if error:
+        print(f"Error: {error}")
+        if len(skill_name) > 40:
+            print("  Use a shorter name or abbreviate")
         sys.exit(1)
 
     print(f"Initializing skill: {skill_name}")
@@ -3,10 +3,26 @@
 Skill Packager - Creates a distributable zip file of a skill folder
 
 Usage:
-    package_skill.py <path/to/skill-folder> [output-directory] [--comprehensive]
+    package_skill.py <path/to/skill-folder> [output-directory] [--comprehensive] [--jobs <n>] [--incremental] [--gitignore]
+                     [--max-size <KB>] [--max-file-size <KB>] [--max-files <n>] [--no-verify] [--bytecode]
+
+Options:
+    --jobs <n>            Concurrent compression workers. Default: CPU count
+    --incremental         Reuse unchanged compressed entries from the existing <skill>.zip
+                          in the output directory (same bytes as a full rebuild)
+    --gitignore           Also exclude paths matched by .gitignore files (.skillignore is always honored)
+    --max-size <KB>       Fail if the archive is larger than this
+    --max-file-size <KB>  Fail if any single file is larger than this
+    --max-files <n>       Fail if the skill has more files than this
+    --no-verify           Skip post-package verification (CRCs, entry list, in-memory re-validation)
+    --bytecode            Also ship scripts/**/*.pyc (this Python version) next to the sources, so
+                          run_from_zip.py imports precompiled code straight from the archive
 
 Note:
     Packaging always runs comprehensive validation; --comprehensive keeps the CLI compatible and may be removed later.
+    Archives are reproducible: identical inputs produce byte-identical zips.
+    Paths matched by .skillignore (gitignore syntax) are skipped, and ignored
+    directories are never walked; .git/, .venv/ and node_modules/ are always skipped.
 
 Example:
     package_skill.py skills/public/my-skill
@@ -14,22 +30,83 @@ Example:
     package_skill.py skills/public/my-skill ./dist --comprehensive
 """
 
+import os
 import sys
-import zipfile
+import zlib
 from pathlib import Path
 
 # Add parent directory to path for imports when running from different directory
 sys.path.insert(0, str(Path(__file__).parent))
 from quick_validate import validate_skill
+from run_from_zip import compile_pyc
+from skillignore import walk_files
+from verify_package import parse_budget_args, source_index, verify_package
+from zip_writer import ZIP_STORED, write_deterministic_zip
+
+
+def should_include(p: Path) -> bool:
+    # Exclude common non-source artifacts
+    if '__pycache__' in p.parts:
+        return False
+    if p.suffix in {'.pyc', '.pyo'}:
+        return False
+    if p.name in {'.DS_Store'}:
+        return False
+    return True
+
+
+def collect_files(skill_path, use_gitignore=False):
+    """
+    Return the files to package, sorted by path.
+
+    Walks the skill with os.scandir, pruning directories matched by
+    .skillignore (and .gitignore with use_gitignore) before descending.
+    """
+    return [p for p in walk_files(skill_path, use_gitignore) if should_include(p)]
 
 
-def package_skill(skill_path, output_dir=None, comprehensive=False):
+def bytecode_entries(skill_path, files):
+    """Return (arcname, pyc_bytes) for each scripts/**/*.py, skipping files that do not compile."""
+    entries = []
+    for p in files:
+        rel = p.relative_to(skill_path)
+        if p.suffix != '.py' or rel.parts[0] != 'scripts':
+            continue
+        arcname = p.relative_to(skill_path.parent).as_posix()
+        try:
+            entries.append((arcname[:-3] + '.pyc', compile_pyc(p.read_bytes(), arcname)))
+        except (SyntaxError, ValueError) as e:
+            print(f"⚠️  Not precompiling {arcname}: {e}")
+    return entries
+
+
+def package_skill(skill_path, output_dir=None, comprehensive=False, jobs=None, incremental=False, use_gitignore=False,
+                  verify=True, max_size=None, max_file_size=None, max_files=None, bytecode=False):
     """
     Package a skill folder into a zip file.
 
+    Entries are sorted, timestamped 1980-01-01 (or $SOURCE_DATE_EPOCH) and
+    have normalized permissions, so identical inputs give byte-identical zips.
+    File contents are compressed concurrently; already-compressed assets
+    (PNG, JPEG, archives, fonts, ...) are stored rather than deflated.
+    The archive is written to a staging file and verified against the source
+    files (see verify_package.py); only an archive that passes replaces
+    <skill>.zip, so a failed check leaves the previous package untouched.
+
     Args:
         skill_path: Path to the skill folder
         output_dir: Optional output directory for the zip file (defaults to current directory)
+        jobs: Concurrent compression workers (defaults to CPU count)
+        incremental: Copy entries whose content is unchanged (name, size and CRC-32
+            match, confirmed by inflating the old entry) from the existing zip
+            instead of recompressing them
+        use_gitignore: Also honor .gitignore files when selecting files
+        verify: Check CRCs and entries against the source, re-validate the archive
+            in memory and enforce the size budgets after writing
+        max_size: Optional archive size budget in bytes
+        max_file_size: Optional per-file size budget in bytes
+        max_files: Optional file count budget
+        bytecode: Add a hash-based .pyc beside every scripts/**/*.py (zipimport layout)
 
     Returns:
         Path to the created zip file, or None if error
@@ -69,44 +146,95 @@ def package_skill(skill_path, output_dir=None, comprehensive=False):
         output_path = Path.cwd()
 
     zip_filename = output_path / f"{skill_name}.zip"
+    staging = output_path / f".{skill_name}.zip.staging"
 
     # Create the zip file
     try:
-        def should_include(p: Path) -> bool:
-            # Exclude common non-source artifacts
-            if '__pycache__' in p.parts:
-                return False
-            if p.suffix in {'.pyc', '.pyo'}:
-                return False
-            if p.name in {'.DS_Store'}:
-                return False
-            return True
-
-        files = [p for p in skill_path.rglob('*') if p.is_file() and should_include(p)]
-        total = len(files)
-        with zipfile.ZipFile(zip_filename, 'w', zipfile.ZIP_DEFLATED) as zipf:
-            for i, file_path in enumerate(files, start=1):
-                # Calculate the relative path within the zip (includes the skill folder name)
-                arcname = file_path.relative_to(skill_path.parent).as_posix()
-                zipf.write(file_path, arcname)
-                print(f"  Added ({i}/{total}): {arcname}")
+        files = collect_files(skill_path, use_gitignore)
+        # Arcnames include the skill folder name
+        entries = [(p.relative_to(skill_path.parent).as_posix(), p) for p in files]
+        if bytecode:
+            entries += bytecode_entries(skill_path, files)
+
+        def report(i, total, arcname, entry):
+            if entry['method'] == ZIP_STORED:
+                how = f"stored, {entry['store_reason']}" if entry['store_reason'] else "stored"
+            else:
+                how = f"deflated to {entry['compressed_size'] / max(entry['size'], 1):.0%}"
+            print(f"  {'Reused' if entry['reused'] else 'Added'} ({i}/{total}): {arcname} [{how}]")
 
+        written = write_deterministic_zip(staging, entries, jobs=jobs, on_entry=report, incremental=incremental,
+                                          previous_path=zip_filename)
+
+        raw_total = sum(e['size'] for e in written)
+        zip_total = sum(e['compressed_size'] for e in written)
+        stored = sum(1 for e in written if e['method'] == ZIP_STORED)
+        print(f"\n🗜️  {raw_total / 1024:.1f} KB → {zip_total / 1024:.1f} KB "
+              f"({zip_total / max(raw_total, 1):.0%}); {stored}/{len(written)} file(s) stored uncompressed")
+        if incremental:
+            reused = sum(1 for e in written if e['reused'])
+            print(f"\n♻️  Reused {reused}/{len(written)} unchanged entr{'y' if reused == 1 else 'ies'}")
+
+        if verify:
+            # Expected sizes and CRCs come from the source, independently of the writer
+            expected = source_index(skill_path, files)
+            expected.update((arcname, (len(data), zlib.crc32(data))) for arcname, data in entries
+                            if isinstance(data, bytes))
+            errors = verify_package(staging, expected, max_size, max_file_size, max_files)
+            if errors:
+                print(f"\n❌ Verification failed for {zip_filename}:")
+                for error in errors:
+                    print(f"  - {error}")
+                print("   The previous package (if any) was left in place.")
+                return None
+            print(f"\n🔒 Verified {len(written)} entr{'y' if len(written) == 1 else 'ies'} (CRC, source match, in-memory validation)")
+
+        os.replace(staging, zip_filename)
         print(f"\n✅ Successfully packaged skill to: {zip_filename}")
         return zip_filename
 
     except Exception as e:
         print(f"❌ Error creating zip file: {e}")
         return None
+    finally:
+        if staging.exists():
+            staging.unlink()
 
 
 def main():
     args = sys.argv[1:]
+    if args and args[0] in ('-h', '--help'):
+        print(__doc__.strip())
+        sys.exit(0)
     comprehensive = '--comprehensive' in args
     if comprehensive:
         args.remove('--comprehensive')
+    incremental = '--incremental' in args
+    if incremental:
+        args.remove('--incremental')
+    use_gitignore = '--gitignore' in args
+    if use_gitignore:
+        args.remove('--gitignore')
+    verify = '--no-verify' not in args
+    if not verify:
+        args.remove('--no-verify')
+    bytecode = '--bytecode' in args
+    if bytecode:
+        args.remove('--bytecode')
+    budgets = parse_budget_args(args)
+    jobs = None
+    if '--jobs' in args:
+        idx = args.index('--jobs')
+        try:
+            jobs = int(args[idx + 1])
+        except (IndexError, ValueError):
+            print("Error: --jobs requires an integer")
+            sys.exit(1)
+        args = args[:idx] + args[idx + 2:]
 
     if len(args) < 1:
-        print("Usage: package_skill.py <path/to/skill-folder> [output-directory] [--comprehensive]")
+        print("Usage: package_skill.py <path/to/skill-folder> [output-directory] [--comprehensive] [--jobs <n>] [--incremental] [--gitignore]")
+        print("       [--max-size <KB>] [--max-file-size <KB>] [--max-files <n>] [--no-verify] [--bytecode]")
         print("\nExample:")
         print("  package_skill.py skills/public/my-skill")
         print("  package_skill.py skills/public/my-skill ./dist")
@@ -124,7 +252,9 @@ def main():
     if comprehensive:
         print("   Validation: comprehensive")
 
-    result = package_skill(skill_path, output_dir, comprehensive=comprehensive)
+    result = package_skill(skill_path, output_dir, comprehensive=comprehensive, jobs=jobs, incremental=incremental,
+                           use_gitignore=use_gitignore, verify=verify,
+                           bytecode=bytecode, **budgets)
 
     if result:
         sys.exit(0)
@@ -0,0 +1,324 @@
+#!/usr/bin/env python3
+"""
+Package Store - Content-addressed storage for packaged skill versions
+
+Instead of keeping a full zip per release, each file is stored once as a blob
+named by its SHA-256, and a skill version is a small JSON manifest that lists
+its files by hash. Unchanged files across versions (large assets/ and
+references/ in particular) cost nothing to store or upload again. A regular
+zip, byte-identical to package_skill.py output, is materialized on demand.
+
+Usage:
+    package_store.py put <skill-folder> <store-dir> [--chunk-size <KB>] [--jobs <n>] [--force]
+    package_store.py materialize <store-dir> <skill-name> <version> [output-directory]
+    package_store.py list <store-dir>
+    package_store.py gc <store-dir>
+
+Options:
+    --chunk-size <KB>  Split files larger than this into fixed-size chunks stored as
+                       separate blobs, so large files that change only partly (e.g.
+                       appended data) share their unchanged chunks. Default: off
+    --jobs <n>         Concurrent hashing/compression workers. Default: CPU count
+    --force            Replace an existing manifest for the same name and version
+
+Store layout:
+    <store>/objects/<aa>/<sha256>     Blob: 1-byte codec ('Z' zlib, 'R' raw) + data
+    <store>/manifests/<name>/<version>.json
+
+Examples:
+    package_store.py put skills/public/my-skill ./store
+    package_store.py put skills/public/my-skill ./store --chunk-size 1024
+    package_store.py materialize ./store my-skill 1.2.0 ./dist
+"""
+
+import hashlib
+import json
+import os
+import sys
+import threading
+import zlib
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+from bundle_skills import frontmatter_value
+from package_skill import collect_files
+from quick_validate import validate_basic, validate_skill
+from zip_writer import ZIP_DEFLATED, choose_method, normalized_mode, ordered_parallel, write_deterministic_zip
+
+MANIFEST_FORMAT = 1
+
+_CODEC_ZLIB = b'Z'
+_CODEC_RAW = b'R'
+
+
+class PackageStore:
+    """A directory of content-addressed blobs plus per-version manifests."""
+
+    def __init__(self, root):
+        self.root = Path(root)
+        self.objects = self.root / 'objects'
+        self.manifests = self.root / 'manifests'
+
+    def _object_path(self, digest):
+        return self.objects / digest[:2] / digest
+
+    def has(self, digest):
+        return self._object_path(digest).exists()
+
+    def put_blob(self, data, arcname=''):
+        """
+        Store data under its SHA-256 unless already present.
+
+        Returns: (digest, bytes_written) - bytes_written is 0 for a deduplicated blob
+        """
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._object_path(digest)
+        if path.exists():
+            return digest, 0
+        # Same store/deflate heuristic as packaging: skip zlib for media and archives
+        method, _ = choose_method(arcname, data)
+        payload = _CODEC_RAW + data
+        if method == ZIP_DEFLATED:
+            packed = zlib.compress(data, 6)
+            if len(packed) < len(data):
+                payload = _CODEC_ZLIB + packed
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp.write_bytes(payload)
+        os.replace(tmp, path)
+        return digest, len(payload)
+
+    def get_blob(self, digest):
+        """Return a blob's contents, verifying its hash."""
+        payload = self._object_path(digest).read_bytes()
+        data = zlib.decompress(payload[1:]) if payload[:1] == _CODEC_ZLIB else payload[1:]
+        if hashlib.sha256(data).hexdigest() != digest:
+            raise ValueError(f"Corrupt object {digest}")
+        return data
+
+    def manifest_path(self, name, version):
+        return self.manifests / name / f"{version}.json"
+
+    def read_manifest(self, name, version):
+        return json.loads(self.manifest_path(name, version).read_text(encoding='utf-8'))
+
+    def write_manifest(self, manifest):
+        path = self.manifest_path(manifest['name'], manifest['version'])
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix('.tmp')
+        tmp.write_text(json.dumps(manifest, indent=2, sort_keys=True) + "\n", encoding='utf-8')
+        os.replace(tmp, path)
+        return path
+
+    def versions(self):
+        """Yield (name, version, manifest_path) for every stored version, sorted."""
+        for path in sorted(self.manifests.glob('*/*.json')):
+            yield path.parent.name, path.stem, path
+
+    def referenced_objects(self):
+        refs = set()
+        for _, _, path in self.versions():
+            for f in json.loads(path.read_text(encoding='utf-8'))['files']:
+                refs.update(f['chunks'] or [f['sha256']])
+        return refs
+
+
+def _store_file(store, skill_path, path, chunk_size):
+    """Store one file; returns (manifest entry, bytes_written, blobs_total, blobs_new)."""
+    data = path.read_bytes()
+    rel = path.relative_to(skill_path).as_posix()
+    entry = {
+        'path': rel,
+        'size': len(data),
+        'sha256': hashlib.sha256(data).hexdigest(),
+        'mode': normalized_mode(path),
+        'chunks': None,
+    }
+    if chunk_size and len(data) > chunk_size:
+        pieces = [data[i:i + chunk_size] for i in range(0, len(data), chunk_size)]
+        results = [store.put_blob(piece, rel) for piece in pieces]
+        entry['chunks'] = [digest for digest, _ in results]
+    else:
+        results = [store.put_blob(data, rel)]
+    written = sum(n for _, n in results)
+    return entry, written, len(results), sum(1 for _, n in results if n)
+
+
+def put_skill(skill_path, store_dir, chunk_size=None, jobs=None, force=False):
+    """
+    Validate a skill and add its current files to the store as a new version.
+
+    Args:
+        skill_path: Path to the skill folder
+        store_dir: Store root directory (created if missing)
+        chunk_size: Split files larger than this many bytes into chunks (None: whole files)
+        jobs: Concurrent hashing/compression workers (defaults to CPU count)
+        force: Overwrite an existing manifest for the same name and version
+
+    Returns:
+        Path to the version manifest, or None if error
+    """
+    skill_path = Path(skill_path).resolve()
+    if not (skill_path / 'SKILL.md').exists():
+        print(f"❌ Error: SKILL.md not found in {skill_path}")
+        return None
+
+    print("🔍 Validating skill...")
+    valid, message = validate_skill(skill_path, comprehensive=True)
+    if not valid:
+        print(f"❌ Validation failed: {message}")
+        return None
+
+    _, _, details = validate_basic(skill_path)
+    version = frontmatter_value(details.get('frontmatter', ''), 'version')
+    if not version:
+        print("❌ Error: metadata.version is required to store a skill version")
+        return None
+    name = skill_path.name
+
+    store = PackageStore(store_dir)
+    if store.manifest_path(name, version).exists() and not force:
+        print(f"❌ Error: {name} {version} is already stored - bump metadata.version or pass --force")
+        return None
+
+    files = collect_files(skill_path)
+    entries = []
+    written = blobs = new_blobs = 0
+    for entry, n, total, new in ordered_parallel(lambda p: _store_file(store, skill_path, p, chunk_size), files, jobs):
+        entries.append(entry)
+        written += n
+        blobs += total
+        new_blobs += new
+
+    manifest = {
+        'format': MANIFEST_FORMAT,
+        'name': name,
+        'version': version,
+        'chunk_size': chunk_size,
+        'total_size': sum(e['size'] for e in entries),
+        'files': entries,
+    }
+    path = store.write_manifest(manifest)
+    print(f"📥 {name} {version}: {len(entries)} file(s), {manifest['total_size'] / 1024:.1f} KB")
+    print(f"   {new_blobs}/{blobs} blob(s) new ({written / 1024:.1f} KB written), "
+          f"{blobs - new_blobs} deduplicated")
+    print(f"\n✅ Stored manifest: {path}")
+    return path
+
+
+def materialize(store_dir, name, version, output_dir=None, jobs=None):
+    """
+    Rebuild <name>.zip for a stored version (same bytes as package_skill.py).
+
+    Returns:
+        Path to the zip file, or None if error
+    """
+    store = PackageStore(store_dir)
+    try:
+        manifest = store.read_manifest(name, version)
+    except FileNotFoundError:
+        print(f"❌ Error: {name} {version} not found in {store_dir}")
+        return None
+
+    def load(entry):
+        data = b''.join(store.get_blob(d) for d in entry['chunks']) if entry['chunks'] else store.get_blob(entry['sha256'])
+        if entry['chunks'] and hashlib.sha256(data).hexdigest() != entry['sha256']:
+            raise ValueError(f"Reassembled {entry['path']} does not match its hash")
+        return f"{name}/{entry['path']}", (data, entry['mode'])
+
+    output_path = Path(output_dir).resolve() if output_dir else Path.cwd()
+    output_path.mkdir(parents=True, exist_ok=True)
+    zip_path = output_path / f"{name}.zip"
+    try:
+        sources = list(ordered_parallel(load, manifest['files'], jobs))
+        write_deterministic_zip(zip_path, sources, jobs=jobs)
+    except (OSError, ValueError, zlib.error) as e:
+        print(f"❌ Error materializing {name} {version}: {e}")
+        return None
+    print(f"✅ Materialized {name} {version} to: {zip_path}")
+    return zip_path
+
+
+def list_versions(store_dir):
+    store = PackageStore(store_dir)
+    rows = list(store.versions())
+    if not rows:
+        print(f"No skill versions in {store_dir}")
+        return
+    for name, version, path in rows:
+        manifest = json.loads(path.read_text(encoding='utf-8'))
+        print(f"  {name:<30} {version:<12} {len(manifest['files']):>5} file(s)  {manifest['total_size'] / 1024:>10.1f} KB")
+
+
+def gc(store_dir):
+    """Delete objects no manifest references; returns the number removed."""
+    store = PackageStore(store_dir)
+    refs = store.referenced_objects()
+    removed = freed = 0
+    for path in store.objects.glob('*/*'):
+        if path.name not in refs:
+            freed += path.stat().st_size
+            path.unlink()
+            removed += 1
+    print(f"🧹 Removed {removed} unreferenced object(s), freed {freed / 1024:.1f} KB")
+    return removed
+
+
+def _pop_option(args, name):
+    if name not in args:
+        return None
+    idx = args.index(name)
+    if idx + 1 >= len(args):
+        print(f"Error: {name} requires a value")
+        sys.exit(1)
+    value = args[idx + 1]
+    del args[idx:idx + 2]
+    return value
+
+
+def _usage():
+    print("Usage:")
+    print("  package_store.py put <skill-folder> <store-dir> [--chunk-size <KB>] [--jobs <n>] [--force]")
+    print("  package_store.py materialize <store-dir> <skill-name> <version> [output-directory]")
+    print("  package_store.py list <store-dir>")
+    print("  package_store.py gc <store-dir>")
+    sys.exit(1)
+
+
+def main():
+    args = sys.argv[1:]
+    if args and args[0] in ('-h', '--help'):
+        print(__doc__.strip())
+        sys.exit(0)
+    force = '--force' in args
+    if force:
+        args.remove('--force')
+    try:
+        chunk_kb = _pop_option(args, '--chunk-size')
+        chunk_size = int(chunk_kb) * 1024 if chunk_kb else None
+        jobs = _pop_option(args, '--jobs')
+        jobs = int(jobs) if jobs else None
+    except ValueError:
+        print("Error: --chunk-size and --jobs require integers")
+        sys.exit(1)
+
+    if not args:
+        _usage()
+    command, rest = args[0], args[1:]
+    if command == 'put' and len(rest) == 2:
+        ok = put_skill(rest[0], rest[1], chunk_size, jobs, force)
+    elif command == 'materialize' and len(rest) in (3, 4):
+        ok = materialize(rest[0], rest[1], rest[2], rest[3] if len(rest) == 4 else None, jobs)
+    elif command == 'list' and len(rest) == 1:
+        list_versions(rest[0])
+        ok = True
+    elif command == 'gc' and len(rest) == 1:
+        gc(rest[0])
+        ok = True
+    else:
+        _usage()
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,20 +3,43 @@
 Skill Validation Script - Quick and Comprehensive modes
 
 Usage:
-    quick_validate.py <skill_directory> [--comprehensive]
+    quick_validate.py <skill_directory> [--comprehensive] [--context-budget <tokens>]
+                      [--enable <id,...>] [--disable <id,...>] [--rules-dir <dir>] [--timings]
+                      [--cache-tokens]
+    quick_validate.py --list-rules [--rules-dir <dir>]
 
 Options:
     --comprehensive    Run additional quality checks (writing style, structure)
+    --context-budget   Token budget for the mandatory context load (comprehensive
+                       mode warns when exceeded). Default: 8000
+    --cache-tokens     Keep token counts in the on-disk cache (see context_budget.py);
+                       without it validation writes nothing unless $SKILL_MAKER_CACHE is set
+    --enable           Comma-separated rule ids to turn on (opt-in rules)
+    --disable          Comma-separated rule ids to skip
+    --rules-dir        Directory of custom rule modules (*.py exposing RULES);
+                       also read from $SKILL_MAKER_RULES_DIR
+    --timings          Print per-rule time after comprehensive validation
+    --list-rules       List available rules (id, severity, scope, origin)
 
 Examples:
     quick_validate.py skills/public/my-skill
     quick_validate.py skills/public/my-skill --comprehensive
 """
 
+import importlib.util
+import os
+import posixpath
 import sys
 import re
+import time
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parent))
+from context_budget import DEFAULT_BUDGET, check_context_budget
+from skillignore import walk_files
+
 
 def validate_basic(skill_path):
     """
@@ -25,7 +48,6 @@ def validate_basic(skill_path):
     Returns: (valid: bool, message: str, details: dict)
     """
     skill_path = Path(skill_path).resolve()
-    issues = []
     
     # Check SKILL.md exists
     skill_md = skill_path / 'SKILL.md'
@@ -34,7 +56,26 @@ def validate_basic(skill_path):
     
     # Read content
     content = skill_md.read_text(encoding='utf-8', errors='replace')
-    
+
+    def changelog_missing(changelog_rel):
+        # metadata.changelog is relative to the parent of the skill directory
+        changelog_path = skill_path.parent / changelog_rel
+        return None if changelog_path.exists() else str(changelog_path)
+
+    return validate_skill_md(content, changelog_missing)
+
+
+def validate_skill_md(content, changelog_missing):
+    """
+    Structural checks on SKILL.md text, independent of where it is stored.
+
+    Args:
+        content: SKILL.md text
+        changelog_missing: callable(changelog_rel) returning None if the
+            metadata.changelog path exists, else the location it was looked for
+
+    Returns: (valid: bool, message: str, details: dict)
+    """
     # Check YAML frontmatter
     if not content.startswith('---'):
         return False, "No YAML frontmatter found", {}
@@ -83,15 +124,15 @@ def validate_basic(skill_path):
         if '[TODO:' in description or '[TODO]' in description:
             return False, "Description contains TODO placeholder - must be completed", {}
 
-    # Validate metadata.changelog path exists (relative to the parent of the skill directory)
+    # Validate metadata.changelog path exists
     changelog_match = re.search(r'changelog:\s*(.+)', frontmatter)
     if changelog_match:
         changelog_rel = changelog_match.group(1).strip().strip('"').strip("'")
         if '\\' in changelog_rel:
             return False, f"metadata.changelog '{changelog_rel}' should use forward slashes (/)", {}
-        changelog_path = skill_path.parent / changelog_rel
-        if not changelog_path.exists():
-            return False, f"metadata.changelog '{changelog_rel}' not found at: {changelog_path}", {}
+        location = changelog_missing(changelog_rel)
+        if location is not None:
+            return False, f"metadata.changelog '{changelog_rel}' not found at: {location}", {}
 
     return True, "Basic validation passed", {'frontmatter': frontmatter, 'content': content}
 
@@ -119,146 +160,525 @@ def _format_hits(hits):
     return "; ".join(parts)
 
 
-def validate_comprehensive(skill_path, content, frontmatter):
+def _join_limited(items, limit=10, sep="; "):
+    """Join up to limit items, summarizing the remainder as '(+N more)'."""
+    items = list(items)
+    text = sep.join(items[:limit])
+    if len(items) > limit:
+        text += f"{sep}(+{len(items) - limit} more)"
+    return text
+
+
+RESOURCE_DIRS = ('references', 'scripts', 'assets')
+
+# Markdown links/images: [text](target "title") or [text](<target>)
+_MD_LINK_RE = re.compile(r'\[[^\]\n]*\]\([ \t]*<?([^)\s>]+)>?(?:[ \t]+"[^"\n]*")?[ \t]*\)')
+# Bare relative paths into a resource directory, e.g. `scripts/rotate_pdf.py`.
+# No lookbehind: it defeats the regex prefix scan; the preceding character is checked in code.
+_PATH_MENTION_RE = re.compile(r'((?:references|scripts|assets)/[\w.-]+(?:/[\w.-]+)*/?)')
+_PATH_PREFIX_CHARS = frozenset('abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_./\\-')
+# Lines that tell the reader to create a file describe paths that need not exist yet
+_ILLUSTRATIVE_LINE_RE = re.compile(r'\b(create|add|e\.g\.|example)\b', re.IGNORECASE)
+
+
+def build_skill_index(skill_path):
     """
-    Comprehensive validation - checks quality and style.
+    Walk the skill tree once and index it for O(1) path lookups.
+
+    Uses the same walk as packaging (skillignore.walk_files()), so .skillignore
+    rules and the default ignores (.venv/, node_modules/, ...) apply: ignored
+    trees are never entered and their files are neither resolvable nor
+    reported as unreferenced.
+
+    Returns: dict with
+      - 'files': set of relative POSIX file paths (e.g. 'references/api.md')
+      - 'dirs':  set of relative POSIX directory paths holding kept files
+      - 'docs':  sorted list of markdown files to scan for references
+                 (SKILL.md plus references/*.md)
+    """
+    skill_path = Path(skill_path).resolve()
+    return index_from_files(p.relative_to(skill_path).as_posix() for p in walk_files(skill_path))
 
-    Returns: list of (severity, message) tuples where severity is one of:
-      - 'error'   (must fix)
-      - 'warning' (should fix)
-      - 'info'    (nice to improve)
+
+def index_from_files(files):
+    """
+    Build the same index as build_skill_index() from relative file paths
+    alone (e.g. zip entry names); directories are derived from the paths.
+    """
+    files = set(files)
+    dirs = set()
+    for f in files:
+        parts = f.split('/')[:-1]
+        for i in range(1, len(parts) + 1):
+            dirs.add('/'.join(parts[:i]))
+    return {'files': files, 'dirs': dirs, 'docs': _index_docs(files)}
+
+
+def _index_docs(files):
+    docs = ['SKILL.md'] if 'SKILL.md' in files else []
+    docs += sorted(
+        f for f in files
+        if f.startswith('references/') and f.count('/') == 1 and f.endswith('.md')
+    )
+    return docs
+
+
+def _extract_references(skill_path, rel_doc, read_text=None):
+    """Return (rel_doc, [(line_no, target, kind)]) for one markdown file; kind is 'link' or 'mention'."""
+    text = read_text(rel_doc) if read_text else (skill_path / rel_doc).read_text(encoding='utf-8', errors='replace')
+    # Scan the whole text once per pattern; line numbers are only computed for matches
+    line_starts = None
+
+    def line_of(pos):
+        nonlocal line_starts
+        if line_starts is None:
+            line_starts = [0] + [m.end() for m in re.finditer('\n', text)]
+        return bisect_right(line_starts, pos)
+
+    refs = []
+    linked = set()
+    for m in _MD_LINK_RE.finditer(text):
+        target = m.group(1).split('#', 1)[0]
+        if not target or re.match(r'^[A-Za-z][A-Za-z0-9+.-]*:', target) or target.startswith('/'):
+            continue  # anchors, URLs, mailto:, absolute paths
+        line_no = line_of(m.start())
+        refs.append((line_no, target, 'link'))
+        linked.add((line_no, target))
+
+    for m in _PATH_MENTION_RE.finditer(text):
+        if m.start() and text[m.start() - 1] in _PATH_PREFIX_CHARS:
+            continue  # part of a longer path or word, e.g. "myscripts/x" or "../scripts/x"
+        target = m.group(1).rstrip('.')
+        # Skip prose like "scripts/references/assets" that names the directories themselves
+        if all(part in RESOURCE_DIRS for part in target.rstrip('/').split('/')):
+            continue
+        line_no = line_of(m.start())
+        if (line_no, target) in linked:
+            continue
+        start = line_starts[line_no - 1]
+        end = text.find('\n', start)
+        if _ILLUSTRATIVE_LINE_RE.search(text, start, end if end != -1 else len(text)):
+            continue
+        refs.append((line_no, target, 'mention'))
+    return rel_doc, refs
+
+
+def _resolve_reference(index, skill_path, rel_doc, target):
+    """
+    Resolve a reference against the index; returns the matched relative path or None.
+
+    Paths outside the skill ('../') are checked on disk, or accepted when
+    skill_path is None (in-memory index with no tree to look at).
     """
+    candidates = [
+        posixpath.normpath(posixpath.join(posixpath.dirname(rel_doc), target)),
+        posixpath.normpath(target),
+    ]
+    for cand in candidates:
+        if cand in index['files'] or cand in index['dirs']:
+            return cand
+        if cand.startswith('../') and (skill_path is None or (skill_path / cand).exists()):
+            return cand
+    return None
+
+
+def check_references(skill_path, index=None, max_workers=8, read_text=None):
+    """
+    Verify that every path referenced from SKILL.md and references/*.md exists,
+    and that every bundled resource file is referenced somewhere.
+
+    Markdown files are scanned concurrently; resolution is a set lookup against
+    the index built by build_skill_index().
+
+    To check a skill that is not on disk (e.g. inside an archive), pass
+    skill_path=None, an index from index_from_files() and read_text, a
+    callable(rel_doc) returning the document text.
+
+    Returns: list of (severity, message) tuples (same shape as validate_comprehensive)
+    """
+    if skill_path is not None:
+        skill_path = Path(skill_path).resolve()
+    if index is None:
+        index = build_skill_index(skill_path)
+
+    docs = index['docs']
+    if len(docs) > 1 and max_workers > 1:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(docs))) as pool:
+            extracted = list(pool.map(lambda d: _extract_references(skill_path, d, read_text), docs))
+    else:
+        extracted = [_extract_references(skill_path, d, read_text) for d in docs]
+
     issues = []
-    skill_path = Path(skill_path).resolve()
+    dangling_links = []
+    dangling_mentions = []
+    referenced = set()
+    for rel_doc, refs in extracted:
+        for line_no, target, kind in refs:
+            resolved = _resolve_reference(index, skill_path, rel_doc, target)
+            if resolved is None:
+                hit = f"{rel_doc}:L{line_no}: {target}"
+                (dangling_links if kind == 'link' else dangling_mentions).append((rel_doc, hit))
+            else:
+                referenced.add(resolved)
+
+    if dangling_links:
+        issues.append(('error', "Broken markdown link(s) to missing file(s): " + _join_limited(h for _, h in dangling_links)))
+    # Bare path mentions in SKILL.md are instructions the agent will follow; in references they are often illustrative
+    skill_md_mentions = [h for doc, h in dangling_mentions if doc == 'SKILL.md']
+    ref_mentions = [h for doc, h in dangling_mentions if doc != 'SKILL.md']
+    if skill_md_mentions:
+        issues.append(('warning', "SKILL.md mentions missing path(s): " + _join_limited(skill_md_mentions)))
+    if ref_mentions:
+        issues.append(('info', "references/ mention missing path(s): " + _join_limited(ref_mentions)))
+
+    # A reference to a nested directory (e.g. assets/template/) covers every file below it;
+    # a bare top-level 'scripts/' mention does not count as referencing each script.
+    covered_dirs = tuple(d.rstrip('/') + '/' for d in referenced if d in index['dirs'] and '/' in d.rstrip('/'))
+    orphans = sorted(
+        f for f in index['files']
+        if f.split('/', 1)[0] in RESOURCE_DIRS
+        and not posixpath.basename(f).startswith('.')
+        and f not in referenced
+        and not f.startswith(covered_dirs)
+    )
+    if orphans:
+        issues.append(('info', f"{len(orphans)} bundled file(s) not referenced from SKILL.md or references/: " + _join_limited(orphans, sep=", ")))
 
-    # ----------------------------
-    # 1) Description quality (frontmatter)
-    # ----------------------------
-    desc_match = re.search(r'description:\s*(.+)', frontmatter)
+    return issues
+
+
+# ----------------------------
+# Rule registry
+# ----------------------------
+# A rule is a dict: {'id', 'severity', 'scope', 'check', 'default'}.
+#   id        unique kebab-case identifier (used by --enable/--disable/--timings)
+#   severity  'error' | 'warning' | 'info'; applied to plain-string results
+#   scope     what the rule inspects: 'frontmatter', 'body', or 'tree'
+#   check     callable(ctx) -> iterable of messages or (severity, message) tuples
+#   default   False makes the rule opt-in (only runs with --enable <id>)
+# ctx is a dict with 'skill_path', 'content', 'frontmatter', 'body', 'sections'
+# 'context_budget' and 'persist_cache'. Only 'tree' rules may touch skill_path; the others also
+# run on archived skills (see verify_package.py), where skill_path is None.
+#
+# Custom rules are plain modules exposing a RULES list of such dicts, loaded from
+# *.py files in a rules directory (--rules-dir or $SKILL_MAKER_RULES_DIR) or from
+# the 'skill_maker.rules' entry point group (an entry point may name a module
+# with RULES, or a callable returning the list).
+
+SEVERITIES = ('error', 'warning', 'info')
+RULE_SCOPES = ('frontmatter', 'body', 'tree')
+ENTRY_POINT_GROUP = 'skill_maker.rules'
+
+BUILTIN_RULES = []
+
+# rule id -> [calls, total seconds]; accumulated across validate_comprehensive() calls
+RULE_TIMINGS = {}
+
+_plugin_cache = {}
+
+
+def rule(rule_id, severity, scope, default=True):
+    """Decorator registering a built-in rule check."""
+    def decorator(check):
+        BUILTIN_RULES.append({'id': rule_id, 'severity': severity, 'scope': scope, 'check': check, 'default': default})
+        return check
+    return decorator
+
+
+def _validate_rule_spec(spec, origin):
+    if not isinstance(spec, dict) or not callable(spec.get('check')):
+        raise ValueError(f"{origin}: each rule must be a dict with a callable 'check'")
+    if not re.match(r'^[a-z0-9][a-z0-9-]*$', str(spec.get('id', ''))):
+        raise ValueError(f"{origin}: rule id must be kebab-case, got {spec.get('id')!r}")
+    if spec.get('severity') not in SEVERITIES:
+        raise ValueError(f"{origin}: rule '{spec['id']}' severity must be one of {', '.join(SEVERITIES)}")
+    if spec.get('scope') not in RULE_SCOPES:
+        raise ValueError(f"{origin}: rule '{spec['id']}' scope must be one of {', '.join(RULE_SCOPES)}")
+    return {'default': True, **spec, 'origin': origin}
+
+
+def _load_rules_dir(rules_dir):
+    rules = []
+    for path in sorted(Path(rules_dir).glob('*.py')):
+        spec = importlib.util.spec_from_file_location(f"skill_maker_rules_{path.stem}", path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        rules += [_validate_rule_spec(r, str(path)) for r in getattr(module, 'RULES', [])]
+    return rules
+
+
+def _load_entry_point_rules():
+    import importlib.metadata  # deferred: scanning installed distributions is only needed once per process
+    try:
+        eps = importlib.metadata.entry_points(group=ENTRY_POINT_GROUP)
+    except TypeError:  # Python < 3.10
+        eps = importlib.metadata.entry_points().get(ENTRY_POINT_GROUP, [])
+    rules = []
+    for ep in eps:
+        obj = ep.load()
+        specs = obj() if callable(obj) else getattr(obj, 'RULES', [])
+        rules += [_validate_rule_spec(r, f"entry point {ep.name}") for r in specs]
+    return rules
+
+
+def discover_rules(rules_dir=None):
+    """
+    Return built-in rules plus custom rules from rules_dir (or $SKILL_MAKER_RULES_DIR)
+    and the 'skill_maker.rules' entry point group. Discovery runs once per process
+    and directory; duplicate ids raise ValueError.
+    """
+    rules_dir = rules_dir or os.environ.get('SKILL_MAKER_RULES_DIR')
+    key = str(Path(rules_dir).resolve()) if rules_dir else None
+    if key not in _plugin_cache:
+        plugins = _load_entry_point_rules()
+        if rules_dir:
+            plugins += _load_rules_dir(rules_dir)
+        _plugin_cache[key] = plugins
+
+    rules = [dict(r, origin='built-in') for r in BUILTIN_RULES] + _plugin_cache[key]
+    seen = set()
+    for r in rules:
+        if r['id'] in seen:
+            raise ValueError(f"Duplicate rule id '{r['id']}' ({r['origin']})")
+        seen.add(r['id'])
+    return rules
+
+
+def select_rules(enable=(), disable=(), rules_dir=None):
+    """
+    Return the active rules: defaults plus `enable`, minus `disable` (ids).
+
+    Raises ValueError for unknown ids so typos don't silently skip checks.
+    """
+    rules = discover_rules(rules_dir)
+    known = {r['id'] for r in rules}
+    unknown = sorted((set(enable) | set(disable)) - known)
+    if unknown:
+        raise ValueError(f"Unknown rule id(s): {', '.join(unknown)} (known: {', '.join(sorted(known))})")
+    return [r for r in rules if (r['default'] or r['id'] in enable) and r['id'] not in disable]
+
+
+def reset_rule_timings():
+    RULE_TIMINGS.clear()
+
+
+def format_rule_timings():
+    """Render RULE_TIMINGS as text lines, slowest first."""
+    width = max([len(k) for k in RULE_TIMINGS] + [4])
+    lines = [f"  {'Rule'.ljust(width)}  {'Calls':>5}  {'Total ms':>9}  {'Avg ms':>7}"]
+    for rule_id, (calls, seconds) in sorted(RULE_TIMINGS.items(), key=lambda kv: -kv[1][1]):
+        lines.append(f"  {rule_id.ljust(width)}  {calls:>5}  {seconds * 1000:>9.2f}  {seconds * 1000 / calls:>7.2f}")
+    return lines
+
+
+# ----------------------------
+# 1) Description quality (frontmatter)
+# ----------------------------
+@rule('description-quality', 'warning', 'frontmatter')
+def _rule_description_quality(ctx):
+    issues = []
+    desc_match = re.search(r'description:\s*(.+)', ctx['frontmatter'])
     if desc_match:
         description = desc_match.group(1).strip()
 
         if 'MUST' not in description and 'must' not in description:
-            issues.append(('warning', "Description should use 'MUST' keyword for stronger trigger pattern"))
+            issues.append("Description should use 'MUST' keyword for stronger trigger pattern")
 
         if 'when' not in description.lower():
-            issues.append(('warning', "Description should include trigger conditions (e.g., 'when...')"))
+            issues.append("Description should include trigger conditions (e.g., 'when...')")
 
         if len(description) < 50:
-            issues.append(('warning', f"Description may be too brief ({len(description)} chars) - consider adding more detail"))
+            issues.append(f"Description may be too brief ({len(description)} chars) - consider adding more detail")
+    return issues
 
-    
-    # ----------------------------
-    # 1.5) Frontmatter keys hygiene (warning)
-    # ----------------------------
+
+# ----------------------------
+# 1.5) Frontmatter keys hygiene (warning)
+# ----------------------------
+@rule('frontmatter-keys', 'warning', 'frontmatter')
+def _rule_frontmatter_keys(ctx):
     # This is a light, spec-ish check: warn on unexpected top-level keys.
     allowed_keys = {
         'name', 'description', 'metadata', 'requires', 'tags', 'triggers', 'trigger',
         'tools', 'tool', 'author', 'license'
     }
     top_keys = []
-    for line in frontmatter.splitlines():
+    for line in ctx['frontmatter'].splitlines():
         if re.match(r'^[A-Za-z0-9_-]+:\s*', line) and not line.startswith(' '):
             k = line.split(':', 1)[0].strip()
             top_keys.append(k)
     unknown = sorted({k for k in top_keys if k not in allowed_keys})
     if unknown:
-        issues.append(('warning', f"Frontmatter contains unknown key(s): {', '.join(unknown)} (allowed keys: {', '.join(sorted(allowed_keys))})"))
-    # ----------------------------
-    # 2) Structure / required sections (SKILL.md body)
-    # ----------------------------
-    body_match = re.search(r'^---\n.*?\n---\n(.*)', content, re.DOTALL)
-    body = body_match.group(1) if body_match else content
+        return [f"Frontmatter contains unknown key(s): {', '.join(unknown)} (allowed keys: {', '.join(sorted(allowed_keys))})"]
+    return []
 
-    h1 = re.findall(r'(?m)^#\s+.+', body)
-    h2 = re.findall(r'(?m)^##\s+(.+)', body)
 
-    if not h1:
-        issues.append(('error', "Missing H1 title (# ...) in SKILL.md body"))
+# ----------------------------
+# 2) Structure / required sections (SKILL.md body)
+# ----------------------------
+@rule('required-sections', 'error', 'body')
+def _rule_required_sections(ctx):
+    issues = []
+    sections = ctx['sections']
 
-    sections = [s.strip().lower() for s in h2]
+    if not re.search(r'(?m)^#\s+.+', ctx['body']):
+        issues.append("Missing H1 title (# ...) in SKILL.md body")
 
     if not any(s == 'overview' or s.startswith('overview') for s in sections):
-        issues.append(('error', "Missing required section: '## Overview'"))
+        issues.append("Missing required section: '## Overview'")
 
     non_overview = [s for s in sections if not s.startswith('overview')]
     if len(non_overview) < 1:
-        issues.append(('error', "SKILL.md should include at least one section beyond '## Overview'"))
+        issues.append("SKILL.md should include at least one section beyond '## Overview'")
 
     has_pattern = any(
         any(k in s for k in ['workflow', 'tasks', 'guidelines', 'reference', 'capabilit', 'structure', 'how to', 'usage', 'process'])
         for s in sections
     )
     if not has_pattern:
-        issues.append(('error', "Missing a recognizable structure section in headings (add a section like '## Workflow', '## Tasks', '## Guidelines', '## Capabilities', or '## Structure')."))
+        issues.append("Missing a recognizable structure section in headings (add a section like '## Workflow', '## Tasks', '## Guidelines', '## Capabilities', or '## Structure').")
+    return issues
 
-    # ----------------------------
-    # 3) Placeholder / TODO gate (must be removed before packaging)
-    # ----------------------------
+
+# ----------------------------
+# 3) Placeholder / TODO gate (must be removed before packaging)
+# ----------------------------
+@rule('todo-placeholders', 'error', 'body')
+def _rule_todo_placeholders(ctx):
     todo_hits = []
-    todo_hits += _find_line_matches(content, r'\[TODO', flags=re.IGNORECASE)
-    todo_hits += _find_line_matches(content, r'^\s*TODO:\s+', flags=re.IGNORECASE)
+    todo_hits += _find_line_matches(ctx['content'], r'\[TODO', flags=re.IGNORECASE)
+    todo_hits += _find_line_matches(ctx['content'], r'^\s*TODO:\s+', flags=re.IGNORECASE)
 
     if todo_hits:
-        issues.append(('error', "Found TODO placeholder(s) - complete before packaging. " + _format_hits(todo_hits)))
+        return ["Found TODO placeholder(s) - complete before packaging. " + _format_hits(todo_hits)]
+    return []
+
 
-    # ----------------------------
-    # 4) Writing style hints (non-blocking)
-    # ----------------------------
-    body_stripped = re.sub(r'"[^"]*"', '', body, flags=re.MULTILINE)
+# ----------------------------
+# 4) Writing style hints (non-blocking)
+# ----------------------------
+@rule('writing-style', 'info', 'body')
+def _rule_writing_style(ctx):
+    body_stripped = re.sub(r'"[^"]*"', '', ctx['body'], flags=re.MULTILINE)
     body_stripped = re.sub(r'^\s*>.*', '', body_stripped, flags=re.MULTILINE)
     second_person = re.findall(r"\b(you|your|yours|you'll|you'd)\b", body_stripped, re.IGNORECASE)
     if second_person:
-        issues.append(('info', f"Found {len(second_person)} second-person pronoun(s) - consider using imperative form instead"))
+        return [f"Found {len(second_person)} second-person pronoun(s) - consider using imperative form instead"]
+    return []
 
-    # ----------------------------
-    # 5) Cross-platform path hygiene (prefer forward slashes in markdown)
-    # ----------------------------
+
+# ----------------------------
+# 5) Cross-platform path hygiene (prefer forward slashes in markdown)
+# ----------------------------
+@rule('path-separators', 'warning', 'body')
+def _rule_path_separators(ctx):
+    content = ctx['content']
     backslash_hits = []
     backslash_hits += _find_line_matches(content, r'references\\', flags=re.IGNORECASE)
     backslash_hits += _find_line_matches(content, r'scripts\\', flags=re.IGNORECASE)
     backslash_hits += _find_line_matches(content, r'assets\\', flags=re.IGNORECASE)
     if backslash_hits:
-        issues.append(('warning', "Found Windows-style backslashes in paths - prefer forward slashes (/). " + _format_hits(backslash_hits)))
-
-    # ----------------------------
-    # 6) Resource directories referenced
-    # ----------------------------
-    references_dir = skill_path / 'references'
-    if references_dir.exists():
-        ref_files = list(references_dir.glob('*.md'))
-        if ref_files and ('references/' not in content and 'references\\' not in content):
-            issues.append(('info', f"references/ exists with {len(ref_files)} file(s) but SKILL.md doesn't reference it"))
-
-    scripts_dir = skill_path / 'scripts'
-    if scripts_dir.exists():
-        scripts = list(scripts_dir.glob('*.py')) + list(scripts_dir.glob('*.sh'))
-        if scripts and ('scripts/' not in content and 'scripts\\' not in content):
-            issues.append(('info', f"scripts/ exists with {len(scripts)} file(s) but SKILL.md doesn't reference it"))
-
-    # ----------------------------
-    # 7) External dependencies hygiene (non-blocking)
-    # ----------------------------
-    mentions_deps = re.search(r'\b(API key|apikey|token|environment variable|env var|MCP|OAuth)\b', content, re.IGNORECASE)
-    has_deps_section = any('external dependenc' in s or 'dependency' in s for s in sections)
+        return ["Found Windows-style backslashes in paths - prefer forward slashes (/). " + _format_hits(backslash_hits)]
+    return []
+
+
+# ----------------------------
+# 6) Resource references (dangling links / orphaned files)
+# ----------------------------
+@rule('resource-references', 'error', 'tree')
+def _rule_resource_references(ctx):
+    return check_references(ctx['skill_path'])
+
+
+# ----------------------------
+# 7) External dependencies hygiene (non-blocking)
+# ----------------------------
+@rule('external-dependencies', 'warning', 'body')
+def _rule_external_dependencies(ctx):
+    mentions_deps = re.search(r'\b(API key|apikey|token|environment variable|env var|MCP|OAuth)\b', ctx['content'], re.IGNORECASE)
+    has_deps_section = any('external dependenc' in s or 'dependency' in s for s in ctx['sections'])
     if mentions_deps and not has_deps_section:
-        issues.append(('warning', "Skill mentions external configuration but has no 'External Dependencies' section"))
+        return ["Skill mentions external configuration but has no 'External Dependencies' section"]
+    return []
+
+
+@rule('changelog-present', 'info', 'tree')
+def _rule_changelog_present(ctx):
+    if not (ctx['skill_path'] / 'CHANGELOG.md').exists():
+        return ["No CHANGELOG.md found - consider adding one for version tracking"]
+    return []
+
+
+# ----------------------------
+# 8) Context size (mandatory load per invocation)
+# ----------------------------
+@rule('context-budget', 'warning', 'tree')
+def _rule_context_budget(ctx):
+    return check_context_budget(ctx['skill_path'], ctx['context_budget'], persist=ctx.get('persist_cache'))
 
-    changelog = skill_path / 'CHANGELOG.md'
-    if not changelog.exists():
-        issues.append(('info', "No CHANGELOG.md found - consider adding one for version tracking"))
+
+def validate_comprehensive(skill_path, content, frontmatter, context_budget=DEFAULT_BUDGET, rules=None,
+                           persist_cache=None):
+    """
+    Comprehensive validation - checks quality and style.
+
+    Runs each active rule (see select_rules(); default: all default-on rules,
+    including discovered custom rules) and records its time in RULE_TIMINGS.
+    A rule that raises is reported as an error instead of aborting validation.
+
+    context_budget is the token budget for SKILL.md plus references it
+    instructs to load up front (see context_budget.py); persist_cache controls
+    its on-disk token cache (None: only when $SKILL_MAKER_CACHE is set).
+
+    Returns: list of (severity, message) tuples where severity is one of:
+      - 'error'   (must fix)
+      - 'warning' (should fix)
+      - 'info'    (nice to improve)
+    """
+    if rules is None:
+        rules = select_rules()
+
+    body_match = re.search(r'^---\n.*?\n---\n(.*)', content, re.DOTALL)
+    body = body_match.group(1) if body_match else content
+    ctx = {
+        'skill_path': Path(skill_path).resolve() if skill_path is not None else None,
+        'content': content,
+        'frontmatter': frontmatter,
+        'body': body,
+        'sections': [s.strip().lower() for s in re.findall(r'(?m)^##\s+(.+)', body)],
+        'context_budget': context_budget,
+        'persist_cache': persist_cache,
+    }
+
+    issues = []
+    for r in rules:
+        start = time.perf_counter()
+        try:
+            results = list(r['check'](ctx) or [])
+        except Exception as e:
+            results = [('error', f"Rule '{r['id']}' failed: {type(e).__name__}: {e}")]
+        elapsed = time.perf_counter() - start
+        counter = RULE_TIMINGS.setdefault(r['id'], [0, 0.0])
+        counter[0] += 1
+        counter[1] += elapsed
+        for item in results:
+            issues.append(item if isinstance(item, tuple) else (r['severity'], item))
 
     return issues
 
 
 
-def validate_skill(skill_path, comprehensive=False):
+def validate_skill(skill_path, comprehensive=False, context_budget=DEFAULT_BUDGET, rules=None, persist_cache=None):
     """
     Main validation function.
 
     Args:
         skill_path: Path to skill directory
         comprehensive: If True, run additional quality checks
+        context_budget: Token budget for the mandatory context load (comprehensive only)
+        rules: Active rules from select_rules() (comprehensive only; default: all default-on rules)
+        persist_cache: Keep token counts in the on-disk cache (default: only when
+            $SKILL_MAKER_CACHE is set; see context_budget.analyze_context())
 
     Returns: (valid: bool, message: str)
     """
@@ -267,7 +687,8 @@ def validate_skill(skill_path, comprehensive=False):
         return False, message
 
     if comprehensive:
-        issues = validate_comprehensive(skill_path, details.get('content', ''), details.get('frontmatter', ''))
+        issues = validate_comprehensive(skill_path, details.get('content', ''), details.get('frontmatter', ''), context_budget, rules,
+                                        persist_cache)
         if issues:
             errors = [i for i in issues if i[0] == 'error']
             warnings = [i for i in issues if i[0] == 'warning']
@@ -294,37 +715,72 @@ def validate_skill(skill_path, comprehensive=False):
                 return True, f"Validation passed, but {len(warnings)} warning(s) found:\n" + "\n".join(lines)
 
             return True, f"Validation passed with {len(infos)} suggestion(s):\n" + "\n".join(lines)
-    # Optional metadata checks (recommended, not required)
-    # If provided, validate version is semver-ish and changelog path exists.
-    meta_version_match = re.search(r'(?m)^\s*version:\s*([0-9]+\.[0-9]+\.[0-9]+)', frontmatter)
-    if meta_version_match:
-        ver = meta_version_match.group(1).strip()
-        if not re.match(r'^\d+\.\d+\.\d+$', ver):
-            return False, f"Invalid metadata.version '{ver}' (expected semver like 1.2.3)", {}
-    # Validate changelog path if present
-    changelog_match = re.search(r'(?m)^\s*changelog:\s*(.+)', frontmatter)
-    if changelog_match:
-        changelog_path = changelog_match.group(1).strip().strip('"\'')
-        # Allow relative paths inside the skill folder
-        cl = skill_path / Path(changelog_path)
-        if not cl.exists():
-            return False, f"metadata.changelog points to missing file: {changelog_path}", {}
-    
 
     return True, "Skill is valid!"
 
 
+def _pop_value(args, name):
+    """Remove `name <value>` from args and return the value (or None)."""
+    if name not in args:
+        return None
+    idx = args.index(name)
+    if idx + 1 >= len(args):
+        print(f"Error: {name} requires a value")
+        sys.exit(1)
+    value = args[idx + 1]
+    del args[idx:idx + 2]
+    return value
+
+
 def main():
     # Parse arguments
     args = sys.argv[1:]
-    comprehensive = '--comprehensive' in args
-    if comprehensive:
-        args.remove('--comprehensive')
+    if args and args[0] in ('-h', '--help'):
+        print(__doc__.strip())
+        sys.exit(0)
+    flags = {}
+    for flag in ('--comprehensive', '--timings', '--list-rules', '--cache-tokens'):
+        flags[flag] = flag in args
+        if flags[flag]:
+            args.remove(flag)
+    comprehensive = flags['--comprehensive']
+    context_budget = DEFAULT_BUDGET
+    budget_arg = _pop_value(args, '--context-budget')
+    if budget_arg is not None:
+        try:
+            context_budget = int(budget_arg)
+        except ValueError:
+            print("Error: --context-budget requires an integer token count")
+            sys.exit(1)
+    enable = [r for r in (_pop_value(args, '--enable') or '').split(',') if r]
+    disable = [r for r in (_pop_value(args, '--disable') or '').split(',') if r]
+    rules_dir = _pop_value(args, '--rules-dir')
+
+    try:
+        rules = select_rules(enable, disable, rules_dir)
+    except (ValueError, ImportError, OSError, SyntaxError) as e:
+        print(f"Error loading rules: {e}")
+        sys.exit(1)
+
+    if flags['--list-rules']:
+        active = {r['id'] for r in rules}
+        for r in discover_rules(rules_dir):
+            state = 'on' if r['id'] in active else 'off'
+            print(f"{r['id']:<24} {r['severity']:<8} {r['scope']:<12} {state:<4} {r['origin']}")
+        sys.exit(0)
     
     if len(args) != 1:
-        print("Usage: quick_validate.py <skill_directory> [--comprehensive]")
+        print("Usage: quick_validate.py <skill_directory> [--comprehensive] [--context-budget <tokens>]")
+        print("                         [--enable <id,...>] [--disable <id,...>] [--rules-dir <dir>] [--timings]")
+        print("                         [--cache-tokens]")
+        print("       quick_validate.py --list-rules [--rules-dir <dir>]")
         print("\nOptions:")
         print("  --comprehensive    Run additional quality checks (writing style, structure)")
+        print("  --context-budget   Token budget for the mandatory context load (default: 8000)")
+        print("  --enable/--disable Comma-separated rule ids to turn on/off")
+        print("  --rules-dir        Directory of custom rule modules (*.py exposing RULES)")
+        print("  --timings          Print per-rule time")
+        print("  --cache-tokens     Keep token counts in the on-disk cache (~/.cache/skill-maker)")
         print("\nExamples:")
         print("  quick_validate.py skills/public/my-skill")
         print("  quick_validate.py skills/public/my-skill --comprehensive")
@@ -337,8 +793,13 @@ def main():
     else:
         print(f"Running quick validation on: {skill_path}")
     
-    valid, message = validate_skill(skill_path, comprehensive)
+    valid, message = validate_skill(skill_path, comprehensive, context_budget, rules,
+                                    persist_cache=True if flags['--cache-tokens'] else None)
     print(message)
+    if flags['--timings'] and RULE_TIMINGS:
+        print("\nRule timings:")
+        for line in format_rule_timings():
+            print(line)
     sys.exit(0 if valid else 1)
 
 
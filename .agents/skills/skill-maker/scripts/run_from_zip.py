@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+Zip Runner - Runs scripts and reads resources straight from a packaged skill zip
+
+A skill zip needs no extraction: its scripts/ directory is put on sys.path as
+an archive path (zipimport), so scripts and their sibling imports load from the
+zip, using precompiled bytecode when the package has it (package_skill.py
+--bytecode). references/ and other files are read from the archive only when
+asked for. Nothing is written to disk unless --cache-dir or install is used.
+
+Usage:
+    run_from_zip.py run [--cache-dir <dir>] <skill.zip> <script> [script-args...]
+    run_from_zip.py cat <skill.zip> <path>
+    run_from_zip.py list <skill.zip> [prefix]
+    run_from_zip.py install <skill.zip> <directory>
+
+Commands:
+    run       Run scripts/<script>.py from the archive; remaining arguments are passed to it.
+              With --cache-dir, the archive is installed there once (keyed by its SHA-256)
+              and the script runs from the extracted copy.
+    cat       Print one file from the archive, e.g. references/api.md
+    list      List files in the archive (optionally under a prefix such as references/)
+    install   Extract the skill into <directory>/<skill-name> (atomic)
+
+Examples:
+    run_from_zip.py run dist/pdf-editor.zip rotate_pdf in.pdf out.pdf 90
+    run_from_zip.py cat dist/pdf-editor.zip references/pdf-libraries.md
+"""
+
+import hashlib
+import importlib.util
+import marshal
+import os
+import runpy
+import shutil
+import sys
+import tempfile
+import zipfile
+from pathlib import Path
+
+# Hash-based, unchecked .pyc (PEP 552): valid regardless of the fixed zip timestamps
+_PYC_FLAGS = (0b01).to_bytes(4, 'little')
+
+
+def compile_pyc(source, filename):
+    """
+    Compile Python source to .pyc bytes that zipimport loads without checking
+    timestamps. Bytecode is specific to the running Python minor version;
+    other versions fall back to the source.
+
+    Args:
+        source: Source bytes
+        filename: Name recorded in tracebacks (the archive-relative .py path)
+    """
+    code = compile(source, filename, 'exec', dont_inherit=True)
+    return importlib.util.MAGIC_NUMBER + _PYC_FLAGS + importlib.util.source_hash(source) + marshal.dumps(code)
+
+
+class SkillArchive:
+    """
+    Read-only view of a packaged skill. The central directory is read once;
+    file contents are read lazily, one file at a time.
+    """
+
+    def __init__(self, zip_path):
+        self.zip_path = Path(zip_path)
+        self._zf = zipfile.ZipFile(self.zip_path)
+        names = [n for n in self._zf.namelist() if not n.endswith('/')]
+        roots = {n.split('/', 1)[0] for n in names if '/' in n}
+        if len(roots) != 1:
+            self._zf.close()
+            raise ValueError(f"{zip_path} does not contain exactly one skill folder")
+        self.name = roots.pop()
+        prefix = self.name + '/'
+        self.files = sorted(n[len(prefix):] for n in names if n.startswith(prefix))
+
+    def close(self):
+        self._zf.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def list(self, prefix=''):
+        return [f for f in self.files if f.startswith(prefix)]
+
+    def read_bytes(self, rel):
+        return self._zf.read(f"{self.name}/{rel}")
+
+    def read_text(self, rel, encoding='utf-8'):
+        return self.read_bytes(rel).decode(encoding)
+
+    def open(self, rel):
+        """Open a file for streaming reads."""
+        return self._zf.open(f"{self.name}/{rel}")
+
+    def script_module(self, script):
+        """Resolve 'rotate_pdf', 'rotate_pdf.py' or 'scripts/rotate_pdf.py' to a module name."""
+        rel = script if script.startswith('scripts/') else f"scripts/{script}"
+        if not rel.endswith('.py'):
+            rel += '.py'
+        if rel not in self.files:
+            available = ", ".join(f[len('scripts/'):] for f in self.list('scripts/') if f.endswith('.py'))
+            raise FileNotFoundError(f"{rel} not found in {self.zip_path} (available: {available or 'none'})")
+        return rel[len('scripts/'):-len('.py')].replace('/', '.')
+
+    def sha256(self):
+        digest = hashlib.sha256()
+        with open(self.zip_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def install(self, directory):
+        """
+        Extract the skill into directory/<name>, replacing any previous copy
+        atomically. Returns the installed skill path.
+        """
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        target = directory / self.name
+        tmp = Path(tempfile.mkdtemp(prefix=f".{self.name}-", dir=directory))
+        try:
+            for info in self._zf.infolist():
+                if not info.filename.startswith(self.name + '/'):
+                    continue
+                self._zf.extract(info, tmp)
+                mode = (info.external_attr >> 16) & 0o777
+                if mode and not info.is_dir():
+                    os.chmod(tmp / info.filename, mode)
+            if target.exists():
+                old = directory / f".{self.name}-old-{os.getpid()}"
+                os.replace(target, old)
+                os.replace(tmp / self.name, target)
+                shutil.rmtree(old, ignore_errors=True)
+            else:
+                os.replace(tmp / self.name, target)
+        finally:
+            shutil.rmtree(tmp, ignore_errors=True)
+        return target
+
+
+def prepare_script(zip_path, script, cache_dir=None):
+    """
+    Locate a bundled script and the sys.path entry to import it from.
+
+    Args:
+        zip_path: Packaged skill zip
+        script: Script name ('rotate_pdf', 'rotate_pdf.py' or 'scripts/rotate_pdf.py')
+        cache_dir: Optional directory; install the archive there once (keyed by its
+            SHA-256) and use the extracted copy instead of importing from the zip
+
+    Returns: (scripts_path, module_name)
+    """
+    with SkillArchive(zip_path) as archive:
+        module = archive.script_module(script)
+        if not cache_dir:
+            return f"{Path(zip_path).resolve()}/{archive.name}/scripts", module
+        target = Path(cache_dir) / archive.sha256()[:16]
+        if not (target / archive.name).is_dir():
+            archive.install(target)
+        return str(target / archive.name / 'scripts'), module
+
+
+def _run_module(scripts_path, module, args):
+    sys.path.insert(0, scripts_path)
+    sys.argv = [f"{scripts_path}/{module.replace('.', '/')}.py", *args]
+    runpy.run_module(module, run_name='__main__', alter_sys=True)
+
+
+def run_script(zip_path, script, args=(), cache_dir=None):
+    """Run a bundled script as __main__ with sys.argv = [script, *args] (see prepare_script())."""
+    _run_module(*prepare_script(zip_path, script, cache_dir), args)
+
+
+def main():
+    args = sys.argv[1:]
+    if args and args[0] in ('-h', '--help'):
+        print(__doc__.strip())
+        sys.exit(0)
+    cache_dir = None
+    if args[:1] == ['run'] and len(args) > 1 and args[1] == '--cache-dir':
+        if len(args) < 3:
+            print("Error: --cache-dir requires a directory")
+            sys.exit(1)
+        cache_dir = args[2]
+        args = ['run'] + args[3:]
+
+    command = args[0] if args else None
+    try:
+        if command == 'run' and len(args) >= 3:
+            scripts_path, module = prepare_script(args[1], args[2], cache_dir)
+        elif command == 'cat' and len(args) == 3:
+            with SkillArchive(args[1]) as archive:
+                sys.stdout.buffer.write(archive.read_bytes(args[2]))
+        elif command == 'list' and len(args) in (2, 3):
+            with SkillArchive(args[1]) as archive:
+                for rel in archive.list(args[2] if len(args) == 3 else ''):
+                    print(rel)
+        elif command == 'install' and len(args) == 3:
+            with SkillArchive(args[1]) as archive:
+                target = archive.install(args[2])
+            print(f"✅ Installed {archive.name} to: {target}")
+        else:
+            print("Usage:")
+            print("  run_from_zip.py run [--cache-dir <dir>] <skill.zip> <script> [script-args...]")
+            print("  run_from_zip.py cat <skill.zip> <path>")
+            print("  run_from_zip.py list <skill.zip> [prefix]")
+            print("  run_from_zip.py install <skill.zip> <directory>")
+            sys.exit(1)
+    except (OSError, KeyError, ValueError, zipfile.BadZipFile) as e:
+        print(f"❌ Error: {e}")
+        sys.exit(1)
+
+    if command == 'run':
+        # Outside the try: the script's own exceptions and exit codes propagate unchanged
+        _run_module(scripts_path, module, args[3:])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Skill Ignore - .skillignore matching and a pruned file walk for packaging
+
+A .skillignore file uses .gitignore syntax (#comments, !negation, trailing /
+for directories, leading or inner / to anchor, *, ?, [...] and **). Files may
+appear in any directory of the skill and apply below it; deeper files and
+later lines take precedence. Ignored directories are pruned before the walk
+descends into them, so a local .venv or node_modules costs one stat, not one
+per file inside.
+
+Always ignored (re-include with a ! pattern): .git/, .venv/, node_modules/,
+__pycache__/ and the .skillignore files themselves.
+
+Usage:
+    skillignore.py <skill-folder> [--gitignore] [--ignored]
+
+Options:
+    --gitignore   Also honor .gitignore files
+    --ignored     List what is ignored (pruned directories and files) instead of what is kept
+
+Examples:
+    skillignore.py skills/public/my-skill
+    skillignore.py skills/public/my-skill --gitignore --ignored
+"""
+
+import os
+import re
+import sys
+from pathlib import Path
+
+IGNORE_FILE = '.skillignore'
+DEFAULT_PATTERNS = ('.git/', '.venv/', 'node_modules/', '__pycache__/', IGNORE_FILE)
+
+
+def _translate(pattern):
+    """Translate the glob part of a gitignore pattern to a regex (no anchors)."""
+    out = []
+    i, n = 0, len(pattern)
+    while i < n:
+        c = pattern[i]
+        at_segment_start = i == 0 or pattern[i - 1] == '/'
+        if pattern.startswith('**/', i) and at_segment_start:
+            out.append('(?:.*/)?')
+            i += 3
+        elif pattern.startswith('**', i) and at_segment_start and i + 2 == n:
+            out.append('.*')
+            i += 2
+        elif c == '*':
+            out.append('[^/]*')
+            i += 1
+        elif c == '?':
+            out.append('[^/]')
+            i += 1
+        elif c == '[':
+            end = pattern.find(']', i + 2)
+            if end == -1:
+                out.append(re.escape(c))
+                i += 1
+                continue
+            body = pattern[i + 1:end]
+            if body[0] in '!^':
+                body = '^' + body[1:]
+            out.append('[' + body.replace('\\', '\\\\') + ']')
+            i = end + 1
+        elif c == '\\' and i + 1 < n:
+            out.append(re.escape(pattern[i + 1]))
+            i += 2
+        else:
+            out.append(re.escape(c))
+            i += 1
+    return ''.join(out)
+
+
+def compile_pattern(line, base=''):
+    """
+    Compile one ignore-file line.
+
+    Args:
+        line: Pattern line in gitignore syntax
+        base: Directory (posix, relative to the skill root) holding the ignore file
+
+    Returns: (regex, negate, dir_only) or None for blank lines and comments
+    """
+    line = line.rstrip('\n')
+    # Trailing spaces are dropped unless escaped
+    stripped = line.rstrip(' ')
+    if stripped.endswith('\\') and len(stripped) < len(line):
+        stripped += ' '
+    line = stripped
+    if not line or line.startswith('#'):
+        return None
+    negate = line.startswith('!')
+    if negate:
+        line = line[1:]
+    elif line.startswith('\\#') or line.startswith('\\!'):
+        line = line[1:]
+    dir_only = line.endswith('/')
+    line = line.rstrip('/')
+    if not line:
+        return None
+    anchored = '/' in line
+    line = line.lstrip('/')
+    prefix = re.escape(base + '/') if base else ''
+    regex = prefix + ('' if anchored else '(?:.*/)?') + _translate(line)
+    return re.compile(regex + r'\Z', re.DOTALL), negate, dir_only
+
+
+class IgnoreMatcher:
+    """Ordered ignore rules; the last matching rule decides."""
+
+    def __init__(self, patterns=DEFAULT_PATTERNS):
+        self.rules = []
+        for line in patterns:
+            self.add_line(line)
+
+    def add_line(self, line, base=''):
+        rule = compile_pattern(line, base)
+        if rule:
+            self.rules.append(rule)
+
+    def add_file(self, path, base=''):
+        """Append the rules from an ignore file located in directory base."""
+        try:
+            text = Path(path).read_text(encoding='utf-8', errors='replace')
+        except OSError:
+            return
+        for line in text.splitlines():
+            self.add_line(line, base)
+
+    def is_ignored(self, rel, is_dir=False):
+        """True if the posix path rel (relative to the skill root) is ignored."""
+        for regex, negate, dir_only in reversed(self.rules):
+            if dir_only and not is_dir:
+                continue
+            if regex.match(rel):
+                return not negate
+        return False
+
+
+def walk_files(root, use_gitignore=False, on_ignored=None):
+    """
+    Yield the files under root that are not ignored, in sorted order.
+
+    Ignored directories are never entered. Symlinked directories are not
+    followed; symlinked files are yielded.
+
+    Args:
+        root: Skill folder
+        use_gitignore: Also read .gitignore files
+        on_ignored: Optional callback(rel, is_dir) for every pruned directory and ignored file
+    """
+    root = Path(root)
+    names = (IGNORE_FILE, '.gitignore') if use_gitignore else (IGNORE_FILE,)
+    matcher = IgnoreMatcher()
+
+    def walk(directory, rel_dir):
+        # Rules from an ignore file apply to its own subtree only
+        mark = len(matcher.rules)
+        for name in names:
+            candidate = os.path.join(directory, name)
+            if os.path.isfile(candidate):
+                matcher.add_file(candidate, rel_dir)
+        with os.scandir(directory) as it:
+            entries = sorted(it, key=lambda e: e.name)
+        for entry in entries:
+            rel = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+            is_dir = entry.is_dir(follow_symlinks=False)
+            if matcher.is_ignored(rel, is_dir):
+                if on_ignored:
+                    on_ignored(rel, is_dir)
+                continue
+            if is_dir:
+                yield from walk(entry.path, rel)
+            elif entry.is_file():
+                yield Path(entry.path)
+        del matcher.rules[mark:]
+
+    yield from walk(str(root), '')
+
+
+def main():
+    args = sys.argv[1:]
+    if args and args[0] in ('-h', '--help'):
+        print(__doc__.strip())
+        sys.exit(0)
+    use_gitignore = '--gitignore' in args
+    if use_gitignore:
+        args.remove('--gitignore')
+    show_ignored = '--ignored' in args
+    if show_ignored:
+        args.remove('--ignored')
+
+    if len(args) != 1:
+        print("Usage: skillignore.py <skill-folder> [--gitignore] [--ignored]")
+        sys.exit(1)
+
+    root = Path(args[0])
+    if not root.is_dir():
+        print(f"Error: Not a directory: {root}")
+        sys.exit(1)
+
+    ignored = []
+    kept = list(walk_files(root, use_gitignore, lambda rel, is_dir: ignored.append(rel + ('/' if is_dir else ''))))
+    for line in ignored if show_ignored else [p.relative_to(root).as_posix() for p in kept]:
+        print(line)
+    print(f"\n{len(kept)} file(s) kept, {len(ignored)} path(s) ignored", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
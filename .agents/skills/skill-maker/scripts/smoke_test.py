@@ -3,21 +3,41 @@
 Smoke Test Runner - Automated functional smoke gate for a skill folder.
 
 Usage:
-    smoke_test.py <path/to/skill-folder>
+    smoke_test.py <path/to/skill-folder> [--run-scripts] [--timeout <sec>] [--startup-budget <sec>] [--jobs <n>]
+                  [--context-budget <tokens>]
 
 What it does:
   1) Runs comprehensive validation (fails on errors)
-  2) Runs lightweight heuristics (non-blocking warnings)
-
-This does NOT execute external tools. It is a quick gate before manual testing.
+  2) Runs lightweight heuristics (non-blocking warnings) and reports the
+     per-file context size (mandatory vs on-demand loads)
+  3) With --run-scripts: executes every scripts/*.py in isolated subprocesses
+     (syntax check, import check, `--help` run) and fails on crashes, a non-zero
+     `--help` exit, timeouts, or startup time over budget
+
+Options:
+    --run-scripts       Execute bundled Python scripts (off by default)
+    --timeout <sec>     Per-script timeout for each subprocess. Default: 10
+    --startup-budget <sec>
+                        Max allowed wall time for the `--help` run. Default: 1.0
+    --jobs <n>          Scripts tested concurrently. Default: CPU count
+    --context-budget <tokens>
+                        Token budget for the mandatory context load. Default: 8000
+
+Without --run-scripts this does NOT execute external tools. It is a quick gate before manual testing.
 """
 
+import os
+import subprocess
 import sys
 import re
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Allow running from anywhere
 sys.path.insert(0, str(Path(__file__).parent))
+from context_budget import DEFAULT_BUDGET, analyze_context, format_report
 from quick_validate import validate_skill
 
 
@@ -29,16 +49,140 @@ def _count_example_prompts(skill_md_text: str) -> int:
     return max(len(quoted), 0) + max(len(bullets), 0)
 
 
+# Imports a script as a non-__main__ module so its `if __name__ == "__main__"` block does not run
+_IMPORT_CHECK = (
+    "import importlib.util, os, sys\n"
+    "path = sys.argv[1]\n"
+    "sys.argv = [path]\n"
+    "sys.path.insert(0, os.path.dirname(path))\n"
+    "spec = importlib.util.spec_from_file_location('_smoke_target', path)\n"
+    "spec.loader.exec_module(importlib.util.module_from_spec(spec))\n"
+)
+
+
+def _last_line(text: str) -> str:
+    lines = [ln.strip() for ln in text.strip().splitlines() if ln.strip()]
+    return lines[-1] if lines else ""
+
+
+def _run_isolated(cmd, cwd, timeout):
+    """Run cmd in a scratch cwd with bytecode writing disabled; returns (returncode, output, seconds) or None on timeout."""
+    env = dict(os.environ, PYTHONDONTWRITEBYTECODE="1", PYTHONIOENCODING="utf-8")
+    start = time.perf_counter()
+    try:
+        proc = subprocess.run(
+            cmd, cwd=cwd, env=env, stdin=subprocess.DEVNULL,
+            capture_output=True, text=True, encoding="utf-8", errors="replace", timeout=timeout,
+        )
+    except subprocess.TimeoutExpired:
+        return None
+    elapsed = time.perf_counter() - start
+    return proc.returncode, proc.stdout + proc.stderr, elapsed
+
+
+def smoke_test_script(script_path, timeout=10.0, startup_budget=1.0):
+    """
+    Smoke test one Python script: syntax check, import check, then a `--help` run.
+
+    Each run happens in a fresh interpreter inside a temporary working directory.
+
+    Returns: dict with keys 'script', 'ok', 'stage', 'exit_code', 'startup', 'message'
+    """
+    script_path = Path(script_path).resolve()
+    result = {'script': script_path, 'ok': False, 'stage': 'syntax', 'exit_code': None, 'startup': None, 'message': ''}
+
+    try:
+        compile(script_path.read_bytes(), str(script_path), 'exec')
+    except SyntaxError as e:
+        result['message'] = f"SyntaxError: {e.msg} (line {e.lineno})"
+        return result
+
+    with tempfile.TemporaryDirectory(prefix="skill-smoke-") as sandbox:
+        result['stage'] = 'import'
+        run = _run_isolated([sys.executable, "-B", "-c", _IMPORT_CHECK, str(script_path)], sandbox, timeout)
+        if run is None:
+            result['message'] = f"import timed out after {timeout:g}s"
+            return result
+        code, output, _ = run
+        if code != 0:
+            result['exit_code'] = code
+            result['message'] = f"import failed: {_last_line(output) or f'exit code {code}'}"
+            return result
+
+        result['stage'] = 'run'
+        run = _run_isolated([sys.executable, "-B", str(script_path), "--help"], sandbox, timeout)
+        if run is None:
+            result['message'] = f"`--help` run timed out after {timeout:g}s"
+            return result
+        code, output, elapsed = run
+        result['exit_code'] = code
+        result['startup'] = elapsed
+        if "Traceback (most recent call last)" in output or code < 0:
+            result['message'] = f"`--help` run crashed: {_last_line(output) or f'exit code {code}'}"
+            return result
+        if code != 0:
+            result['message'] = f"`--help` run exited with code {code}: {_last_line(output) or 'no output'}"
+            return result
+        if elapsed > startup_budget:
+            result['message'] = f"startup {elapsed:.2f}s exceeds budget {startup_budget:.2f}s"
+            return result
+
+    result['ok'] = True
+    return result
+
+
+def run_script_smoke_tests(skill_path, timeout=10.0, startup_budget=1.0, jobs=None):
+    """
+    Smoke test every scripts/*.py in a skill concurrently.
+
+    Returns: list of result dicts from smoke_test_script(), sorted by script path
+    """
+    scripts = sorted((Path(skill_path) / "scripts").glob("*.py"))
+    if not scripts:
+        return []
+    jobs = max(1, min(jobs or os.cpu_count() or 1, len(scripts)))
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        return list(pool.map(lambda p: smoke_test_script(p, timeout, startup_budget), scripts))
+
+
+def _pop_option(args, name, cast, default):
+    """Remove `name <value>` from args and return the cast value (or default)."""
+    if name not in args:
+        return default
+    idx = args.index(name)
+    if idx + 1 >= len(args):
+        print(f"Error: {name} requires a value")
+        sys.exit(1)
+    try:
+        value = cast(args[idx + 1])
+    except ValueError:
+        print(f"Error: invalid value for {name}: {args[idx + 1]}")
+        sys.exit(1)
+    del args[idx:idx + 2]
+    return value
+
+
 def main():
     args = sys.argv[1:]
+    if args and args[0] in ('-h', '--help'):
+        print(__doc__.strip())
+        sys.exit(0)
+    run_scripts = '--run-scripts' in args
+    if run_scripts:
+        args.remove('--run-scripts')
+    timeout = _pop_option(args, '--timeout', float, 10.0)
+    startup_budget = _pop_option(args, '--startup-budget', float, 1.0)
+    jobs = _pop_option(args, '--jobs', int, None)
+    context_budget = _pop_option(args, '--context-budget', int, DEFAULT_BUDGET)
+
     if len(args) != 1:
-        print("Usage: smoke_test.py <path/to/skill-folder>")
+        print("Usage: smoke_test.py <path/to/skill-folder> [--run-scripts] [--timeout <sec>] [--startup-budget <sec>] [--jobs <n>] [--context-budget <tokens>]")
         sys.exit(1)
 
     skill_path = Path(args[0]).resolve()
     print(f"🧪 Smoke testing: {skill_path}\n")
 
-    valid, message = validate_skill(skill_path, comprehensive=True)
+    valid, message = validate_skill(skill_path, comprehensive=True, context_budget=context_budget)
     if not valid:
         print("❌ FAIL\n")
         print(message)
@@ -58,6 +202,26 @@ def main():
         print("⚠️  Warning: fewer than 2 example-like prompts detected in SKILL.md.")
         print("   Consider adding 2+ concrete example prompts to improve triggering and usability.\n")
 
+    print("📏 Context size")
+    for line in format_report(analyze_context(skill_path), context_budget):
+        print(line)
+    print()
+
+    if run_scripts:
+        results = run_script_smoke_tests(skill_path, timeout, startup_budget, jobs)
+        print(f"🧪 Script smoke tests: {len(results)} script(s), startup budget {startup_budget:.2f}s")
+        for r in results:
+            rel = r['script'].relative_to(skill_path).as_posix()
+            if r['ok']:
+                print(f"  ✅ {rel}  exit={r['exit_code']}  startup={r['startup']:.2f}s")
+            else:
+                print(f"  ❌ {rel}  [{r['stage']}] {r['message']}")
+        failed = [r for r in results if not r['ok']]
+        print()
+        if failed:
+            print(f"❌ FAIL: {len(failed)}/{len(results)} script(s) failed smoke tests")
+            sys.exit(2)
+
     print("✅ Smoke test complete.")
     print("Next: run 2–3 manual end-to-end use cases (see references/testing-template.md).")
 
@@ -0,0 +1,416 @@
+#!/usr/bin/env python3
+"""
+Trigger Index - Precomputed BM25 index for routing prompts to skills
+
+Builds an inverted index from every SKILL.md frontmatter (name, description,
+the "whenever user asks to X, Y, or Z" trigger list and any `triggers:`/`tags:`
+keys), with BM25 weights precomputed per term and skill. A query is then a
+handful of dictionary lookups and additions, so a router can rank thousands of
+skills without reading their descriptions into context. Skill paths are
+stored relative to the root they were found under, so an index can be built
+on one machine and queried on another.
+
+Usage:
+    trigger_index.py build <skills-root> [<skills-root> ...] [-o <index.json.gz>]
+    trigger_index.py query <index.json.gz | skills-root> "<prompt>" [--top <n>] [--json]
+    trigger_index.py bench [--skills <n>] [--queries <n>]
+
+Options:
+    -o <file>        Index file to write. Default: trigger_index.json.gz
+    --top <n>        Number of ranked skills to return. Default: 5
+    --json           Print query results as JSON
+    --skills <n>     Synthetic skills for bench. Default: 5000
+    --queries <n>    Synthetic queries for bench. Default: 2000
+
+Scoring:
+    BM25 (k1=1.2, b=0.75) over one bag of words per skill; trigger phrases count
+    three times and name words twice, so "rotate a pdf" ranks a skill listing
+    "rotate" as a trigger above one that only mentions rotation in passing.
+
+Examples:
+    trigger_index.py build .agents/skills -o dist/trigger_index.json.gz
+    trigger_index.py query dist/trigger_index.json.gz "split this pdf into pages"
+    trigger_index.py bench --skills 10000
+"""
+
+import gzip
+import heapq
+import json
+import math
+import os
+import random
+import re
+import sys
+import time
+import zlib
+from pathlib import Path
+
+INDEX_FORMAT = 1
+DEFAULT_INDEX = 'trigger_index.json.gz'
+K1 = 1.2
+B = 0.75
+TRIGGER_BOOST = 3
+NAME_BOOST = 2
+
+_WORD_RE = re.compile(r'[a-z0-9]+')
+_TRIGGER_RE = re.compile(r'when(?:ever)? (?:the )?user asks? (?:to |for |about )?(.+?)(?:\.\s*$|$)', re.IGNORECASE)
+_TRIGGER_SPLIT_RE = re.compile(r',\s*(?:or\s+|and\s+)?|\s+or\s+|\s+and\s+')
+_LIST_ITEM_RE = re.compile(r'^\s*-\s*(.+)$')
+
+STOPWORDS = frozenset("""
+a about above after again all also an and any are as at be been before being below between both but by can
+could did do does doing down during each few for from further had has have having he her here hers him his
+how i if in into is it its itself just me more most my no nor not of off on once only or other our out over
+own same she should so some such than that the their them then there these they this those through to too
+under until up very was we were what when where which while who whom why will with would you your
+""".split())
+
+
+def stem(word):
+    """Light suffix stripping so 'rotating', 'rotated' and 'rotate' share a term."""
+    if len(word) > 4:
+        if word.endswith('ies'):
+            word = word[:-3] + 'y'
+        elif word.endswith('ing') and len(word) > 5:
+            word = word[:-3]
+        elif word.endswith('ed'):
+            word = word[:-2]
+        elif word.endswith('es') and word[-3] in 'sxz':
+            word = word[:-2]
+        elif word.endswith('s') and not word.endswith('ss'):
+            word = word[:-1]
+    if len(word) > 3 and word.endswith('e'):
+        word = word[:-1]
+    if len(word) > 3 and word[-1] == word[-2] and word[-1] not in 'aeiou':
+        word = word[:-1]
+    return word
+
+
+def tokenize(text):
+    """Lowercase, split on non-alphanumerics, drop stopwords, stem."""
+    return [stem(w) for w in _WORD_RE.findall(text.lower()) if w not in STOPWORDS]
+
+
+def extract_triggers(description, frontmatter=''):
+    """
+    Return trigger phrases: the "whenever user asks to ..." list in the
+    description plus `triggers:`/`trigger:`/`tags:` frontmatter values.
+    """
+    phrases = []
+    match = _TRIGGER_RE.search(description)
+    if match:
+        phrases += [p.strip() for p in _TRIGGER_SPLIT_RE.split(match.group(1)) if p.strip()]
+
+    key = None
+    for line in frontmatter.splitlines():
+        top = re.match(r'^(triggers?|tags):\s*(.*)$', line)
+        if top:
+            key = top.group(1)
+            value = top.group(2).strip()
+            if value.startswith('['):
+                phrases += [v.strip().strip('"\'') for v in value.strip('[]').split(',') if v.strip()]
+            elif value:
+                phrases.append(value.strip('"\''))
+            continue
+        item = _LIST_ITEM_RE.match(line)
+        if key and item and line.startswith((' ', '-')):
+            phrases.append(item.group(1).strip().strip('"\''))
+        elif line and not line.startswith(' '):
+            key = None
+    return phrases
+
+
+def _frontmatter(text):
+    match = re.match(r'^---\n(.*?)\n---', text, re.DOTALL)
+    return match.group(1) if match else ''
+
+
+def _scalar(frontmatter, key):
+    match = re.search(rf'(?m)^{key}:\s*(.+)$', frontmatter)
+    return match.group(1).strip().strip('"\'') if match else ''
+
+
+def read_skill(skill_md, base=None):
+    """
+    Return a document dict (name, path, description, triggers) for one SKILL.md.
+    path is the skill folder relative to base (when given), so an index built
+    from one checkout stays valid on another machine.
+    """
+    skill_md = Path(skill_md)
+    folder = skill_md.parent
+    if base is not None:
+        folder = Path(os.path.relpath(folder.resolve(), Path(base).resolve()))
+    frontmatter = _frontmatter(skill_md.read_text(encoding='utf-8', errors='replace'))
+    description = _scalar(frontmatter, 'description')
+    return {
+        'name': _scalar(frontmatter, 'name') or skill_md.parent.name,
+        'path': folder.as_posix(),
+        'description': description,
+        'triggers': extract_triggers(description, frontmatter),
+    }
+
+
+def find_skill_docs(roots):
+    """Yield SKILL.md paths under each root (a skill folder or a folder of skills), sorted."""
+    for root in roots:
+        root = Path(root)
+        if (root / 'SKILL.md').is_file():
+            yield root / 'SKILL.md'
+        else:
+            yield from sorted(root.glob('*/SKILL.md'))
+
+
+def read_skills(roots):
+    """Read every skill under roots; paths are relative to each root (its parent for a single skill folder)."""
+    docs = []
+    for root in roots:
+        root = Path(root)
+        base = root.parent if (root / 'SKILL.md').is_file() else root
+        docs.extend(read_skill(p, base) for p in find_skill_docs([root]))
+    return docs
+
+
+def build_index(docs):
+    """
+    Build a BM25 index from document dicts (see read_skill()).
+
+    Returns: index dict with 'skills' (name, path, description) and 'terms',
+    mapping each term to a flat [skill_id, weight, skill_id, weight, ...] list
+    """
+    bags = []
+    for doc in docs:
+        tokens = tokenize(doc['description'])
+        for phrase in doc['triggers']:
+            tokens += tokenize(phrase) * TRIGGER_BOOST
+        tokens += tokenize(doc['name'].replace('-', ' ')) * NAME_BOOST
+        bag = {}
+        for t in tokens:
+            bag[t] = bag.get(t, 0) + 1
+        bags.append((bag, len(tokens)))
+
+    n = len(bags)
+    avgdl = sum(length for _, length in bags) / n if n else 0.0
+    df = {}
+    for bag, _ in bags:
+        for t in bag:
+            df[t] = df.get(t, 0) + 1
+
+    terms = {}
+    for doc_id, (bag, length) in enumerate(bags):
+        norm = K1 * (1 - B + B * length / avgdl) if avgdl else K1
+        for t, tf in bag.items():
+            idf = math.log(1 + (n - df[t] + 0.5) / (df[t] + 0.5))
+            terms.setdefault(t, []).extend((doc_id, round(idf * tf * (K1 + 1) / (tf + norm), 4)))
+
+    return {
+        'format': INDEX_FORMAT,
+        'k1': K1,
+        'b': B,
+        'skills': [{'name': d['name'], 'path': d['path'], 'description': d['description']} for d in docs],
+        'terms': terms,
+    }
+
+
+def save_index(index, path):
+    """Write the index as compact, deterministic gzip-compressed JSON."""
+    data = json.dumps(index, separators=(',', ':'), sort_keys=True, ensure_ascii=False).encode('utf-8')
+    Path(path).write_bytes(gzip.compress(data, compresslevel=9, mtime=0))
+
+
+class TriggerIndex:
+    """Loaded index; query() ranks skills for a prompt."""
+
+    def __init__(self, index):
+        self.skills = index['skills']
+        self.postings = {t: list(zip(p[::2], p[1::2])) for t, p in index['terms'].items()}
+
+    @classmethod
+    def load(cls, path):
+        """Load an index file, or build one in memory from a skills directory."""
+        path = Path(path)
+        if path.is_dir():
+            return cls(build_index(read_skills([path])))
+        return cls(json.loads(gzip.decompress(path.read_bytes())))
+
+    def query(self, text, top=5):
+        """
+        Rank skills for a prompt.
+
+        Returns: list of (score, skill dict) with the best match first; skills
+        sharing no term with the prompt are left out
+        """
+        scores = {}
+        for term in set(tokenize(text)):
+            for doc_id, weight in self.postings.get(term, ()):
+                scores[doc_id] = scores.get(doc_id, 0.0) + weight
+        best = heapq.nlargest(top, scores.items(), key=lambda kv: (kv[1], -kv[0]))
+        return [(round(score, 4), self.skills[doc_id]) for doc_id, score in best]
+
+
+# ----------------------------
+# Benchmark
+# ----------------------------
+_VERBS = ("analyze convert merge split rotate compress extract translate summarize deploy build test lint format "
+          "commit review refactor migrate schedule monitor backup restore encrypt sign validate render resize "
+          "transcribe classify label search index sync upload download archive publish").split()
+_OBJECTS = ("pdf image video audio spreadsheet invoice contract email calendar database schema api log metric "
+            "dashboard report slide diagram chart font template repository branch container cluster secret "
+            "certificate ticket changelog package dependency notebook dataset model prompt").split()
+
+
+def _synthetic_docs(count, rng):
+    docs = []
+    for i in range(count):
+        obj = rng.choice(_OBJECTS)
+        verbs = rng.sample(_VERBS, 3)
+        name = f"{obj}-{verbs[0]}-{i}"
+        triggers = [f"{v} {obj}" for v in verbs] + [f"any {obj} related task"]
+        description = (f"This skill guides a complete {obj} workflow from intake, through {verbs[0]}ing, to delivery. "
+                       f"This skill must be loaded (NON NEGOTIABLE) whenever user asks to "
+                       f"{', '.join(triggers[:-1])}, or {triggers[-1]}.")
+        docs.append({'name': name, 'path': name, 'description': description, 'triggers': extract_triggers(description)})
+    return docs
+
+
+def _percentile(ordered, fraction):
+    """Nearest-rank percentile of a sorted, non-empty list."""
+    return ordered[min(len(ordered) - 1, max(0, math.ceil(len(ordered) * fraction) - 1))]
+
+
+def run_benchmark(skills=5000, queries=2000, seed=0):
+    """Build a synthetic index and time build, save/load and queries; returns a results dict."""
+    import tempfile
+
+    rng = random.Random(seed)
+    docs = _synthetic_docs(skills, rng)
+    start = time.perf_counter()
+    index = build_index(docs)
+    build_s = time.perf_counter() - start
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / DEFAULT_INDEX
+        save_index(index, path)
+        size = path.stat().st_size
+        start = time.perf_counter()
+        loaded = TriggerIndex.load(path)
+        load_s = time.perf_counter() - start
+
+    prompts = [f"please {rng.choice(_VERBS)} this {rng.choice(_OBJECTS)} for me" for _ in range(queries)]
+    timings = []
+    hits = 0
+    for prompt in prompts:
+        start = time.perf_counter()
+        results = loaded.query(prompt)
+        timings.append(time.perf_counter() - start)
+        hits += bool(results)
+    timings.sort()
+    return {
+        'skills': skills,
+        'queries': queries,
+        'build_s': round(build_s, 4),
+        'index_bytes': size,
+        'load_s': round(load_s, 4),
+        'query_p50_us': round(_percentile(timings, 0.50) * 1e6, 1),
+        'query_p99_us': round(_percentile(timings, 0.99) * 1e6, 1),
+        'query_max_us': round(timings[-1] * 1e6, 1),
+        'answered': hits,
+    }
+
+
+def _pop_value(args, name, default=None):
+    if name not in args:
+        return default
+    idx = args.index(name)
+    if idx + 1 >= len(args):
+        print(f"Error: {name} requires a value")
+        sys.exit(1)
+    value = args[idx + 1]
+    del args[idx:idx + 2]
+    return value
+
+
+def _usage():
+    print("Usage:")
+    print("  trigger_index.py build <skills-root> [<skills-root> ...] [-o <index.json.gz>]")
+    print("  trigger_index.py query <index.json.gz | skills-root> \"<prompt>\" [--top <n>] [--json]")
+    print("  trigger_index.py bench [--skills <n>] [--queries <n>]")
+    sys.exit(1)
+
+
+def main():
+    args = sys.argv[1:]
+    if args and args[0] in ('-h', '--help'):
+        print(__doc__.strip())
+        sys.exit(0)
+    if not args:
+        _usage()
+    command, args = args[0], args[1:]
+
+    if command == 'build':
+        output = _pop_value(args, '-o', DEFAULT_INDEX)
+        if not args:
+            _usage()
+        start = time.perf_counter()
+        docs = read_skills(args)
+        if not docs:
+            print(f"❌ Error: No SKILL.md found under {', '.join(args)}")
+            sys.exit(1)
+        index = build_index(docs)
+        save_index(index, output)
+        elapsed = time.perf_counter() - start
+        print(f"✅ Indexed {len(docs)} skill(s), {len(index['terms'])} term(s) in {elapsed * 1000:.1f} ms")
+        print(f"   Index: {output} ({Path(output).stat().st_size / 1024:.1f} KB)")
+
+    elif command == 'query':
+        as_json = '--json' in args
+        if as_json:
+            args.remove('--json')
+        try:
+            top = int(_pop_value(args, '--top', '5'))
+        except ValueError:
+            print("Error: --top requires an integer")
+            sys.exit(1)
+        if len(args) != 2:
+            _usage()
+        try:
+            index = TriggerIndex.load(args[0])
+        except (OSError, EOFError, zlib.error, ValueError, KeyError, TypeError) as e:
+            # OSError covers a missing file and gzip.BadGzipFile; ValueError covers bad JSON
+            print(f"❌ Error: Cannot read trigger index {args[0]}: {e}")
+            sys.exit(1)
+        start = time.perf_counter()
+        results = index.query(args[1], top)
+        elapsed = time.perf_counter() - start
+        if as_json:
+            print(json.dumps([{'score': score, **skill} for score, skill in results], indent=2))
+        elif not results:
+            print("No matching skill")
+        else:
+            for score, skill in results:
+                print(f"  {score:>8.3f}  {skill['name']}  ({skill['path']})")
+            print(f"\n⏱️  {elapsed * 1e6:.0f} µs")
+
+    elif command == 'bench':
+        try:
+            skills = int(_pop_value(args, '--skills', '5000'))
+            queries = int(_pop_value(args, '--queries', '2000'))
+        except ValueError:
+            print("Error: --skills and --queries require integers")
+            sys.exit(1)
+        if skills < 1 or queries < 1:
+            print("Error: --skills and --queries must be at least 1")
+            sys.exit(1)
+        if args:
+            _usage()
+        r = run_benchmark(skills, queries)
+        print(f"⏱️  {r['skills']} skills: build {r['build_s'] * 1000:.0f} ms, index {r['index_bytes'] / 1024:.0f} KB, "
+              f"load {r['load_s'] * 1000:.0f} ms")
+        print(f"   {r['queries']} queries: p50 {r['query_p50_us']} µs, p99 {r['query_p99_us']} µs, "
+              f"max {r['query_max_us']} µs ({r['answered']} with results)")
+
+    else:
+        _usage()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Package Verifier - Checks a packaged skill zip for integrity, validity and size
+
+Runs after package_skill.py writes an archive (and standalone on any skill zip):
+  1. Streams every entry, checking its CRC-32 (catches truncated or corrupt archives)
+  2. Compares entry names, sizes and CRCs against the source files (--source)
+  3. Re-validates the archived SKILL.md, non-tree rules and resource references
+     in memory, without extracting anything to disk
+  4. Enforces size budgets: archive size, largest file, number of files
+
+Usage:
+    verify_package.py <skill.zip> [--source <skill-folder>] [--max-size <KB>]
+                      [--max-file-size <KB>] [--max-files <n>]
+
+Options:
+    --source <dir>        Skill folder the archive was built from; entries must match it
+    --max-size <KB>       Budget for the archive size on disk
+    --max-file-size <KB>  Budget for any single file (uncompressed)
+    --max-files <n>       Budget for the number of files
+
+Examples:
+    verify_package.py dist/my-skill.zip
+    verify_package.py dist/my-skill.zip --source skills/public/my-skill --max-size 2048
+"""
+
+import sys
+import zipfile
+import zlib
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+from quick_validate import check_references, index_from_files, select_rules, validate_comprehensive, validate_skill_md
+
+_READ_CHUNK = 1024 * 1024
+
+
+def source_index(skill_path, files):
+    """Return {arcname: (size, crc)} for files (paths inside skill_path), as package_skill names them."""
+    skill_path = Path(skill_path).resolve()
+    index = {}
+    for p in files:
+        crc = 0
+        size = 0
+        with open(p, 'rb') as f:
+            for chunk in iter(lambda: f.read(_READ_CHUNK), b''):
+                crc = zlib.crc32(chunk, crc)
+                size += len(chunk)
+        index[Path(p).relative_to(skill_path.parent).as_posix()] = (size, crc)
+    return index
+
+
+def _check_entries(zf, expected):
+    """Stream every entry through its CRC check and compare with expected."""
+    errors = []
+    for info in zf.infolist():
+        if info.is_dir():
+            continue
+        try:
+            crc = 0
+            with zf.open(info) as f:
+                for chunk in iter(lambda: f.read(_READ_CHUNK), b''):
+                    crc = zlib.crc32(chunk, crc)
+        except (zipfile.BadZipFile, zlib.error, EOFError) as e:
+            errors.append(f"{info.filename}: {e}")
+            continue
+        if expected is not None:
+            want = expected.get(info.filename)
+            if want is None:
+                errors.append(f"{info.filename}: not in the source")
+            elif want != (info.file_size, crc):
+                errors.append(f"{info.filename}: content differs from the source "
+                              f"({info.file_size} bytes, CRC {crc:08x}; source {want[0]} bytes, CRC {want[1]:08x})")
+    if expected is not None:
+        names = set(zf.namelist())
+        errors.extend(f"{name}: missing from the archive" for name in sorted(set(expected) - names))
+    return errors
+
+
+def _check_archived_skill(zf):
+    """Re-validate the skill inside the archive in memory; returns error messages."""
+    names = [n for n in zf.namelist() if not n.endswith('/')]
+    roots = {n.split('/', 1)[0] for n in names}
+    if len(roots) != 1 or not all('/' in n for n in names):
+        return [f"Expected one top-level skill folder, found: {', '.join(sorted(roots)) or 'nothing'}"]
+    root = roots.pop()
+    skill_md = f"{root}/SKILL.md"
+    if skill_md not in names:
+        return [f"{skill_md} missing from the archive"]
+
+    def read_text(rel):
+        return zf.read(f"{root}/{rel}").decode('utf-8', errors='replace')
+
+    content = read_text('SKILL.md')
+    # metadata.changelog is relative to the skill's parent, which is the archive root
+    valid, message, details = validate_skill_md(content, lambda rel: None if rel in names else f"{zf.filename}!{rel}")
+    if not valid:
+        return [f"SKILL.md: {message}"]
+
+    rules = [r for r in select_rules() if r['scope'] != 'tree']
+    issues = validate_comprehensive(None, content, details['frontmatter'], rules=rules)
+    index = index_from_files(n[len(root) + 1:] for n in names)
+    texts = {doc: read_text(doc) for doc in index['docs']}
+    issues += check_references(None, index, max_workers=1, read_text=texts.__getitem__)
+    return [msg for severity, msg in issues if severity == 'error']
+
+
+def verify_package(zip_path, expected=None, max_size=None, max_file_size=None, max_files=None):
+    """
+    Verify a packaged skill archive.
+
+    Args:
+        zip_path: Path to the zip file
+        expected: Optional {arcname: (size, crc)} index of the source files
+            (see source_index(), or the entries returned by write_deterministic_zip)
+        max_size: Optional budget in bytes for the archive file
+        max_file_size: Optional budget in bytes for any single file (uncompressed)
+        max_files: Optional budget for the number of files
+
+    Returns:
+        List of error messages (empty if the archive passed)
+    """
+    zip_path = Path(zip_path)
+    try:
+        zf = zipfile.ZipFile(zip_path)
+    except (OSError, zipfile.BadZipFile) as e:
+        return [f"Cannot read archive: {e}"]
+
+    with zf:
+        errors = _check_entries(zf, expected)
+        if errors:
+            return errors  # Content is wrong; re-validating it would only repeat that
+        errors += _check_archived_skill(zf)
+
+        files = [i for i in zf.infolist() if not i.is_dir()]
+        archive_size = zip_path.stat().st_size
+        if max_size is not None and archive_size > max_size:
+            errors.append(f"Archive is {archive_size / 1024:.1f} KB, over the {max_size / 1024:.0f} KB budget")
+        if max_file_size is not None:
+            for info in sorted(files, key=lambda i: -i.file_size):
+                if info.file_size <= max_file_size:
+                    break
+                errors.append(f"{info.filename} is {info.file_size / 1024:.1f} KB, "
+                              f"over the {max_file_size / 1024:.0f} KB per-file budget")
+        if max_files is not None and len(files) > max_files:
+            errors.append(f"Archive has {len(files)} files, over the budget of {max_files}")
+    return errors
+
+
+def parse_budget_args(args):
+    """
+    Remove --max-size/--max-file-size (KB) and --max-files from args.
+
+    Returns: dict with 'max_size', 'max_file_size' (bytes) and 'max_files', each None if unset
+    """
+    budgets = {}
+    for opt, key, scale in (('--max-size', 'max_size', 1024),
+                            ('--max-file-size', 'max_file_size', 1024),
+                            ('--max-files', 'max_files', 1)):
+        budgets[key] = None
+        if opt in args:
+            idx = args.index(opt)
+            try:
+                budgets[key] = int(args[idx + 1]) * scale
+            except (IndexError, ValueError):
+                print(f"Error: {opt} requires an integer")
+                sys.exit(1)
+            del args[idx:idx + 2]
+    return budgets
+
+
+def main():
+    args = sys.argv[1:]
+    if args and args[0] in ('-h', '--help'):
+        print(__doc__.strip())
+        sys.exit(0)
+    budgets = parse_budget_args(args)
+    source = None
+    if '--source' in args:
+        idx = args.index('--source')
+        if idx + 1 >= len(args):
+            print("Error: --source requires a skill folder")
+            sys.exit(1)
+        source = args[idx + 1]
+        del args[idx:idx + 2]
+
+    if len(args) != 1:
+        print("Usage: verify_package.py <skill.zip> [--source <skill-folder>] [--max-size <KB>] "
+              "[--max-file-size <KB>] [--max-files <n>]")
+        sys.exit(1)
+
+    expected = None
+    if source:
+        from package_skill import collect_files
+        expected = source_index(source, collect_files(Path(source).resolve()))
+
+    errors = verify_package(args[0], expected, **budgets)
+    if errors:
+        print(f"❌ Verification failed for {args[0]}:")
+        for e in errors:
+            print(f"  - {e}")
+        sys.exit(1)
+    print(f"✅ Verified {args[0]}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,438 @@
+#!/usr/bin/env python3
+"""
+Deterministic Zip Writer - Reproducible archives with parallel compression
+
+Used by package_skill.py. File contents are deflated concurrently in a thread
+pool (zlib releases the GIL while compressing), then entries are written in
+sorted arcname order with a fixed timestamp and normalized permissions, so
+identical inputs always produce byte-identical archives.
+
+Already-compressed files (images, archives, fonts, media by extension, or any
+file whose first 64 KB barely compresses in a level-1 trial) are stored
+instead of deflated; --no-auto-store deflates everything.
+
+With --incremental, entries whose name, size and CRC-32 match the existing
+output archive, and whose content is confirmed equal by inflating the old
+entry, are copied over as raw compressed bytes instead of being recompressed;
+the result is identical to a full rebuild.
+
+Usage:
+    zip_writer.py <output.zip> <directory> [--jobs <n>] [--level <0-9>] [--incremental] [--no-auto-store]
+
+Examples:
+    zip_writer.py dist/my-skill.zip skills/public/my-skill
+"""
+
+import os
+import posixpath
+import struct
+import sys
+import threading
+import time
+import zipfile
+import zlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+ZIP_STORED = 0
+ZIP_DEFLATED = 8
+
+# 1980-01-01 00:00:00, the earliest DOS timestamp; overridable via SOURCE_DATE_EPOCH
+_DOS_EPOCH = (1980, 1, 1, 0, 0, 0)
+
+_LOCAL_HEADER = struct.Struct('<IHHHHHIIIHH')
+_CENTRAL_HEADER = struct.Struct('<IHHHHHHIIIHHHHHII')
+_END_RECORD = struct.Struct('<IHHHHIIH')
+_ZIP64_END_RECORD = struct.Struct('<IQHHIIQQQQ')
+_ZIP64_LOCATOR = struct.Struct('<IIQI')
+
+_MAX_32 = 0xFFFFFFFF
+_MAX_16 = 0xFFFF
+
+# Already-compressed formats: deflating them costs CPU for little or no gain
+STORED_EXTENSIONS = frozenset({
+    '.png', '.jpg', '.jpeg', '.gif', '.webp', '.avif', '.heic',
+    '.zip', '.gz', '.tgz', '.bz2', '.xz', '.7z', '.zst', '.jar', '.whl',
+    '.docx', '.xlsx', '.pptx', '.odt', '.epub',
+    '.woff', '.woff2', '.mp3', '.mp4', '.m4a', '.ogg', '.webm', '.mov',
+})
+SAMPLE_SIZE = 64 * 1024
+MIN_SAMPLE_SIZE = 4 * 1024
+STORE_RATIO = 0.95
+
+
+def _dos_datetime():
+    """Return (dos_time, dos_date) for the normalized archive timestamp."""
+    year, month, day, hour, minute, second = _DOS_EPOCH
+    epoch = os.environ.get('SOURCE_DATE_EPOCH', '')
+    if epoch.isdigit():
+        t = time.gmtime(int(epoch))
+        if t.tm_year >= 1980:
+            year, month, day, hour, minute, second = t[:6]
+    return (hour << 11) | (minute << 5) | (second // 2), ((year - 1980) << 9) | (month << 5) | day
+
+
+def normalized_mode(path):
+    """0o755 for files executable by their owner, else 0o644."""
+    return 0o755 if os.stat(path).st_mode & 0o100 else 0o644
+
+
+def _source_mode(src):
+    """Permissions for a write_deterministic_zip() source (path, bytes or (bytes, mode))."""
+    if isinstance(src, bytes):
+        return 0o644
+    if isinstance(src, tuple):
+        return src[1]
+    return normalized_mode(src)
+
+
+def choose_method(arcname, raw, level=6):
+    """
+    Decide whether a file is worth deflating.
+
+    Already-compressed formats (by extension) are stored. Other files of at
+    least MIN_SAMPLE_SIZE bytes get a level-1 trial compression of their first
+    SAMPLE_SIZE bytes; if that saves less than (1 - STORE_RATIO), the file is stored.
+
+    Returns: (method, reason) where reason is None, 'level-0', 'extension' or 'sample'
+    """
+    if level == 0:
+        return ZIP_STORED, 'level-0'
+    if posixpath.splitext(arcname)[1].lower() in STORED_EXTENSIONS:
+        return ZIP_STORED, 'extension'
+    if len(raw) >= MIN_SAMPLE_SIZE:
+        sample = raw[:SAMPLE_SIZE]
+        if len(zlib.compress(sample, 1)) >= len(sample) * STORE_RATIO:
+            return ZIP_STORED, 'sample'
+    return ZIP_DEFLATED, None
+
+
+def compress_file(path, level=6, auto_store=True):
+    """
+    Read and compress one file.
+
+    Returns: dict with 'method', 'crc', 'size', 'data' (raw compressed bytes)
+    and 'store_reason' (why the file was stored, or None)
+    """
+    path = Path(path)
+    return compress_bytes(path.read_bytes(), level, arcname=path.name, auto_store=auto_store)
+
+
+def compress_bytes(raw, level=6, crc=None, arcname='', auto_store=True):
+    """
+    Compress raw file contents; same return shape as compress_file().
+
+    With auto_store, incompressible data (see choose_method()) is stored, and
+    so is anything whose deflated form is not smaller than the original.
+    """
+    if crc is None:
+        crc = zlib.crc32(raw)
+    method, reason = choose_method(arcname, raw, level) if auto_store else (
+        (ZIP_STORED, 'level-0') if level == 0 else (ZIP_DEFLATED, None))
+    if method == ZIP_DEFLATED:
+        compressor = zlib.compressobj(level, zlib.DEFLATED, -15)
+        data = compressor.compress(raw) + compressor.flush()
+        if not (auto_store and len(data) >= len(raw)):
+            return {'method': ZIP_DEFLATED, 'crc': crc, 'size': len(raw), 'data': data, 'store_reason': None}
+        reason = 'no-gain'
+    return {'method': ZIP_STORED, 'crc': crc, 'size': len(raw), 'data': raw, 'store_reason': reason}
+
+
+def ordered_parallel(fn, items, jobs, window=None):
+    """
+    Yield fn(item) for each item in input order, running up to `jobs` calls
+    concurrently and keeping at most `window` results in flight (bounds memory).
+    """
+    jobs = max(1, jobs or os.cpu_count() or 1)
+    window = window or jobs * 2
+    if jobs == 1:
+        for item in items:
+            yield fn(item)
+        return
+    pending = deque()
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        for item in items:
+            pending.append(pool.submit(fn, item))
+            if len(pending) >= window:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def archive_comment(level, auto_store=True):
+    """
+    Comment stamped into every archive. It records the settings that shape
+    compressed bytes, so entries are only reused from archives built the same way.
+    """
+    store = 'auto' if auto_store else 'off'
+    return f"skill-maker zip_writer level={level} store={store} zlib={zlib.ZLIB_VERSION}".encode('ascii')
+
+
+class PreviousArchive:
+    """
+    Read access to a previously written archive for incremental rebuilds.
+
+    Entries can be copied as raw compressed bytes (no decompress/recompress).
+    Reads are serialized with a lock so worker threads can share the handle.
+    """
+
+    def __init__(self, zip_path, comment):
+        self.fp = None
+        self.infos = {}
+        self.lock = threading.Lock()
+        try:
+            with zipfile.ZipFile(zip_path) as zf:
+                if zf.comment != comment:
+                    return
+                self.infos = {i.filename: i for i in zf.infolist()}
+            self.fp = open(zip_path, 'rb')
+        except (OSError, zipfile.BadZipFile):
+            self.infos = {}
+
+    def match(self, arcname, size, crc):
+        """
+        Return the ZipInfo of a candidate entry (same name, size and CRC-32), else None.
+
+        The archive comment already matched, so the same content would be
+        compressed with the same method and produce the same bytes.
+        """
+        info = self.infos.get(arcname)
+        if info and info.file_size == size and info.CRC == crc and info.compress_type in (ZIP_STORED, ZIP_DEFLATED):
+            return info
+        return None
+
+    def reuse(self, arcname, raw, crc):
+        """
+        Return the stored (compressed) bytes of a reusable entry for raw, else None.
+
+        Name, size and CRC-32 only select a candidate; the entry is inflated and
+        compared with raw, since different content can share a size and CRC-32.
+        Inflating is still several times cheaper than deflating again.
+        """
+        info = self.match(arcname, len(raw), crc)
+        if info is None:
+            return None
+        data = self.read_raw(info)
+        try:
+            content = data if info.compress_type == ZIP_STORED else zlib.decompress(data, -15)
+        except zlib.error:
+            return None
+        return (info.compress_type, data) if content == raw else None
+
+    def read_raw(self, info):
+        """Return the stored (still compressed) bytes of an entry."""
+        with self.lock:
+            self.fp.seek(info.header_offset)
+            header = self.fp.read(_LOCAL_HEADER.size)
+            name_len, extra_len = struct.unpack('<HH', header[26:30])
+            self.fp.seek(info.header_offset + _LOCAL_HEADER.size + name_len + extra_len)
+            return self.fp.read(info.compress_size)
+
+    def close(self):
+        if self.fp:
+            self.fp.close()
+
+
+class ZipStreamWriter:
+    """
+    Minimal zip writer for entries whose compressed bytes are already known.
+
+    Writes local headers and data sequentially, then the central directory
+    (with Zip64 records when sizes, offsets, or entry counts require them).
+    """
+
+    def __init__(self, fileobj):
+        self.fp = fileobj
+        self.offset = 0
+        self.entries = []
+        self.dos_time, self.dos_date = _dos_datetime()
+
+    def _write(self, data):
+        self.fp.write(data)
+        self.offset += len(data)
+
+    def add_raw(self, arcname, method, crc, size, data, mode=0o644):
+        """Append one entry; data is already compressed with method (raw deflate for ZIP_DEFLATED)."""
+        name = arcname.encode('utf-8')
+        flags = 0x800 if not arcname.isascii() else 0
+        csize = len(data)
+        zip64 = size >= _MAX_32 or csize >= _MAX_32
+        extra = struct.pack('<HHQQ', 0x0001, 16, size, csize) if zip64 else b''
+        version = 45 if zip64 else 20
+        header_offset = self.offset
+        self._write(_LOCAL_HEADER.pack(
+            0x04034b50, version, flags, method, self.dos_time, self.dos_date, crc,
+            _MAX_32 if zip64 else csize, _MAX_32 if zip64 else size, len(name), len(extra),
+        ))
+        self._write(name)
+        self._write(extra)
+        self._write(data)
+        self.entries.append({
+            'name': name, 'flags': flags, 'method': method, 'crc': crc, 'size': size,
+            'csize': csize, 'offset': header_offset, 'mode': mode,
+        })
+
+    def close(self, comment=b''):
+        """Write the central directory and end records (with an optional archive comment)."""
+        cd_start = self.offset
+        for e in self.entries:
+            fields = []
+            size, csize, offset = e['size'], e['csize'], e['offset']
+            if size >= _MAX_32:
+                fields.append(size)
+                size = _MAX_32
+            if csize >= _MAX_32:
+                fields.append(csize)
+                csize = _MAX_32
+            if offset >= _MAX_32:
+                fields.append(offset)
+                offset = _MAX_32
+            extra = struct.pack(f'<HH{len(fields)}Q', 0x0001, 8 * len(fields), *fields) if fields else b''
+            version = 45 if fields else 20
+            self._write(_CENTRAL_HEADER.pack(
+                0x02014b50, (3 << 8) | version, version, e['flags'], e['method'],
+                self.dos_time, self.dos_date, e['crc'], csize, size,
+                len(e['name']), len(extra), 0, 0, 0, (0o100000 | e['mode']) << 16, offset,
+            ))
+            self._write(e['name'])
+            self._write(extra)
+        cd_size = self.offset - cd_start
+        count = len(self.entries)
+
+        if count >= _MAX_16 or cd_size >= _MAX_32 or cd_start >= _MAX_32:
+            zip64_end = self.offset
+            self._write(_ZIP64_END_RECORD.pack(
+                0x06064b50, _ZIP64_END_RECORD.size - 12, 45, 45, 0, 0, count, count, cd_size, cd_start,
+            ))
+            self._write(_ZIP64_LOCATOR.pack(0x07064b50, 0, zip64_end, 1))
+            self._write(_END_RECORD.pack(
+                0x06054b50, 0, 0, min(count, _MAX_16), min(count, _MAX_16),
+                min(cd_size, _MAX_32), min(cd_start, _MAX_32), len(comment),
+            ))
+        else:
+            self._write(_END_RECORD.pack(0x06054b50, 0, 0, count, count, cd_size, cd_start, len(comment)))
+        self._write(comment)
+
+
+def write_deterministic_zip(zip_path, files, level=6, jobs=None, on_entry=None, incremental=False, auto_store=True,
+                            previous_path=None):
+    """
+    Write a reproducible zip archive.
+
+    Args:
+        zip_path: Output archive path (written to a temp file, then renamed into place)
+        files: Iterable of (arcname, source) where source is a file path, in-memory
+            bytes (written with mode 0644) or a (bytes, mode) tuple; entries are
+            written sorted by arcname
+        level: zlib compression level (0 stores files uncompressed)
+        jobs: Concurrent compression workers (default: CPU count)
+        on_entry: Optional callback(index, total, arcname, entry) after each entry is written
+        incremental: Reuse compressed entries from an existing archive at zip_path when
+            name, size and CRC-32 match and the inflated entry equals the new content
+            (archive must have been built with the same level).
+            The output is byte-identical to a full rebuild.
+        auto_store: Store already-compressed or incompressible files instead of
+            deflating them (see choose_method())
+        previous_path: Archive to reuse entries from with incremental (default: zip_path),
+            for callers that write to a staging path and rename after checking it
+
+    Returns: list of entry dicts ('arcname', 'method', 'crc', 'size', 'compressed_size',
+        'reused', 'store_reason')
+    """
+    zip_path = Path(zip_path)
+    files = sorted(((arc, src if isinstance(src, (bytes, tuple)) else Path(src)) for arc, src in files),
+                   key=lambda f: f[0])
+    total = len(files)
+    comment = archive_comment(level, auto_store)
+    previous_path = Path(previous_path) if previous_path else zip_path
+    previous = PreviousArchive(previous_path, comment) if incremental and previous_path.exists() else None
+
+    def work(item):
+        arcname, src = item
+        raw = src if isinstance(src, bytes) else src[0] if isinstance(src, tuple) else src.read_bytes()
+        crc = zlib.crc32(raw)
+        reused = previous.reuse(arcname, raw, crc) if previous else None
+        if reused is not None:
+            result = {
+                'method': reused[0], 'crc': crc, 'size': len(raw), 'data': reused[1],
+                'reused': True, 'store_reason': None,
+            }
+        else:
+            result = compress_bytes(raw, level, crc, arcname, auto_store)
+            result['reused'] = False
+        return arcname, src, result
+
+    written = []
+    tmp_path = zip_path.with_name(zip_path.name + '.tmp')
+    try:
+        with open(tmp_path, 'wb') as fp:
+            writer = ZipStreamWriter(fp)
+            for i, (arcname, src, result) in enumerate(ordered_parallel(work, files, jobs), start=1):
+                writer.add_raw(arcname, result['method'], result['crc'], result['size'], result['data'],
+                               _source_mode(src))
+                entry = {
+                    'arcname': arcname, 'method': result['method'], 'crc': result['crc'],
+                    'size': result['size'], 'compressed_size': len(result['data']), 'reused': result['reused'],
+                    'store_reason': result['store_reason'],
+                }
+                written.append(entry)
+                if on_entry:
+                    on_entry(i, total, arcname, entry)
+            writer.close(comment)
+        if previous:
+            previous.close()
+            previous = None
+        os.replace(tmp_path, zip_path)
+    finally:
+        if previous:
+            previous.close()
+        if tmp_path.exists():
+            tmp_path.unlink()
+    return written
+
+
+def main():
+    args = sys.argv[1:]
+    if args and args[0] in ('-h', '--help'):
+        print(__doc__.strip())
+        sys.exit(0)
+    incremental = '--incremental' in args
+    if incremental:
+        args.remove('--incremental')
+    auto_store = '--no-auto-store' not in args
+    if not auto_store:
+        args.remove('--no-auto-store')
+    jobs = None
+    level = 6
+    for opt in ('--jobs', '--level'):
+        if opt in args:
+            idx = args.index(opt)
+            try:
+                value = int(args[idx + 1])
+            except (IndexError, ValueError):
+                print(f"Error: {opt} requires an integer")
+                sys.exit(1)
+            args = args[:idx] + args[idx + 2:]
+            if opt == '--jobs':
+                jobs = value
+            else:
+                level = value
+
+    if len(args) != 2:
+        print("Usage: zip_writer.py <output.zip> <directory> [--jobs <n>] [--level <0-9>] [--incremental] [--no-auto-store]")
+        sys.exit(1)
+
+    zip_path, directory = Path(args[0]), Path(args[1]).resolve()
+    if not directory.is_dir():
+        print(f"Error: Not a directory: {directory}")
+        sys.exit(1)
+    files = [(p.relative_to(directory.parent).as_posix(), p) for p in directory.rglob('*') if p.is_file()]
+    entries = write_deterministic_zip(zip_path, files, level=level, jobs=jobs, incremental=incremental, auto_store=auto_store)
+    reused = sum(1 for e in entries if e['reused'])
+    print(f"✅ Wrote {len(entries)} entr{'y' if len(entries) == 1 else 'ies'} to {zip_path}"
+          + (f" ({reused} reused)" if incremental else ""))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+Skiller - One entry point for every bundled skill script
+
+Each .agents/skills/<skill>/scripts/<name>.py becomes a subcommand named
+<name> with dashes (rotate-pdf, quick-validate, package-skill, ...). Only the
+chosen script is imported, so heavy dependencies such as pypdf load only for
+the commands that use them, and a batch file runs many commands in one
+process, paying interpreter and import costs once.
+
+Usage:
+    skiller.py <command> [args...]
+    skiller.py batch <file|-> [--keep-going]
+    skiller.py list
+    skiller.py [--timings] ...
+
+Options:
+    --timings      Print startup, import and run times to stderr
+    --keep-going   In batch mode, continue after a failing command
+
+Batch files hold one command per line (shell-style quoting; blank lines and
+lines starting with # are ignored):
+
+    quick-validate .agents/skills/pdf-editor
+    rotate-pdf in.pdf out.pdf 90 --pages 1-3
+
+Examples:
+    skiller.py list
+    skiller.py rotate-pdf scan.pdf fixed.pdf 90
+    skiller.py --timings batch jobs.txt
+"""
+
+import importlib
+import shlex
+import sys
+import time
+from pathlib import Path
+
+_STARTED = time.perf_counter()
+SKILLS_DIR = Path(__file__).resolve().parent / '.agents' / 'skills'
+
+
+def discover_commands(skills_dir=SKILLS_DIR):
+    """
+    Map command names to script files without importing anything.
+
+    Returns:
+        Dict command -> (skill_name, script_path), sorted by command
+    """
+    commands = {}
+    for script in sorted(Path(skills_dir).glob('*/scripts/*.py')):
+        if script.name.startswith('_'):
+            continue
+        name = script.stem.replace('_', '-')
+        if name in commands:
+            print(f"⚠️  {script} shadowed by {commands[name][1]}", file=sys.stderr)
+            continue
+        commands[name] = (script.parent.parent.name, script)
+    return commands
+
+
+def _summary(script):
+    """First docstring line of a script, read without importing it."""
+    with open(script, encoding='utf-8') as f:
+        for line in f:
+            line = line.strip().strip('"\'')
+            if line and not line.startswith('#!') and not line.startswith('#'):
+                return line
+    return ''
+
+
+def run_command(commands, argv, timings=None):
+    """
+    Import a command's script (once) and run its main() in this process.
+
+    Args:
+        commands: Result of discover_commands()
+        argv: [command, *args]
+        timings: Optional list; (command, import_seconds, run_seconds, exit_code) is appended
+
+    Returns:
+        Exit code of the command (0 on success)
+    """
+    name = argv[0].replace('_', '-').removesuffix('.py')
+    if name not in commands:
+        print(f"❌ Unknown command: {argv[0]} (run 'skiller.py list')", file=sys.stderr)
+        return 2
+    _, script = commands[name]
+
+    code = 0
+    t0 = time.perf_counter()
+    scripts_dir = str(script.parent)
+    if scripts_dir not in sys.path:
+        sys.path.insert(0, scripts_dir)
+    try:
+        module = importlib.import_module(script.stem)
+    except SystemExit as e:  # e.g. a missing optional dependency
+        module, code = None, e.code if isinstance(e.code, int) else 1
+    t1 = time.perf_counter()
+
+    if module is not None:
+        saved_argv = sys.argv
+        sys.argv = [str(script), *argv[1:]]
+        try:
+            module.main()
+        except SystemExit as e:
+            code = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+        except Exception as e:  # One failing command must not take down a batch
+            print(f"❌ {name}: {type(e).__name__}: {e}", file=sys.stderr)
+            code = 1
+        finally:
+            sys.argv = saved_argv
+            sys.stdout.flush()
+    if timings is not None:
+        timings.append((name, t1 - t0, time.perf_counter() - t1, code))
+    return code
+
+
+def read_batch(source):
+    """Parse a batch file ('-' for stdin) into a list of (line_number, argv)."""
+    f = sys.stdin if source == '-' else open(source, encoding='utf-8')
+    try:
+        batch = []
+        for number, line in enumerate(f, 1):
+            line = line.strip()
+            if line and not line.startswith('#'):
+                batch.append((number, shlex.split(line)))
+        return batch
+    finally:
+        if f is not sys.stdin:
+            f.close()
+
+
+def run_batch(commands, batch, keep_going=False, timings=None):
+    """
+    Run batch entries in order in this process.
+
+    Returns:
+        (commands_run, commands_failed)
+    """
+    ran = failed = 0
+    for number, argv in batch:
+        code = run_command(commands, argv, timings)
+        ran += 1
+        if code:
+            failed += 1
+            print(f"❌ Line {number}: '{shlex.join(argv)}' exited with {code}", file=sys.stderr)
+            if not keep_going:
+                break
+    return ran, failed
+
+
+def print_timings(timings, startup):
+    print(f"⏱️  startup {startup * 1000:.1f} ms (interpreter not included)", file=sys.stderr)
+    for name, imported, ran, code in timings:
+        status = '✅' if code == 0 else '❌'
+        print(f"   {status} {name:<16} import {imported * 1000:7.1f} ms  run {ran * 1000:8.1f} ms",
+              file=sys.stderr)
+    if len(timings) > 1:
+        print(f"   total {(time.perf_counter() - _STARTED) * 1000:.1f} ms for {len(timings)} commands",
+              file=sys.stderr)
+
+
+def main():
+    args = sys.argv[1:]
+    show_timings = '--timings' in args[:1]
+    if show_timings:
+        args = args[1:]
+    commands = discover_commands()
+    startup = time.perf_counter() - _STARTED
+
+    if not args or args[0] in ('-h', '--help', 'help'):
+        print(__doc__.strip())
+        sys.exit(0 if args else 1)
+
+    timings = []
+    if args[0] == 'list':
+        for name, (skill, script) in commands.items():
+            print(f"{name:<18} {skill:<12} {_summary(script)}")
+        sys.exit(0)
+    if args[0] == 'batch':
+        keep_going = '--keep-going' in args
+        rest = [a for a in args[1:] if a != '--keep-going']
+        if len(rest) != 1:
+            print("Usage: skiller.py batch <file|-> [--keep-going]")
+            sys.exit(1)
+        try:
+            batch = read_batch(rest[0])
+        except (OSError, ValueError) as e:
+            print(f"❌ Error: {e}")
+            sys.exit(1)
+        ran, failed = run_batch(commands, batch, keep_going, timings)
+        if show_timings:
+            print_timings(timings, startup)
+        print(f"{'❌' if failed else '✅'} Batch: {ran - failed}/{len(batch)} command(s) succeeded",
+              file=sys.stderr)
+        sys.exit(1 if failed else 0)
+
+    code = run_command(commands, args, timings)
+    if show_timings:
+        print_timings(timings, startup)
+    sys.exit(code)
+
+
+if __name__ == "__main__":
+    main()